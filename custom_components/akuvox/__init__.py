@@ -5,18 +5,38 @@ https://github.com/nimroddolev/akuvox
 """
 from __future__ import annotations
 
+import time
+from datetime import datetime, timedelta
+from functools import partial
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .config_flow import AkuvoxOptionsFlowHandler
 from .api import AkuvoxApiClient
+from .backfill import DoorLogBackfill
 from .const import (
     DOMAIN,
-    LOGGER
+    LOGGER,
+    EVENT_STORE_FILENAME,
+    DOOR_PRESS_DEBOUNCE_WINDOW,
+    DOOR_LOG_BACKFILL_DAYS,
+    HOT_CONFIG_KEYS,
+    EXPORT_FORMATS,
+    PROFILE_DEFAULT_DURATION,
+    PROFILE_MAX_DURATION,
+    CASSETTE_DEFAULT_DURATION,
+    CASSETTE_MAX_DURATION,
 )
 from .coordinator import AkuvoxDataUpdateCoordinator
+from .event_store import AkuvoxEventStore, parse_capture_time
+from .export import DoorEventExport
+from .lan import AkuvoxLanClient, parse_lan_devices
+from .profiler import AkuvoxProfiler
+from .watchdog import LoopWatchdog
+from .webhook import AkuvoxWebhookReceiver
 
 PLATFORMS: list[Platform] = [
     Platform.CAMERA,
@@ -38,6 +58,50 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = AkuvoxDataUpdateCoordinator(hass=hass, client=api_client)
     coordinator.config_entry = entry
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.async_on_unload(coordinator.key_scheduler.async_stop)
+
+    # Local door event history
+    try:
+        event_store = AkuvoxEventStore(hass, hass.config.path(EVENT_STORE_FILENAME))
+        await event_store.async_setup()
+        api_client.event_store = event_store
+        await api_client.analytics.async_seed(event_store)
+    except Exception as error:
+        LOGGER.warning("⚠️ Unable to open local door event history: %s", error)
+
+    api_client.backfill = DoorLogBackfill(
+        hass, api_client,
+        horizon_days=int(entry.options.get("door_log_backfill_days", DOOR_LOG_BACKFILL_DAYS)))
+
+    api_client.door_commands.window = float(
+        entry.options.get("door_press_debounce", DOOR_PRESS_DEBOUNCE_WINDOW))
+
+    # Optional direct access to devices on the local network
+    lan_devices = parse_lan_devices(entry.options.get("lan_devices", ""))
+    if lan_devices:
+        api_client.lan = AkuvoxLanClient(
+            session=async_get_clientsession(hass),
+            devices=lan_devices,
+            username=entry.options.get("lan_username", ""),
+            password=entry.options.get("lan_password", ""),
+            metrics=api_client.metrics,
+        )
+        LOGGER.debug("🏠 Local network access configured for %d device(s)", len(lan_devices))
+
+    # Opt-in local Action URL receiver
+    if entry.options.get("local_webhook"):
+        try:
+            webhook = AkuvoxWebhookReceiver(hass, api_client)
+            await webhook.async_setup()
+            api_client.webhook = webhook
+        except Exception as error:
+            LOGGER.warning("⚠️ Unable to set up the local Action URL receiver: %s", error)
+
+    # Opt-in event loop watchdog
+    if entry.options.get("performance_watchdog"):
+        coordinator.watchdog = LoopWatchdog(hass, api_client)
+        coordinator.watchdog.async_start()
+        entry.async_on_unload(coordinator.watchdog.async_stop)
 
     # Step 1: Load config entry values into memory.
     await async_update_configuration(hass=hass, entry=entry, log_values=True)
@@ -109,8 +173,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     LOGGER.debug("🔑 Active token after startup: %s...", api_client._data.token[:10] if api_client._data.token else "None")
 
     await coordinator.async_config_entry_first_refresh()
+    if api_client.webhook is not None:
+        await api_client.webhook.async_ensure_secrets()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    coordinator.applied_config = config_snapshot(entry)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     await async_setup_services(hass)
@@ -120,25 +187,79 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
-    api_client: AkuvoxApiClient = get_api_client(hass=hass)
-    if api_client and hasattr(api_client, 'door_log_poller'):
-        await api_client.async_stop_polling()
+    coordinator: AkuvoxDataUpdateCoordinator | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is not None:
+        await coordinator.client.supervisor.async_shutdown()
     if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: AkuvoxDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        if coordinator.client.event_store is not None:
+            await coordinator.client.event_store.async_close()
+            coordinator.client.event_store = None
     return unloaded
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry when options are updated."""
+    """Apply updated options in memory, or reload the entry for structural changes."""
+    coordinator: AkuvoxDataUpdateCoordinator | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is None or coordinator.applied_config is None:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    new_config = config_snapshot(entry)
+    changed = changed_config_keys(coordinator.applied_config, new_config)
+    coordinator.applied_config = new_config
+    if not changed:
+        return
+    if changed <= set(HOT_CONFIG_KEYS):
+        await async_apply_config_in_memory(entry, coordinator.client, changed)
+        return
+
+    LOGGER.debug("🔁 Reloading after configuration change: %s", ", ".join(sorted(changed)))
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+def config_snapshot(entry: ConfigEntry) -> dict:
+    """Copy of the config entry's data and options."""
+    return {"data": dict(entry.data), "options": dict(entry.options)}
+
+
+def changed_config_keys(old: dict, new: dict) -> set[str]:
+    """Keys whose value differs between two snapshots (unset and empty are equal)."""
+    changed = set()
+    for source in ("data", "options"):
+        before, after = old.get(source, {}), new.get(source, {})
+        changed.update(key for key in before.keys() | after.keys()
+                       if (before.get(key) or None) != (after.get(key) or None))
+    return changed
+
+
+async def async_apply_config_in_memory(entry: ConfigEntry,
+                                       client: AkuvoxApiClient,
+                                       changed: set[str]) -> None:
+    """Apply token and screenshot option changes to the running client."""
+    data = client._data
+    for key in ("token", "refresh_token", "auth_token"):
+        if key not in changed:
+            continue
+        value = data.get_value_for_key(entry, key, "")
+        if value and value != getattr(data, key):
+            setattr(data, key, value)
+            if key != "auth_token":
+                await data.async_set_stored_data_for_key(key, value)
+
+    if "event_screenshot_options" in changed:
+        data.wait_for_image_url = bool(entry.options.get("event_screenshot_options", "") == "wait")
+        await data.async_set_stored_data_for_key("wait_for_image_url", data.wait_for_image_url)
+
+    LOGGER.debug("⚡ Applied configuration change without reloading: %s", ", ".join(sorted(changed)))
+
+
 # Polling
 
 async def async_stop_polling(hass: HomeAssistant):
     """Stop polling the personal door log API."""
     api_client: AkuvoxApiClient = get_api_client(hass=hass) # type: ignore
-    if api_client and hasattr(api_client, 'door_log_poller'):
+    if api_client:
         await api_client.async_stop_polling()
 
 async def async_start_polling(hass: HomeAssistant):
@@ -257,3 +378,185 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
     hass.services.async_register(DOMAIN, "update_tokens", async_update_tokens_service, schema=None)
     hass.services.async_register(DOMAIN, "refresh_tokens", async_refresh_tokens_service, schema=None)
+    hass.services.async_register(DOMAIN, "create_temp_key", partial(async_create_temp_key_service, hass),
+                                 schema=None, supports_response=SupportsResponse.OPTIONAL)
+    hass.services.async_register(DOMAIN, "revoke_temp_key", partial(async_revoke_temp_key_service, hass),
+                                 schema=None, supports_response=SupportsResponse.OPTIONAL)
+    hass.services.async_register(DOMAIN, "query_door_events", partial(async_query_door_events_service, hass),
+                                 schema=None, supports_response=SupportsResponse.ONLY)
+    hass.services.async_register(DOMAIN, "export_door_events", partial(async_export_door_events_service, hass),
+                                 schema=None, supports_response=SupportsResponse.OPTIONAL)
+    hass.services.async_register(DOMAIN, "record_responses", partial(async_record_responses_service, hass),
+                                 schema=None, supports_response=SupportsResponse.OPTIONAL)
+    hass.services.async_register(DOMAIN, "webhook_urls", partial(async_webhook_urls_service, hass),
+                                 schema=None, supports_response=SupportsResponse.ONLY)
+    hass.services.async_register(DOMAIN, "profile", partial(async_profile_service, hass),
+                                 schema=None, supports_response=SupportsResponse.OPTIONAL)
+
+
+def get_client_for_call(hass: HomeAssistant, call: ServiceCall) -> AkuvoxApiClient | None:
+    """Return the API client of the entry targeted by a service call."""
+    entry_id = call.data.get("entry_id")
+    if not entry_id:
+        LOGGER.error("❌ Service call missing required parameter: entry_id")
+        return None
+    if DOMAIN not in hass.data or entry_id not in hass.data[DOMAIN]:
+        LOGGER.error("❌ Entry ID %s not found", entry_id)
+        return None
+    coordinator: AkuvoxDataUpdateCoordinator = hass.data[DOMAIN][entry_id]
+    return coordinator.client
+
+
+async def async_create_temp_key_service(hass: HomeAssistant, call: ServiceCall):
+    """Handle the create_temp_key service call."""
+    client = get_client_for_call(hass, call)
+    keys = call.data.get("keys")
+    if isinstance(keys, dict):
+        keys = [keys]
+    if client is None or not keys:
+        LOGGER.error("❌ Service call missing required parameters: entry_id and keys")
+        return {"results": []}
+    for key in keys:
+        if not isinstance(key, dict) or "begin_time" not in key or "end_time" not in key:
+            LOGGER.error("❌ Each key requires begin_time and end_time: %s", key)
+            return {"results": []}
+
+    results = await client.async_create_temp_keys(keys)
+    LOGGER.info("✅ Created %d of %d temporary keys via service call",
+                sum(1 for result in results if result["success"]),
+                len(results))
+    return {"results": results}
+
+
+async def async_revoke_temp_key_service(hass: HomeAssistant, call: ServiceCall):
+    """Handle the revoke_temp_key service call."""
+    client = get_client_for_call(hass, call)
+    key_ids = call.data.get("key_ids")
+    if not isinstance(key_ids, list):
+        key_ids = [key_ids] if key_ids else []
+    if client is None or not key_ids:
+        LOGGER.error("❌ Service call missing required parameters: entry_id and key_ids")
+        return {"results": []}
+
+    results = await client.async_revoke_temp_keys(key_ids)
+    LOGGER.info("✅ Revoked %d of %d temporary keys via service call",
+                sum(1 for result in results if result["success"]),
+                len(results))
+    return {"results": results}
+
+
+async def async_query_door_events_service(hass: HomeAssistant, call: ServiceCall):
+    """Handle the query_door_events service call."""
+    client = get_client_for_call(hass, call)
+    if client is None or client.event_store is None:
+        return {"events": [], "count": 0}
+
+    start = parse_service_time(call.data.get("start"))
+    end = parse_service_time(call.data.get("end"))
+    if start is None and call.data.get("days"):
+        start = datetime.now() - timedelta(days=float(call.data["days"]))
+
+    query_start = time.perf_counter()
+    events = await client.event_store.async_query(
+        start=start,
+        end=end,
+        mac=call.data.get("mac"),
+        relay=call.data.get("relay"),
+        initiator=call.data.get("initiator"),
+        capture_type=call.data.get("capture_type"),
+        location=call.data.get("location"),
+        limit=int(call.data.get("limit", 100)),
+    )
+    query_ms = round((time.perf_counter() - query_start) * 1000, 2)
+    LOGGER.debug("🗄️ Door event query returned %d events in %sms", len(events), query_ms)
+    return {"events": events, "count": len(events), "query_ms": query_ms}
+
+
+async def async_profile_service(hass: HomeAssistant, call: ServiceCall):
+    """Handle the profile service call."""
+    try:
+        duration = float(call.data.get("duration", PROFILE_DEFAULT_DURATION))
+    except (TypeError, ValueError):
+        LOGGER.error("❌ Invalid profile duration: %s", call.data.get("duration"))
+        return {"files": {}}
+    duration = min(max(duration, 1), PROFILE_MAX_DURATION)
+
+    try:
+        return await AkuvoxProfiler(hass, duration).async_run()
+    except RuntimeError as error:
+        LOGGER.warning("⚠️ Unable to start profile: %s", error)
+        return {"files": {}}
+
+
+async def async_webhook_urls_service(hass: HomeAssistant, call: ServiceCall):
+    """Handle the webhook_urls service call."""
+    client = get_client_for_call(hass, call)
+    if client is None or client.webhook is None:
+        LOGGER.error("❌ The local Action URL receiver is not enabled in the integration options")
+        return {"urls": {}}
+    await client.webhook.async_ensure_secrets()
+    return {"urls": client.webhook.urls()}
+
+
+async def async_export_door_events_service(hass: HomeAssistant, call: ServiceCall):
+    """Handle the export_door_events service call."""
+    client = get_client_for_call(hass, call)
+    if client is None or client.event_store is None:
+        return {"file": None, "rows": 0}
+    file_format = str(call.data.get("format", "csv")).lower()
+    if file_format not in EXPORT_FORMATS:
+        LOGGER.error("❌ Unsupported export format: %s", file_format)
+        return {"file": None, "rows": 0}
+
+    start = parse_service_time(call.data.get("start"))
+    end = parse_service_time(call.data.get("end"))
+    if start is None and call.data.get("days"):
+        start = datetime.now() - timedelta(days=float(call.data["days"]))
+
+    export = DoorEventExport(hass, client.event_store, file_format, {
+        "start": start,
+        "end": end,
+        "mac": call.data.get("mac"),
+        "relay": call.data.get("relay"),
+        "location": call.data.get("location"),
+    })
+    return await export.async_run(call.data.get("filename"))
+
+
+async def async_record_responses_service(hass: HomeAssistant, call: ServiceCall):
+    """Handle the record_responses service call."""
+    client = get_client_for_call(hass, call)
+    if client is None:
+        return {"recording": False}
+    if call.data.get("stop"):
+        result = await client.async_stop_recording()
+        if result is None:
+            LOGGER.warning("⚠️ No response recording is running")
+            return {"recording": False}
+        return {"recording": False, **result}
+
+    try:
+        duration = float(call.data.get("duration", CASSETTE_DEFAULT_DURATION))
+    except (TypeError, ValueError):
+        LOGGER.error("❌ Invalid recording duration: %s", call.data.get("duration"))
+        return {"recording": False}
+    duration = min(max(duration, 1), CASSETTE_MAX_DURATION)
+    if not client.async_start_recording(duration):
+        LOGGER.warning("⚠️ A response recording is already running")
+    return {"recording": True}
+
+
+def parse_service_time(value) -> datetime | None:
+    """Parse a service call time value (datetime, ISO string or door log format)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value
+    parsed = parse_capture_time(value)
+    if parsed is not None:
+        return parsed
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        LOGGER.warning("⚠️ Ignoring invalid time value: %s", value)
+        return None
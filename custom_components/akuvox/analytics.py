@@ -0,0 +1,178 @@
+"""Incremental door event analytics for akuvox."""
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import (
+    LOGGER,
+    SIGNAL_DOOR_ANALYTICS_UPDATED,
+    DOOR_ANALYTICS_SEED_LIMIT,
+)
+from .event_store import parse_capture_time
+from .models import DoorLog, mac_key
+
+DIMENSION_DOOR = "door"
+DIMENSION_RELAY = "relay"
+DIMENSION_CAPTURE_TYPE = "capture_type"
+DIMENSION_INITIATOR = "initiator"
+
+# Window name -> (bucket length in seconds, number of buckets)
+WINDOWS = {
+    "last_hour": (60, 60),
+    "last_day": (3600, 24),
+    "last_week": (3600, 168),
+}
+
+
+class RollingWindow:
+    """Event count over a sliding time window, kept in fixed time buckets.
+
+    Adding an event and reading the count are O(1) amortised: buckets that
+    slide out of the window are cleared as time advances.
+    """
+
+    __slots__ = ("bucket_seconds", "buckets", "total", "_head")
+
+    def __init__(self, bucket_seconds: int, bucket_count: int) -> None:
+        """Initialize an empty window."""
+        self.bucket_seconds = bucket_seconds
+        self.buckets = [0] * bucket_count
+        self.total = 0
+        self._head = 0  # Absolute index of the newest bucket
+
+    def add(self, timestamp: float) -> None:
+        """Count an event at a time (older events still inside the window count too)."""
+        index = int(timestamp // self.bucket_seconds)
+        self._advance(index)
+        if index <= self._head - len(self.buckets):
+            return
+        self.buckets[index % len(self.buckets)] += 1
+        self.total += 1
+
+    def count(self, now: float) -> int:
+        """Events inside the window ending now."""
+        self._advance(int(now // self.bucket_seconds))
+        return self.total
+
+    def _advance(self, index: int) -> None:
+        if index <= self._head:
+            return
+        size = len(self.buckets)
+        if index - self._head >= size:
+            self.buckets = [0] * size
+            self.total = 0
+        else:
+            for expired in range(self._head + 1, index + 1):
+                self.total -= self.buckets[expired % size]
+                self.buckets[expired % size] = 0
+        self._head = index
+
+
+class RollingCounts:
+    """Hourly, daily and weekly rolling counts of one door, type or initiator."""
+
+    __slots__ = ("windows", "last_seen")
+
+    def __init__(self) -> None:
+        """Initialize empty counts."""
+        self.windows = {name: RollingWindow(*shape) for name, shape in WINDOWS.items()}
+        self.last_seen = 0.0
+
+    def add(self, timestamp: float) -> None:
+        """Count an event."""
+        for window in self.windows.values():
+            window.add(timestamp)
+        self.last_seen = max(self.last_seen, timestamp)
+
+    def as_dict(self, now: float) -> dict:
+        """Return the counts of every window."""
+        return {name: window.count(now) for name, window in self.windows.items()}
+
+    def next_change(self, now: float) -> float | None:
+        """Time the next counted event leaves a window, at a bucket boundary (None if all are empty)."""
+        boundaries = [(int(now // window.bucket_seconds) + 1) * window.bucket_seconds
+                      for window in self.windows.values() if window.count(now)]
+        return min(boundaries, default=None)
+
+
+class DoorAnalytics:
+    """Rolling door event counters per device, relay, capture type and initiator.
+
+    Fed from the door event ingestion path, and seeded from the local door
+    event history at startup. Listeners are notified through
+    SIGNAL_DOOR_ANALYTICS_UPDATED.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the analytics."""
+        self.hass = hass
+        self.counters: dict[str, dict[str, RollingCounts]] = {
+            DIMENSION_DOOR: {},
+            DIMENSION_RELAY: {},
+            DIMENSION_CAPTURE_TYPE: {},
+            DIMENSION_INITIATOR: {},
+        }
+
+    async def async_seed(self, event_store) -> None:
+        """Count the last week of stored door events."""
+        now = time.time()
+        events = await event_store.async_query(start=datetime.now() - timedelta(days=7),
+                                               limit=DOOR_ANALYTICS_SEED_LIMIT)
+        for door_log in reversed(events):
+            self._add(door_log, now)
+        LOGGER.debug("📊 Door analytics seeded with %d stored events", len(events))
+
+    @callback
+    def async_record(self, door_log: dict) -> None:
+        """Count a newly ingested door event and notify listeners."""
+        self._add(door_log, time.time())
+        async_dispatcher_send(self.hass, SIGNAL_DOOR_ANALYTICS_UPDATED)
+
+    def counts(self, dimension: str, value: str) -> dict:
+        """Return the rolling counts of one value of a dimension (all zero if never seen)."""
+        counter = self.counters[dimension].get(value)
+        if counter is None:
+            return dict.fromkeys(WINDOWS, 0)
+        return counter.as_dict(time.time())
+
+    def breakdown(self, dimension: str, limit: int | None = None) -> dict[str, dict]:
+        """Return the rolling counts of the values of a dimension seen in the last week, busiest first."""
+        now = time.time()
+        rows = [(value, counter.as_dict(now)) for value, counter in self.counters[dimension].items()]
+        rows = [row for row in rows if row[1]["last_week"]]
+        rows.sort(key=lambda row: row[1]["last_week"], reverse=True)
+        return dict(rows[:limit] if limit else rows)
+
+    def next_change(self, dimension: str, value: str | None = None) -> float | None:
+        """Time the counts of one value, or of any value, of a dimension next decay."""
+        now = time.time()
+        counters = self.counters[dimension]
+        if value is not None:
+            counter = counters.get(value)
+            return counter.next_change(now) if counter is not None else None
+        return min((change for counter in counters.values()
+                    if (change := counter.next_change(now)) is not None), default=None)
+
+    def _add(self, door_log: dict, now: float) -> None:
+        record = DoorLog.from_api(door_log)
+        capture_time = parse_capture_time(record.capture_time)
+        timestamp = min(capture_time.timestamp(), now) if capture_time else now
+        mac = mac_key(record.mac)
+        keys = (
+            (DIMENSION_DOOR, mac),
+            (DIMENSION_RELAY, f"{mac}_{record.relay}" if record.relay else ""),
+            (DIMENSION_CAPTURE_TYPE, record.capture_type),
+            (DIMENSION_INITIATOR, record.initiator),
+        )
+        for dimension, value in keys:
+            if not value:
+                continue
+            counter = self.counters[dimension].get(value)
+            if counter is None:
+                counter = self.counters[dimension][value] = RollingCounts()
+            counter.add(timestamp)
+
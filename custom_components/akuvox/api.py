@@ -5,16 +5,28 @@ import asyncio
 import socket
 import json
 import time
+from datetime import datetime
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 import aiohttp
 import httpx
 import async_timeout
 import requests
 
+from .analytics import DoorAnalytics
+from .backfill import DoorLogBackfill
+from .cassette import CassetteRecorder
+from .confirmation import DoorOpenConfirmations
 from .data import AkuvoxData
-from .door_poll import DoorLogPoller
+from .door_commands import DoorCommandCoordinator
+from .event_store import AkuvoxEventStore
+from .lan import AkuvoxLanClient
+from .metrics import AkuvoxMetrics, ENDPOINT_OPENDOOR, ENDPOINT_DOOR_LOG, endpoint_for_url
+from .scheduler import RequestScheduler, CLASS_INTERACTIVE, CLASS_BACKGROUND, request_class_for_endpoint
+from .supervisor import TaskSupervisor
+from .webhook import AkuvoxWebhookReceiver
 
 from .const import (
     LOGGER,
@@ -34,7 +46,15 @@ from .const import (
     TOKEN_REFRESH_INTERVAL_DAYS,
     API_APP_HOST,
     API_GET_PERSONAL_TEMP_KEY_LIST,
-    API_GET_PERSONAL_DOOR_LOG
+    API_ADD_PERSONAL_TEMP_KEY,
+    API_DELETE_PERSONAL_TEMP_KEY,
+    API_GET_PERSONAL_DOOR_LOG,
+    TEMP_KEY_DATE_FORMAT,
+    TEMP_KEY_REQUEST_CONCURRENCY,
+    SIGNAL_TEMP_KEYS_ADDED,
+    SIGNAL_TEMP_KEYS_REMOVED,
+    WEBHOOK_RECONCILE_INTERVAL,
+    LAN_RELAY_HEDGE_DELAY,
 )
 
 
@@ -54,7 +74,11 @@ class AkuvoxApiClient:
 
     _data: AkuvoxData = None # type: ignore
     hass: HomeAssistant
-    door_log_poller: DoorLogPoller
+    event_store: AkuvoxEventStore | None = None
+    webhook: AkuvoxWebhookReceiver | None = None
+    lan: AkuvoxLanClient | None = None
+    backfill: DoorLogBackfill | None = None
+    recorder: CassetteRecorder | None = None
 
     def __init__(
         self,
@@ -68,6 +92,14 @@ class AkuvoxApiClient:
         self._last_successful_app_type = None
         self._failed_attempts = 0
         self._last_switch_time = 0
+        self.metrics = AkuvoxMetrics()
+        self.supervisor = TaskSupervisor(hass)
+        self.scheduler = RequestScheduler(self.metrics)
+        self.door_presses: dict[str, dict] = {}
+        self.door_commands = DoorCommandCoordinator()
+        self.confirmations = DoorOpenConfirmations(hass)
+        self.analytics = DoorAnalytics(hass)
+        self.entities: dict = {}  # entity_id -> AkuvoxEntity, for the attribute size report
         if entry:
             LOGGER.debug("▶️ Initializing AkuvoxData from API client init")
             self._data = AkuvoxData(
@@ -106,25 +138,58 @@ class AkuvoxApiClient:
                 LOGGER.error("❌ Unable to find API host address.")
                 return False
 
-        # Begin polling personal door log
+        # Fill in what was missed while stopped, then begin polling personal door log.
+        # The backfill's stop point is recorded before the poll stores newer events.
+        await self.async_start_backfill()
         await self.async_start_polling()
 
         # Start periodic token refresh scheduler
-        self.hass.loop.create_task(self.async_schedule_token_refresh())
-        LOGGER.debug("🔄 Token refresh scheduler initialized.")
+        self.supervisor.async_start("token_refresh", self.async_schedule_token_refresh)
 
         return True
 
     async def async_start_polling(self):
         """Start polling the personal door log API."""
-        self.door_log_poller: DoorLogPoller = DoorLogPoller(
-            hass=self.hass,
-            poll_function=self.async_retrieve_personal_door_log)
-        await self.door_log_poller.async_start()
+        self.supervisor.async_start("door_log_poll", self.async_retrieve_personal_door_log)
+
+    async def async_start_backfill(self):
+        """Backfill the local door event history up to the newest stored event.
+
+        A running backfill picks the request up instead of a second one starting.
+        """
+        if self.backfill is not None:
+            await self.backfill.async_request()
+            self.supervisor.async_start("door_log_backfill", self.backfill.async_run)
 
     async def async_stop_polling(self):
         """Stop polling the personal door log API."""
-        await self.door_log_poller.async_stop()
+        await self.supervisor.async_stop("door_log_poll")
+
+    def async_start_recording(self, duration: float) -> bool:
+        """Record door log, userconf and temp key list responses for `duration` seconds."""
+        if self.recorder is not None:
+            return False
+        self.recorder = CassetteRecorder(self.hass)
+
+        async def _async_record() -> None:
+            await asyncio.sleep(duration)
+            await self.async_stop_recording()
+
+        self.supervisor.async_start("response_recording", _async_record)
+        LOGGER.info("📼 Recording cloud responses for %ss", duration)
+        return True
+
+    async def async_stop_recording(self) -> dict | None:
+        """Stop recording and write the cassette."""
+        recorder, self.recorder = self.recorder, None
+        if recorder is None:
+            return None
+        result = await recorder.async_save()
+        recording = self.supervisor.tasks.get("response_recording")
+        if recording is not None and recording.task is not asyncio.current_task():
+            # Stopped early: cancel the timer
+            await self.supervisor.async_stop("response_recording")
+        return result
 
     def init_api_with_data(self,
                            hass: HomeAssistant,
@@ -553,6 +618,77 @@ class AkuvoxApiClient:
         except Exception as e:
             LOGGER.warning("⚠️ Failed to reload latest token before request: %s", e)
 
+    async def async_open_door(self, name: str, mac: str, relay_id) -> dict:
+        """Open a door relay; repeated presses of the same relay share one request."""
+        return await self.door_commands.async_run(
+            f"{mac}_{relay_id}", lambda: self._async_open_door(name, mac, relay_id))
+
+    async def _async_open_door(self, name: str, mac: str, relay_id) -> dict:
+        """Open a door relay, locally when possible, and record which path served it.
+
+        A device with a healthy local API is triggered over the LAN first. If it
+        has not answered within LAN_RELAY_HEDGE_DELAY, or fails, the cloud
+        request is sent too and the first success wins. Devices whose local API
+        recently failed go straight to the cloud. The press is then confirmed
+        by the door log entry it produces.
+        """
+        start = time.perf_counter()
+        press = self.confirmations.expect(name, mac, relay_id)
+        path, success = "cloud", False
+        try:
+            if self.lan is not None and self.lan.address(mac) is not None and self.lan.is_healthy(mac):
+                path, success = await self._async_race_door_open(name, mac, relay_id)
+            else:
+                success = await self._async_cloud_door_open(name, mac, relay_id)
+        finally:
+            self.confirmations.sent(press, path, success)
+
+        result = {
+            "path": path,
+            "success": success,
+            "ms": round((time.perf_counter() - start) * 1000, 1),
+            "time": datetime.now().isoformat(timespec="seconds"),
+        }
+        self.door_presses[f"{mac}_{relay_id}"] = result
+        LOGGER.debug("🚪 Door '%s' press served by %s in %sms (success: %s)",
+                     name, path, result["ms"], success)
+        return result
+
+    async def _async_cloud_door_open(self, name: str, mac: str, relay_id) -> bool:
+        """Open a door relay through the cloud opendoor API."""
+        host = self._data.host
+        if not host:
+            LOGGER.error("❌ Cannot open door '%s': host address is not set", name)
+            return False
+        response = await self.async_make_opendoor_request(
+            name=name,
+            host=host,
+            data=f"mac={mac}&relay={relay_id}")
+        return response is not None
+
+    async def _async_race_door_open(self, name: str, mac: str, relay_id) -> tuple[str, bool]:
+        """Trigger locally, hedging with the cloud request if the LAN is slow or fails."""
+        lan_task = asyncio.ensure_future(self.lan.async_trigger_relay(mac, relay_id))
+        cloud_task = None
+        try:
+            await asyncio.wait({lan_task}, timeout=LAN_RELAY_HEDGE_DELAY)
+            if lan_task.done() and not lan_task.exception() and lan_task.result():
+                return "lan", True
+
+            cloud_task = asyncio.ensure_future(self._async_cloud_door_open(name, mac, relay_id))
+            pending = {cloud_task} if lan_task.done() else {cloud_task, lan_task}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.exception() and task.result():
+                        return ("lan" if task is lan_task else "cloud_fallback"), True
+            return "cloud_fallback", False
+        finally:
+            # The loser, or both requests if the caller was cancelled
+            for task in (lan_task, cloud_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
     async def async_make_opendoor_request(self, name: str, host: str, data: str):
         """Asynchronous non-blocking door open request."""
         await self.ensure_latest_token()
@@ -574,6 +710,13 @@ class AkuvoxApiClient:
 
         LOGGER.debug("🔑 Using token for door open: %s", self._data.token)
 
+        async with self.scheduler.slot(CLASS_INTERACTIVE):
+            return await self._async_post_opendoor(url, headers, data)
+
+    async def _async_post_opendoor(self, url: str, headers: dict, data: str):
+        """Post the opendoor request and record its metrics."""
+        start = time.perf_counter()
+        error = None
         try:
             async with async_timeout.timeout(5):
                 async with self._session.post(url, headers=headers, data=data) as resp:
@@ -581,11 +724,16 @@ class AkuvoxApiClient:
                         json_data = await resp.json()
                         LOGGER.debug("✅ Door open request sent successfully.")
                         return json_data
+                    error = f"HTTP {resp.status}"
                     LOGGER.error("❌ Door open request failed with status %s", resp.status)
         except asyncio.TimeoutError:
+            error = "TimeoutError"
             LOGGER.error("⏰ Door open request timed out.")
         except Exception as e:
+            error = type(e).__name__
             LOGGER.error("❌ Error opening door: %s", e)
+        finally:
+            self.metrics.record(ENDPOINT_OPENDOOR, (time.perf_counter() - start) * 1000, error)
         return None
 
     async def async_retrieve_temp_keys_data(self) -> bool:
@@ -600,21 +748,9 @@ class AkuvoxApiClient:
         """Request the user's configuration data."""
         LOGGER.debug("📡 Retrieving list of user's temporary keys...")
         host = self.get_activities_host()
-        subdomain = self._data.subdomain # await self._data.async_get_stored_data_for_key("subdomain")
         url = f"https://{host}/{API_GET_PERSONAL_TEMP_KEY_LIST}"
         data = {}
-        headers = {
-            "x-cloud-version": "6.4",
-            "accept": "application/json, text/plain, */*",
-            "sec-fetch-site": "same-origin",
-            "accept-language": "en-AU,en;q=0.9",
-            "sec-fetch-mode": "cors",
-            "x-cloud-lang": "en",
-            "user-agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) SmartPlus/6.2",
-            "referer": f"https://{subdomain}.akuvox.com/smartplus/TmpKey.html?TOKEN={self._data.token}&USERTYPE=20&VERSION=6.6",
-            "x-auth-token": self._data.token,
-            "sec-fetch-dest": "empty"
-        }
+        headers = self.get_temp_key_headers()
 
         json_data = await self._async_api_wrapper(method="get", url=url, headers=headers, data=data)
 
@@ -625,49 +761,184 @@ class AkuvoxApiClient:
         LOGGER.error("❌ Unable to retrieve user's temporary key list.")
         return None
 
+    async def async_create_temp_keys(self, keys: list[dict]) -> list[dict]:
+        """Create temporary keys and add the results to the data model."""
+        results = await self._async_gather_bounded(
+            [self.async_add_temp_key(key) for key in keys])
+
+        created: list[dict] = []
+        outcome: list[dict] = []
+        for key, result in zip(keys, results):
+            if isinstance(result, dict):
+                created.append(result)
+                outcome.append({"success": True, "key": result})
+            else:
+                LOGGER.error("❌ Unable to create temporary key '%s': %s",
+                             key.get("description", ""), result)
+                outcome.append({
+                    "success": False,
+                    "description": key.get("description", ""),
+                    "error": str(result)
+                })
+
+        if created:
+            self._data.add_temp_keys(created)
+            await self._data.async_set_stored_data_for_key("door_keys_data", self._data.get_temp_keys_data())
+            async_dispatcher_send(self.hass, SIGNAL_TEMP_KEYS_ADDED, created)
+        LOGGER.debug("🔑 Created %d of %d temporary keys", len(created), len(keys))
+        return outcome
+
+    async def async_revoke_temp_keys(self, key_ids: list) -> list[dict]:
+        """Revoke temporary keys and remove them from the data model."""
+        results = await self._async_gather_bounded(
+            [self.async_delete_temp_key(key_id) for key_id in key_ids])
+
+        revoked: list = []
+        outcome: list[dict] = []
+        for key_id, result in zip(key_ids, results):
+            if result is True:
+                revoked.append(key_id)
+                outcome.append({"success": True, "key_id": key_id})
+            else:
+                error = result if isinstance(result, Exception) else "Request rejected"
+                LOGGER.error("❌ Unable to revoke temporary key %s: %s", key_id, error)
+                outcome.append({"success": False, "key_id": key_id, "error": str(error)})
+
+        if revoked:
+            removed = self._data.remove_temp_keys(revoked)
+            await self._data.async_set_stored_data_for_key("door_keys_data", self._data.get_temp_keys_data())
+            async_dispatcher_send(self.hass, SIGNAL_TEMP_KEYS_REMOVED, removed or revoked)
+        LOGGER.debug("🔑 Revoked %d of %d temporary keys", len(revoked), len(key_ids))
+        return outcome
+
+    async def async_add_temp_key(self, key: dict) -> dict:
+        """Create a single temporary key and return it in the parsed key format."""
+        doors = key.get("doors") or [
+            {"mac": relay.mac, "relay": relay.relay_id}
+            for relay in self._data.door_relay_data
+        ]
+        payload = {
+            "Description": key.get("description", ""),
+            "BeginTime": self.format_temp_key_time(key["begin_time"]),
+            "EndTime": self.format_temp_key_time(key["end_time"]),
+            "AllowedTimes": int(key.get("allowed_times", 1)),
+            "EachAllowedTimes": int(key.get("each_allowed_times", 0)),
+            "Doors": [{"MAC": door["mac"], "Relay": door["relay"]} for door in doors],
+        }
+        host = self.get_activities_host()
+        url = f"https://{host}/{API_ADD_PERSONAL_TEMP_KEY}"
+        headers = self.get_temp_key_headers()
+        headers["content-type"] = "application/json"
+
+        json_data = await self._async_api_wrapper(method="post",
+                                                  url=url,
+                                                  headers=headers,
+                                                  data=json.dumps(payload),
+                                                  request_class=CLASS_BACKGROUND)
+        if not isinstance(json_data, dict) or "ID" not in json_data:
+            raise AkuvoxApiClientError(f"Unexpected tempKey response: {json_data}")
+
+        # Fill in the list fields the create response may omit
+        key_json = {
+            **payload,
+            "TmpKey": "",
+            "AccessTimes": 0,
+            "QrCodeUrl": "",
+            "Expired": 1,
+            **json_data,
+        }
+        key_json["Doors"] = [
+            {"ID": door.get("ID", ""),
+             "KeyID": door.get("KeyID", json_data["ID"]),
+             "Relay": door["Relay"],
+             "MAC": door["MAC"]}
+            for door in key_json.get("Doors", [])
+        ]
+        return self._data.parse_temp_key(key_json)
+
+    async def async_delete_temp_key(self, key_id) -> bool:
+        """Revoke a single temporary key."""
+        host = self.get_activities_host()
+        url = f"https://{host}/{API_DELETE_PERSONAL_TEMP_KEY}"
+        headers = self.get_temp_key_headers()
+        headers["content-type"] = "application/json"
+
+        json_data = await self._async_api_wrapper(method="post",
+                                                  url=url,
+                                                  headers=headers,
+                                                  data=json.dumps({"ID": key_id}),
+                                                  request_class=CLASS_BACKGROUND)
+        return json_data is not None and json_data != []
+
+    async def _async_gather_bounded(self, coroutines: list, limit: int = TEMP_KEY_REQUEST_CONCURRENCY) -> list:
+        """Run coroutines with at most `limit` in flight, returning results or exceptions."""
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _async_run(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(_async_run(coroutine) for coroutine in coroutines),
+                                    return_exceptions=True)
+
     async def async_start_polling_personal_door_log(self):
         """Poll the server contineously for the latest personal door log."""
-        # Make sure only 1 instance of the door log polling is running
-        self.hass.async_create_task(self.async_retrieve_personal_door_log())
+        # The supervisor makes sure only 1 instance of the door log polling is running
+        await self.async_start_polling()
 
     async def async_retrieve_personal_door_log(self) -> bool:
         """Request and parse the user's door log every 2 seconds."""
         while True:
             # Get the latest pesonal door log
+            was_failing = self._failed_attempts > 0
             json_data = await self.async_get_personal_door_log()
             if json_data is not None:
-                new_door_log = await self._data.async_parse_personal_door_log(json_data)
-                if new_door_log is not None:
-                    # Fire HA event
-                    LOGGER.debug("🚪 New door open event occurred. Firing akuvox_door_update event")
-                    event_name = "akuvox_door_update"
-                    self.hass.bus.async_fire(event_name, new_door_log)
-            # Back off when failing: 2s normally, up to 5min on repeated failures
-            sleep_interval = 2 if self._failed_attempts == 0 else min(30 * self._failed_attempts, 300)
+                if was_failing:
+                    # The cloud is reachable again: recover the events of the outage
+                    await self.async_start_backfill()
+                for new_door_log in await self._data.async_parse_personal_door_log(json_data):
+                    pushed = self.webhook.consume_match(new_door_log) if self.webhook is not None else None
+                    if pushed is not None:
+                        LOGGER.debug("🚪 Door event already delivered by the device's Action URL")
+                        await self.async_replace_pushed_door_log(pushed, new_door_log)
+                        continue
+                    await self.async_handle_new_door_log(new_door_log)
+            # Back off when failing: 2s normally, up to 5min on repeated failures.
+            # Devices pushing events through their Action URL only need a slow reconciliation poll.
+            if self._failed_attempts:
+                sleep_interval = min(30 * self._failed_attempts, 300)
+            elif self.webhook is not None and self.webhook.active:
+                sleep_interval = WEBHOOK_RECONCILE_INTERVAL
+            else:
+                sleep_interval = 2
             await asyncio.sleep(sleep_interval)
 
+    async def async_handle_new_door_log(self, new_door_log: dict):
+        """Ingest a new door log entry: fire the HA event and record it locally."""
+        # Fire HA event
+        LOGGER.debug("🚪 New door open event occurred. Firing akuvox_door_update event")
+        event_name = "akuvox_door_update"
+        self.hass.bus.async_fire(event_name, new_door_log)
+        self.confirmations.observe(new_door_log)
+        self.analytics.async_record(new_door_log)
+
+        if self.event_store is not None:
+            try:
+                await self.event_store.async_add_event(new_door_log)
+            except Exception as error:
+                LOGGER.warning("⚠️ Unable to record door event in local history: %s", error)
+
+    async def async_replace_pushed_door_log(self, pushed: dict, door_log: dict):
+        """Keep the cloud copy of a door event pushed by a device in the local history."""
+        if self.event_store is not None:
+            try:
+                await self.event_store.async_replace_event(pushed, door_log)
+            except Exception as error:
+                LOGGER.warning("⚠️ Unable to record door event in local history: %s", error)
+
     async def async_get_personal_door_log(self):
         """Request the user's personal door log data."""
-        host = self.get_activities_host()
-        url = f"https://{host}/{API_GET_PERSONAL_DOOR_LOG}"
-        data = {}
-        headers = {
-            "x-cloud-version": "6.4",
-            "accept": "application/json, text/plain, */*",
-            "sec-fetch-site": "same-origin",
-            "accept-language": "en-AU,en;q=0.9",
-            "sec-fetch-mode": "cors",
-            "x-cloud-lang": "en",
-            "user-agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) SmartPlus/6.2",
-            "referer": f"https://{self._data.subdomain}.akuvox.com/smartplus/Activities.html?TOKEN={self._data.token}",
-            "x-auth-token": self._data.token,
-            "sec-fetch-dest": "empty"
-        }
-
-        json_data: list = await self._async_api_wrapper(method="get",
-                                                        url=url,
-                                                        headers=headers,
-                                                        data=data) # type: ignore
+        json_data: list = await self._async_get_door_log(row=1) # type: ignore
 
         # New logic: treat empty list as normal "no new events"
         if json_data is not None:
@@ -690,6 +961,40 @@ class AkuvoxApiClient:
 
         return None
 
+    async def async_get_door_log_page(self, row: int, page: int = 1) -> list | None:
+        """Request one page of the personal door log, newest entries first.
+
+        Used by the backfill, so it runs as a background request and does
+        not affect the polling backoff.
+        """
+        json_data = await self._async_get_door_log(row=row, page=page, request_class=CLASS_BACKGROUND)
+        if json_data is None:
+            return None
+        return json_data if isinstance(json_data, list) else []
+
+    async def _async_get_door_log(self, row: int, page: int | None = None, request_class: str | None = None):
+        """Request `row` personal door log entries, from the given page."""
+        host = self.get_activities_host()
+        query = f"row={int(row)}" + (f"&page={int(page)}" if page is not None else "")
+        url = f"https://{host}/{API_GET_PERSONAL_DOOR_LOG}?{query}"
+        headers = {
+            "x-cloud-version": "6.4",
+            "accept": "application/json, text/plain, */*",
+            "sec-fetch-site": "same-origin",
+            "accept-language": "en-AU,en;q=0.9",
+            "sec-fetch-mode": "cors",
+            "x-cloud-lang": "en",
+            "user-agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) SmartPlus/6.2",
+            "referer": f"https://{self._data.subdomain}.akuvox.com/smartplus/Activities.html?TOKEN={self._data.token}",
+            "x-auth-token": self._data.token,
+            "sec-fetch-dest": "empty"
+        }
+        return await self._async_api_wrapper(method="get",
+                                             url=url,
+                                             headers=headers,
+                                             data={},
+                                             request_class=request_class)
+
     ###################
     # Request Methods #
     ###################
@@ -700,20 +1005,50 @@ class AkuvoxApiClient:
         url: str,
         data,
         headers: dict | None = None,
+        request_class: str | None = None,
     ):
-        """Get information from the API."""
+        """Get information from the API, once the scheduler admits the request.
+
+        Requests are classed as interactive, event ingestion or background
+        (by endpoint unless `request_class` is given) so door presses are not
+        queued behind polling.
+        """
+        request_class = request_class or request_class_for_endpoint(endpoint_for_url(url))
+        async with self.scheduler.slot(request_class):
+            return await self._async_api_request(method, url, data, headers)
+
+    async def _async_api_request(
+        self,
+        method: str,
+        url: str,
+        data,
+        headers: dict | None = None,
+    ):
+        """Send a request to the API and record its metrics."""
+        endpoint = endpoint_for_url(url)
+        start = time.perf_counter()
         try:
             async with async_timeout.timeout(10):
                 func = self.post_request if method == "post" else self.get_request
                 subdomain = self._data.subdomain
                 url = url.replace("subdomain.", f"{subdomain}.")
                 # Only log non-polling requests to reduce spam
-                if not url.endswith(API_GET_PERSONAL_DOOR_LOG) and not url.endswith(API_SERVERS_LIST):
+                if endpoint != ENDPOINT_DOOR_LOG and not url.endswith(API_SERVERS_LIST):
                     LOGGER.debug("⏳ Sending request to %s", url)
                 response = await self.hass.async_add_executor_job(func, url, headers, data, 10)
-                return self.process_response(response, url)
+                if self.recorder is not None:
+                    self.recorder.record(endpoint, method, url, response)
+                json_data = self.process_response(response, url)
+                error = None
+                if response.status_code != 200:
+                    error = f"HTTP {response.status_code}"
+                elif json_data is None:
+                    error = "InvalidResponse"
+                self.metrics.record(endpoint, (time.perf_counter() - start) * 1000, error)
+                return json_data
 
         except asyncio.TimeoutError as exception:
+            self.metrics.record(endpoint, (time.perf_counter() - start) * 1000, "TimeoutError")
             # Fix for accounts which use the "single" endpoint instead of "community"
             app_type_1 = "community"
             app_type_2 = "single"
@@ -725,7 +1060,8 @@ class AkuvoxApiClient:
                                app_type_2)
                 self._data.app_type = app_type_2
                 url = url.replace("app/"+app_type_1+"/", "app/"+app_type_2+"/")
-                return await self._async_api_wrapper(method, url, data, headers)
+                self.metrics.record_retry(endpoint)
+                return await self._async_api_request(method, url, data, headers)
             if f"app/{app_type_2}/" in url:
                 LOGGER.error("Timeout occured for 'app/%s' API %s request: %s",
                              app_type_2,
@@ -736,10 +1072,12 @@ class AkuvoxApiClient:
                 f"Timeout error fetching information: {exception}",
             ) from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
+            self.metrics.record(endpoint, (time.perf_counter() - start) * 1000, type(exception).__name__)
             raise AkuvoxApiClientCommunicationError(
                 f"Error fetching information: {exception}",
             ) from exception
         except Exception as exception:  # pylint: disable=broad-except
+            self.metrics.record(endpoint, (time.perf_counter() - start) * 1000, type(exception).__name__)
             raise AkuvoxApiClientError(
                 f"Something really wrong happened! {exception}. URL = {url}"
             ) from exception
@@ -857,6 +1195,32 @@ class AkuvoxApiClient:
             transformed_str += str(transformed_digit)
         return int(transformed_str)
 
+    def get_temp_key_headers(self) -> dict:
+        """Headers for tempKey API requests."""
+        return {
+            "x-cloud-version": "6.4",
+            "accept": "application/json, text/plain, */*",
+            "sec-fetch-site": "same-origin",
+            "accept-language": "en-AU,en;q=0.9",
+            "sec-fetch-mode": "cors",
+            "x-cloud-lang": "en",
+            "user-agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) SmartPlus/6.2",
+            "referer": f"https://{self._data.subdomain}.akuvox.com/smartplus/TmpKey.html?TOKEN={self._data.token}&USERTYPE=20&VERSION=6.6",
+            "x-auth-token": self._data.token,
+            "sec-fetch-dest": "empty"
+        }
+
+    def format_temp_key_time(self, value) -> str:
+        """Format a datetime or date string in the tempKey API's date format."""
+        if isinstance(value, datetime):
+            return value.strftime(TEMP_KEY_DATE_FORMAT)
+        for fmt in (TEMP_KEY_DATE_FORMAT, "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M"):
+            try:
+                return datetime.strptime(str(value).strip(), fmt).strftime(TEMP_KEY_DATE_FORMAT)
+            except ValueError:
+                continue
+        raise ValueError(f"Invalid temporary key time: {value}")
+
     def get_activities_host(self):
         """Get the host address string for activities API requests."""
         if self._data.app_type == "single":
@@ -900,10 +1264,6 @@ class AkuvoxApiClient:
 
     async def async_schedule_token_refresh(self):
         """Periodically check and refresh tokens every 24 hours."""
-        if getattr(self, "_refresh_task_running", False):
-            LOGGER.debug("⏰ Token refresh scheduler already running, skipping duplicate start.")
-            return
-        self._refresh_task_running = True
         LOGGER.debug("⏰ Starting scheduled token refresh task.")
         try:
             while True:
@@ -915,4 +1275,4 @@ class AkuvoxApiClient:
                     LOGGER.error("⚠️ Scheduled token refresh failed: %s", e)
         except asyncio.CancelledError:
             LOGGER.debug("🛑 Token refresh scheduler cancelled.")
-            self._refresh_task_running = False
\ No newline at end of file
+            raise
\ No newline at end of file
@@ -0,0 +1,175 @@
+"""Backfill of the local door event history from the cloud door log."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import storage
+
+from .const import (
+    LOGGER,
+    DOOR_LOG_BACKFILL_STORAGE_KEY,
+    DOOR_LOG_BACKFILL_DAYS,
+    DOOR_LOG_BACKFILL_PAGE_SIZE,
+    DOOR_LOG_BACKFILL_CONCURRENCY,
+    DOOR_LOG_BACKFILL_MAX_PAGES,
+    DOOR_LOG_BACKFILL_OVERLAP,
+)
+from .event_store import parse_capture_time
+
+
+class DoorLogBackfill:
+    """Pages back through the cloud door log into the local event history.
+
+    A run reads pages newest first until it reaches the stop point or the
+    horizon, whichever is more recent. The stop point is the newest stored
+    event (minus DOOR_LOG_BACKFILL_OVERLAP) when the run was requested,
+    before the poll stores the events that follow the gap. Up to
+    `concurrency` pages are fetched at a time. The offset of the run is
+    persisted after every batch, so a run interrupted by a restart resumes
+    where it stopped. Entries already stored are ignored by the event
+    store, and new entries arriving during a run only push older entries
+    to later pages, so pages are never skipped.
+    """
+
+    def __init__(self,
+                 hass: HomeAssistant,
+                 client,
+                 horizon_days: int = DOOR_LOG_BACKFILL_DAYS,
+                 page_size: int = DOOR_LOG_BACKFILL_PAGE_SIZE,
+                 concurrency: int = DOOR_LOG_BACKFILL_CONCURRENCY) -> None:
+        """Initialize the backfill."""
+        self.hass = hass
+        self.client = client
+        self.horizon_days = horizon_days
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.last_run: dict | None = None
+        self._store = storage.Store(hass, 1, DOOR_LOG_BACKFILL_STORAGE_KEY)
+        self._requested: datetime | None = None  # Stop point recorded while a run is going
+        self._running_stop_at: datetime | None = None
+
+    async def async_request(self) -> None:
+        """Record the stop point of the next run, before newer events are stored.
+
+        The cursor is persisted right away, so the gap is recovered even if
+        Home Assistant restarts first. A running run restarts from the
+        newest entry after its current batch.
+        """
+        event_store = self.client.event_store
+        if event_store is None or self.horizon_days <= 0:
+            return
+        stop_at = await self._async_newest_stop_at(event_store)
+        cursor = await self._store.async_load() or {}
+        for earlier in (self._requested, self._running_stop_at,
+                        datetime.fromisoformat(cursor["stop_at"]) if cursor.get("stop_at") else None):
+            if earlier is not None:
+                stop_at = min(stop_at, earlier)
+        self._requested = stop_at
+        await self._async_save(stop_at, 0)
+
+    async def async_run(self) -> None:
+        """Fill the local history back to the requested stop point or the horizon."""
+        event_store = self.client.event_store
+        if event_store is None or self.horizon_days <= 0:
+            return
+
+        cursor = await self._store.async_load() or {}
+        if cursor.get("stop_at"):
+            stop_at = datetime.fromisoformat(cursor["stop_at"])
+            offset = int(cursor.get("offset", 0))
+            LOGGER.debug("📜 Resuming door log backfill at entry %d", offset)
+        else:
+            stop_at = await self._async_newest_stop_at(event_store)
+            offset = 0
+
+        added = fetched = 0
+        done = False
+        try:
+            while True:
+                if self._requested is not None:
+                    # A new gap was recorded: read again from the newest entry
+                    stop_at, offset, done = min(stop_at, self._requested), 0, False
+                    self._requested = None
+                self._running_stop_at = stop_at
+                if done:
+                    break
+                first_page = offset // self.page_size + 1
+                if first_page > DOOR_LOG_BACKFILL_MAX_PAGES:
+                    LOGGER.warning("⚠️ Door log backfill stopped after %d pages", DOOR_LOG_BACKFILL_MAX_PAGES)
+                    break
+                pages = await asyncio.gather(*(
+                    self.client.async_get_door_log_page(row=self.page_size, page=page)
+                    for page in range(first_page,
+                                      min(first_page + self.concurrency, DOOR_LOG_BACKFILL_MAX_PAGES + 1))))
+                for entries in pages:
+                    if entries is None:
+                        # Keep the cursor; the next run retries from this page
+                        LOGGER.debug("📜 Door log backfill interrupted at entry %d", offset)
+                        await self._async_save_progress(stop_at, offset)
+                        self._finish(added, fetched, False)
+                        return
+                    in_range = [entry for entry in entries
+                                if (parse_capture_time(entry.get("CaptureTime")) or stop_at) >= stop_at]
+                    fetched += len(entries)
+                    offset += len(entries)
+                    if in_range:
+                        await self._async_replace_pushed(in_range)
+                        added += await event_store.async_add_events(in_range)
+                    if len(in_range) < len(entries) or len(entries) < self.page_size:
+                        done = True
+                        break
+                if not done:
+                    await self._async_save_progress(stop_at, offset)
+        finally:
+            self._running_stop_at = None
+
+        if self._requested is None:
+            await self._store.async_save({})
+        self._finish(added, fetched, True)
+
+    def as_dict(self) -> dict:
+        """Return the configuration and outcome of the last run."""
+        return {
+            "horizon_days": self.horizon_days,
+            "page_size": self.page_size,
+            "concurrency": self.concurrency,
+            "last_run": self.last_run,
+        }
+
+    async def _async_replace_pushed(self, entries: list[dict]) -> None:
+        """Replace the pushed copies of recovered entries delivered by a device callback."""
+        if self.client.webhook is None:
+            return
+        for entry in entries:
+            pushed = self.client.webhook.pop_match(entry)
+            if pushed is not None:
+                await self.client.async_replace_pushed_door_log(pushed, entry)
+
+    async def _async_newest_stop_at(self, event_store) -> datetime:
+        """Return the stop point for the events stored so far: the newest one, or the horizon."""
+        stop_at = datetime.now() - timedelta(days=self.horizon_days)
+        newest = await event_store.async_query(limit=1)
+        newest_time = parse_capture_time(newest[0].get("CaptureTime")) if newest else None
+        if newest_time is not None:
+            stop_at = max(stop_at, newest_time - timedelta(seconds=DOOR_LOG_BACKFILL_OVERLAP))
+        return stop_at
+
+    async def _async_save(self, stop_at: datetime, offset: int) -> None:
+        await self._store.async_save({"stop_at": stop_at.isoformat(), "offset": offset})
+
+    async def _async_save_progress(self, stop_at: datetime, offset: int) -> None:
+        """Persist the offset of the run, unless a request already saved a restart."""
+        if self._requested is None:
+            await self._async_save(stop_at, offset)
+
+    def _finish(self, added: int, fetched: int, complete: bool) -> None:
+        self.last_run = {
+            "finished": datetime.now().isoformat(timespec="seconds"),
+            "complete": complete,
+            "fetched": fetched,
+            "added": added,
+        }
+        if added:
+            LOGGER.info("📜 Door log backfill added %d missed event(s) to the local history", added)
@@ -1,5 +1,6 @@
 """Button platform for akuvox."""
 from homeassistant.components.button import ButtonEntity
+from homeassistant.core import Event, callback
 from homeassistant.helpers import storage
 from homeassistant.helpers.entity import DeviceInfo
 
@@ -10,7 +11,8 @@ from .const import (
     LOGGER,
     NAME,
     VERSION,
-    DATA_STORAGE_KEY
+    DATA_STORAGE_KEY,
+    DOOR_OPEN_CONFIRMED_EVENT,
 )
 from .entity import AkuvoxEntity
 
@@ -30,7 +32,6 @@ async def async_setup_entry(hass, entry, async_add_devices):
         name = door_relay["name"]
         mac = door_relay["mac"]
         relay_id = door_relay["relay_id"]
-        data = f"mac={mac}&relay={relay_id}"
 
         entities.append(
             AkuvoxDoorRelayEntity(
@@ -38,7 +39,7 @@ async def async_setup_entry(hass, entry, async_add_devices):
                 entry=entry,
                 name=name,
                 relay_id=relay_id,
-                data=data,
+                mac=mac,
             )
         )
 
@@ -50,7 +51,8 @@ class AkuvoxDoorRelayEntity(ButtonEntity, AkuvoxEntity):
 
     _client: AkuvoxApiClient
     _name: str = ""
-    _relay_data: str = ""
+    _mac: str = ""
+    _relay_id: str = ""
 
     def __init__(
         self,
@@ -58,7 +60,7 @@ class AkuvoxDoorRelayEntity(ButtonEntity, AkuvoxEntity):
         entry,
         name: str,
         relay_id: str,
-        data: str,
+        mac: str,
     ) -> None:
         """Initialize the Akuvox door relay class."""
         super(ButtonEntity, self).__init__(client=client, entry=entry)
@@ -70,7 +72,8 @@ class AkuvoxDoorRelayEntity(ButtonEntity, AkuvoxEntity):
         unique_name = name + ", " + relay_id
         self._client = client
         self._name = unique_name
-        self._relay_data = data
+        self._mac = mac
+        self._relay_id = relay_id
         # Note: host and token are NOT cached here — they are read live from
         # client._data at press time so they always reflect the current valid values.
 
@@ -85,18 +88,55 @@ class AkuvoxDoorRelayEntity(ButtonEntity, AkuvoxEntity):
             manufacturer=NAME,
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Refresh the press attributes when the door log confirms a press."""
+        await super().async_added_to_hass()
+
+        @callback
+        def _handle_confirmation(event: Event) -> None:
+            if event.data.get("mac") == self._mac and event.data.get("relay") == str(self._relay_id):
+                self.async_write_ha_state()
+
+        self.async_on_remove(
+            self.hass.bus.async_listen(DOOR_OPEN_CONFIRMED_EVENT, _handle_confirmation)
+        )
+
     def press(self) -> None:
         """Sync fallback that calls async version safely."""
         self.hass.loop.create_task(self.async_press())
 
     async def async_press(self) -> None:
-        """Trigger the door relay using the live host from the API client."""
-        host = self._client._data.host
-        if not host:
-            LOGGER.error("❌ Cannot open door '%s': host address is not set", self._name)
-            return
-        await self._client.async_make_opendoor_request(
+        """Trigger the door relay, over the LAN when configured, otherwise via the cloud."""
+        await self._client.async_open_door(
             name=self._name,
-            host=host,
-            data=self._relay_data
+            mac=self._mac,
+            relay_id=self._relay_id,
         )
+        self.async_write_ha_state()
+
+    @property
+    def extra_state_attributes(self):
+        """How the last press was served, duplicate presses joined and confirmation latency."""
+        key = f"{self._mac}_{self._relay_id}"
+        press = self._client.door_presses.get(key)
+        if press is None:
+            return None
+        return {
+            "last_press_path": press["path"],
+            "last_press_ms": press["ms"],
+            "last_press_success": press["success"],
+            "duplicate_presses": self._client.door_commands.suppressed.get(key, 0),
+            **self._confirmation_attributes(key),
+        }
+
+    def _confirmation_attributes(self, key: str) -> dict:
+        """Latency from press to the door log entry confirming it."""
+        stats = self._client.confirmations.stats.get(key)
+        if stats is None:
+            return {}
+        return {
+            "last_confirmed_ms": round(stats.last_ms) if stats.last_ms is not None else None,
+            "confirmed_p95_ms": stats.percentile(0.95),
+            "confirmed_presses": stats.confirmed,
+            "unconfirmed_presses": stats.unconfirmed,
+        }
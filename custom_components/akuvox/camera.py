@@ -1,15 +1,30 @@
 """Camera platform for akuvox."""
 
+import asyncio
+import time
 from collections.abc import Callable, Awaitable
+from datetime import timedelta
 from urllib.parse import urlparse
 
 from homeassistant.helpers import storage
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.components.camera import Camera, CameraEntityFeature
 
-from .const import DOMAIN, LOGGER, NAME, VERSION, DATA_STORAGE_KEY
+from .const import (
+    DOMAIN,
+    LOGGER,
+    NAME,
+    VERSION,
+    DATA_STORAGE_KEY,
+    LAN_RTSP_RECHECK_INTERVAL,
+    STREAM_PREWARM_READ_TIMEOUT,
+)
+from .lan import AkuvoxLanClient
+from .metrics import AkuvoxMetrics, ENDPOINT_GO2RTC
+from .models import mac_key
 
 GO2RTC_KEY = "go2rtc"
 # Standard go2rtc ports — HA offsets these by +10000 (API: 11984, RTSP: 18554)
@@ -34,14 +49,23 @@ async def async_setup_entry(hass: HomeAssistant,
         LOGGER.error("No camera data found in device data")
         return
 
+    coordinator = hass.data[DOMAIN].get(_entry.entry_id)
+    metrics = coordinator.client.metrics if coordinator is not None else None
+    lan = coordinator.client.lan if coordinator is not None else None
+
     entities = []
     for camera_data in cameras_data:
         name = str(camera_data["name"]).strip()
         rtsp_url = str(camera_data["video_url"]).strip()
+        # Older stored data has no MAC; the cloud URL ends with it
+        mac = camera_data.get("mac") or urlparse(rtsp_url).path.strip("/")
         entities.append(AkuvoxCameraEntity(
             hass=hass,
             name=name,
-            rtsp_url=rtsp_url
+            rtsp_url=rtsp_url,
+            metrics=metrics,
+            mac=mac,
+            lan=lan,
         ))
 
     if async_add_devices is None:
@@ -49,17 +73,35 @@ async def async_setup_entry(hass: HomeAssistant,
         return
 
     async_add_devices(entities)
+
+    # Pre-warm the matching camera's go2rtc stream when a door event arrives
+    prewarm_seconds = int(_entry.options.get("stream_prewarm_seconds", 0) or 0)
+    if prewarm_seconds > 0:
+        @callback
+        def _async_prewarm_for_door_event(event: Event) -> None:
+            for entity in entities:
+                if entity.matches_door_event(event.data):
+                    entity.async_prewarm(prewarm_seconds)
+
+        _entry.async_on_unload(
+            hass.bus.async_listen("akuvox_door_update", _async_prewarm_for_door_event)
+        )
     return True
 
 
 class AkuvoxCameraEntity(Camera):
     """Akuvox RTSP camera entity."""
 
+    _attr_should_poll = False
+
     def __init__(
         self,
         hass: HomeAssistant,
         name: str,
         rtsp_url: str,
+        metrics: AkuvoxMetrics | None = None,
+        mac: str | None = None,
+        lan: AkuvoxLanClient | None = None,
     ) -> None:
         """Initialize the Akuvox camera."""
         super().__init__()
@@ -68,7 +110,15 @@ class AkuvoxCameraEntity(Camera):
         self.hass = hass
         self._name = name
         self._rtsp_url = rtsp_url
+        self._metrics = metrics
+        self._mac = mac
+        self._lan = lan if lan is not None and mac and lan.address(mac) else None
+        self._stream_path = "cloud"
         self._go2rtc_stream_id: str | None = None
+        self._go2rtc_api_url: str | None = None
+        self._go2rtc_session = None
+        self._prewarm_until = 0.0
+        self._prewarm_task: asyncio.Task | None = None
         self._go2rtc_host = "127.0.0.1"
         self._go2rtc_rtsp_port = _GO2RTC_STD_RTSP_PORT
 
@@ -87,8 +137,45 @@ class AkuvoxCameraEntity(Camera):
     async def async_added_to_hass(self) -> None:
         """Register stream with go2rtc when entity is added."""
         await super().async_added_to_hass()
+        self.async_on_remove(self._cancel_prewarm)
+        if self._lan is not None:
+            await self._async_select_stream_path()
+            self.async_on_remove(
+                async_track_time_interval(
+                    self.hass,
+                    self._async_recheck_stream_path,
+                    timedelta(seconds=LAN_RTSP_RECHECK_INTERVAL),
+                )
+            )
         await self._register_go2rtc()
 
+    @property
+    def extra_state_attributes(self):
+        """Which RTSP source is active: the device on the LAN or the cloud relay."""
+        return {"stream_path": self._stream_path}
+
+    async def _async_select_stream_path(self) -> bool:
+        """Prefer the device's local RTSP server when it answers. Returns True if the path changed."""
+        path = "lan" if await self._lan.async_probe_rtsp(self._mac) else "cloud"
+        if path == self._stream_path:
+            return False
+        LOGGER.info("🎥 Camera '%s' now streams from the %s", self._name,
+                    "local network" if path == "lan" else "cloud relay")
+        self._stream_path = path
+        return True
+
+    async def _async_recheck_stream_path(self, _now) -> None:
+        """Re-probe the local stream and re-register with go2rtc if the path changed."""
+        if await self._async_select_stream_path():
+            await self._register_go2rtc()
+            self.async_write_ha_state()
+
+    def _active_source_url(self) -> str:
+        """RTSP URL of the active path."""
+        if self._stream_path == "lan":
+            return self._lan.rtsp_url(self._mac)
+        return self._rtsp_url
+
     async def _register_go2rtc(self) -> None:
         """Register the RTSP stream with go2rtc's REST API using TCP transport."""
         go2rtc_config = self.hass.data.get(GO2RTC_KEY)
@@ -119,7 +206,11 @@ class AkuvoxCameraEntity(Camera):
         # Force UDP via #transport=udp — go2rtc defaults to TCP, but Akuvox only
         # echoes client_port correctly for UDP SETUP. TCP causes empty client_port=
         # in the server response, which go2rtc rejects.
-        source_url = f"{self._rtsp_url}#transport=udp"
+        # The device's own RTSP server on the LAN handles TCP.
+        if self._stream_path == "lan":
+            source_url = self._active_source_url()
+        else:
+            source_url = f"{self._rtsp_url}#transport=udp"
         api_url = f"{base_url.rstrip('/')}/api/streams"
 
         LOGGER.debug(
@@ -127,6 +218,8 @@ class AkuvoxCameraEntity(Camera):
             self._name, api_url, rtsp_host, rtsp_port, stream_id,
         )
 
+        start = time.perf_counter()
+        error = None
         try:
             if session is None:
                 session = async_get_clientsession(self.hass)
@@ -140,6 +233,7 @@ class AkuvoxCameraEntity(Camera):
                     self._name, resp.status, body,
                 )
                 if resp.status not in (200, 204):
+                    error = f"HTTP {resp.status}"
                     LOGGER.warning(
                         "go2rtc API returned %d for camera '%s': %s",
                         resp.status, self._name, body,
@@ -147,6 +241,8 @@ class AkuvoxCameraEntity(Camera):
                     return
 
             self._go2rtc_stream_id = stream_id
+            self._go2rtc_api_url = base_url.rstrip('/')
+            self._go2rtc_session = session
             self._go2rtc_host = rtsp_host
             self._go2rtc_rtsp_port = rtsp_port
             LOGGER.debug(
@@ -154,10 +250,74 @@ class AkuvoxCameraEntity(Camera):
                 self._name, rtsp_host, rtsp_port, stream_id,
             )
         except Exception as err:
+            error = type(err).__name__
             LOGGER.warning(
                 "go2rtc registration failed for camera '%s': %s — falling back to direct RTSP",
                 self._name, err,
             )
+        finally:
+            if self._metrics is not None:
+                self._metrics.record(ENDPOINT_GO2RTC, (time.perf_counter() - start) * 1000, error)
+
+    def matches_door_event(self, door_log: dict) -> bool:
+        """Whether a door event came from this camera's device (by MAC, else by location)."""
+        mac = mac_key(door_log.get("MAC"))
+        if mac and self._mac:
+            return mac == mac_key(self._mac)
+        return str(door_log.get("Location", "")).strip() == self._name
+
+    @callback
+    def async_prewarm(self, duration: float) -> None:
+        """Keep go2rtc connected to the camera for a while so a live view starts instantly.
+
+        go2rtc only connects to its source when a consumer arrives. Reading the
+        stream for the warm window keeps the producer running; it is torn down
+        when the window ends. A new event during the window extends it.
+        """
+        if not self._go2rtc_stream_id or self.hass is None:
+            return
+        self._prewarm_until = time.monotonic() + duration
+        if self._prewarm_task is None or self._prewarm_task.done():
+            self._prewarm_task = self.hass.async_create_background_task(
+                self._async_prewarm(), f"akuvox stream prewarm {self._name}")
+
+    @callback
+    def _cancel_prewarm(self) -> None:
+        """Stop the running pre-warm, if any."""
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
+            self._prewarm_task = None
+
+    async def _async_prewarm(self) -> None:
+        """Consume the go2rtc stream until the warm window ends."""
+        session = self._go2rtc_session or async_get_clientsession(self.hass)
+        url = f"{self._go2rtc_api_url}/api/stream.mp4"
+        start = time.perf_counter()
+        received = 0
+        try:
+            async with session.get(url, params={"src": self._go2rtc_stream_id}) as resp:
+                if resp.status != 200:
+                    LOGGER.debug("go2rtc pre-warm of '%s' returned %d", self._name, resp.status)
+                    return
+                LOGGER.debug("🎥 Pre-warming stream for '%s'", self._name)
+                while (remaining := self._prewarm_until - time.monotonic()) > 0:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            resp.content.readany(),
+                            timeout=min(remaining, STREAM_PREWARM_READ_TIMEOUT))
+                    except asyncio.TimeoutError:
+                        continue
+                    if not chunk:
+                        break
+                    if received == 0:
+                        LOGGER.debug("🎥 Stream for '%s' warm after %.0fms",
+                                     self._name, (time.perf_counter() - start) * 1000)
+                    received += len(chunk)
+        except Exception as err:
+            LOGGER.debug("go2rtc pre-warm of '%s' failed: %s", self._name, err)
+        finally:
+            LOGGER.debug("🎥 Stream pre-warm for '%s' ended after %.1fs (%d bytes)",
+                         self._name, time.perf_counter() - start, received)
 
     async def _reload_camera_data(self):
         """Reload camera data from storage."""
@@ -186,6 +346,8 @@ class AkuvoxCameraEntity(Camera):
 
         # Fallback: direct RTSP (reload URL from storage in case it changed)
         LOGGER.debug("stream_source for '%s': direct RTSP fallback", self._name)
+        if self._stream_path == "lan":
+            return self._active_source_url()
         cameras_data = await self._reload_camera_data()
         if cameras_data is None:
             return self._rtsp_url
@@ -0,0 +1,143 @@
+"""Capture of akuvox cloud responses for offline replay."""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import os
+import re
+import time
+from collections.abc import Iterator
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    LOGGER,
+    API_USERCONF,
+    API_GET_PERSONAL_TEMP_KEY_LIST,
+    CASSETTE_DIRECTORY,
+    CASSETTE_FLUSH_LINES,
+    CASSETTE_REDACT_KEYS,
+)
+from .metrics import ENDPOINT_DOOR_LOG, ENDPOINT_USERCONF, ENDPOINT_TEMP_KEY
+
+CASSETTE_VERSION = 1
+ENDPOINT_TEMP_KEY_LIST = "tempKey_list"
+REDACTED = "**REDACTED**"
+
+_TEMP_KEY_LIST_PATH = API_GET_PERSONAL_TEMP_KEY_LIST.split("?", 1)[0]
+_TOKEN_QUERY = re.compile(r"(?i)\b(token|auth_token|refresh_token)=[^&]*")
+
+
+def recorded_endpoint(endpoint: str, url: str) -> str | None:
+    """Cassette endpoint name of a request, or None if it is not recorded."""
+    path = url.split("?", 1)[0]
+    if endpoint == ENDPOINT_DOOR_LOG:
+        return ENDPOINT_DOOR_LOG
+    if endpoint == ENDPOINT_USERCONF and path.endswith(API_USERCONF):
+        return ENDPOINT_USERCONF
+    if endpoint == ENDPOINT_TEMP_KEY and path.endswith(_TEMP_KEY_LIST_PATH):
+        return ENDPOINT_TEMP_KEY_LIST
+    return None
+
+
+def redact_payload(payload):
+    """Copy of a response body with credentials, key codes and URLs replaced."""
+    if isinstance(payload, dict):
+        return {key: REDACTED if key in CASSETTE_REDACT_KEYS and value not in (None, "")
+                else redact_payload(value)
+                for key, value in payload.items()}
+    if isinstance(payload, list):
+        return [redact_payload(value) for value in payload]
+    return payload
+
+
+def redact_url(url: str) -> str:
+    """Request path and query without host or tokens."""
+    path = url.split("://", 1)[-1]
+    path = path[path.find("/"):] if "/" in path else ""
+    return _TOKEN_QUERY.sub(lambda match: f"{match.group(1)}={REDACTED}", path)
+
+
+def read_cassette(path: str) -> Iterator[dict]:
+    """Yield the recorded responses of a cassette, in recording order."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline())
+        if header.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {header.get('version')}")
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+class CassetteRecorder:
+    """Records the raw door log, userconf and temp key list responses.
+
+    Each response is kept as one compact JSON line with its offset from the
+    start of the recording, the endpoint, the redacted request path, the
+    HTTP status and the redacted body. Every CASSETTE_FLUSH_LINES responses
+    the lines are appended to the gzipped cassette in the executor, so a
+    long recording is not held in memory.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the recorder."""
+        self.hass = hass
+        self.started = time.monotonic()
+        self.started_at = datetime.now()
+        self.path = os.path.join(hass.config.path(CASSETTE_DIRECTORY),
+                                 f"akuvox_{self.started_at.strftime('%Y%m%d_%H%M%S')}.jsonl.gz")
+        self.counts: dict[str, int] = {}
+        self._lines: list[str] = [json.dumps({
+            "version": CASSETTE_VERSION,
+            "started": self.started_at.isoformat(timespec="seconds"),
+        }, separators=(",", ":"))]
+        self._writing: asyncio.Task | None = None
+
+    def record(self, endpoint: str, method: str, url: str, response) -> None:
+        """Record a response if its endpoint is captured."""
+        name = recorded_endpoint(endpoint, url)
+        if name is None:
+            return
+        try:
+            body = response.json()
+        except Exception:  # pylint: disable=broad-except
+            body = None
+        self._lines.append(json.dumps({
+            "t": round(time.monotonic() - self.started, 3),
+            "e": name,
+            "m": method,
+            "u": redact_url(url),
+            "s": response.status_code,
+            "b": redact_payload(body),
+        }, separators=(",", ":"), default=str))
+        self.counts[name] = self.counts.get(name, 0) + 1
+        if len(self._lines) >= CASSETTE_FLUSH_LINES:
+            self._flush()
+
+    async def async_save(self) -> dict:
+        """Write the remaining responses and return the cassette path and response counts."""
+        self._flush()
+        await self._writing
+        LOGGER.info("📼 Recorded %d responses to %s", sum(self.counts.values()), self.path)
+        return {"file": self.path, "responses": dict(self.counts)}
+
+    def _flush(self) -> None:
+        """Append the buffered lines after the writes already queued."""
+        lines, self._lines = self._lines, []
+        self._writing = self.hass.async_create_task(self._async_append(self._writing, lines))
+
+    async def _async_append(self, previous: asyncio.Task | None, lines: list[str]) -> None:
+        if previous is not None:
+            await previous
+        if lines:
+            await self.hass.async_add_executor_job(self._append, self.path, lines, previous is None)
+
+    @staticmethod
+    def _append(path: str, lines: list[str], create: bool) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Each append adds a gzip member; readers see one continuous stream
+        with gzip.open(path, "wt" if create else "at", encoding="utf-8") as file:
+            for line in lines:
+                file.write(line + "\n")
@@ -17,6 +17,8 @@ from .const import (
     LOCATIONS_DICT,
     COUNTRY_PHONE,
     SUBDOMAINS_LIST,
+    DOOR_PRESS_DEBOUNCE_WINDOW,
+    DOOR_LOG_BACKFILL_DAYS,
 )
 from .helpers import AkuvoxHelpers
 
@@ -461,6 +463,17 @@ class AkuvoxOptionsFlowHandler(config_entries.OptionsFlow):
                 ),
             vol.Required("event_screenshot_options", default=self.get_data_key_value("event_screenshot_options", "asap")):
                 vol.In(event_screenshot_options),
+            vol.Optional("lan_devices", default=self.get_data_key_value("lan_devices", "")): str,
+            vol.Optional("lan_username", default=self.get_data_key_value("lan_username", "")): str,
+            vol.Optional("lan_password", default=self.get_data_key_value("lan_password", "")): str,
+            vol.Optional("door_press_debounce", default=self.get_data_key_value("door_press_debounce", DOOR_PRESS_DEBOUNCE_WINDOW)):
+                vol.All(vol.Coerce(float), vol.Range(min=0, max=30)),
+            vol.Optional("door_log_backfill_days", default=self.get_data_key_value("door_log_backfill_days", DOOR_LOG_BACKFILL_DAYS)):
+                vol.All(vol.Coerce(int), vol.Range(min=0, max=90)),
+            vol.Optional("stream_prewarm_seconds", default=self.get_data_key_value("stream_prewarm_seconds", 0)):
+                vol.All(vol.Coerce(int), vol.Range(min=0, max=300)),
+            vol.Optional("local_webhook", default=self.get_data_key_value("local_webhook", False)): bool,
+            vol.Optional("performance_watchdog", default=self.get_data_key_value("performance_watchdog", False)): bool,
         })
 
         # Show form
@@ -0,0 +1,173 @@
+"""Confirmation of door presses from the door log."""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    LOGGER,
+    DOOR_OPEN_CONFIRMED_EVENT,
+    DOOR_CONFIRM_TIMEOUT,
+    DOOR_CONFIRM_CLOCK_SKEW,
+    DOOR_CONFIRM_SAMPLES,
+    DOOR_CONFIRM_CAPTURE_TYPE,
+)
+from .event_store import parse_capture_time
+from .models import DoorLog, mac_key
+
+
+class PendingPress:
+    """A door press waiting for its door log entry."""
+
+    __slots__ = ("name", "mac", "relay_id", "path", "pressed_at", "pressed_wall", "future", "timer")
+
+    def __init__(self, name: str, mac: str, relay_id, future: asyncio.Future) -> None:
+        """Initialize the pending press."""
+        self.name = name
+        self.mac = mac
+        self.relay_id = str(relay_id)
+        self.path: str | None = None
+        self.pressed_at = time.monotonic()
+        self.pressed_wall = datetime.now()
+        self.future = future
+        self.timer: asyncio.TimerHandle | None = None
+
+    @property
+    def key(self) -> str:
+        """Door key used for statistics, as in door_presses."""
+        return f"{self.mac}_{self.relay_id}"
+
+
+class ConfirmationStats:
+    """Rolling press-to-confirmation latencies of one door."""
+
+    __slots__ = ("latencies_ms", "confirmed", "unconfirmed", "last_ms")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.latencies_ms: deque[float] = deque(maxlen=DOOR_CONFIRM_SAMPLES)
+        self.confirmed = 0
+        self.unconfirmed = 0
+        self.last_ms: float | None = None
+
+    def record(self, latency_ms: float) -> None:
+        """Record a confirmed press."""
+        self.latencies_ms.append(latency_ms)
+        self.confirmed += 1
+        self.last_ms = latency_ms
+
+    def percentile(self, fraction: float) -> float | None:
+        """Latency percentile over the recent confirmations."""
+        if not self.latencies_ms:
+            return None
+        ordered = sorted(self.latencies_ms)
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 1)
+
+    def as_dict(self) -> dict:
+        """Return a serialisable snapshot."""
+        return {
+            "confirmed": self.confirmed,
+            "unconfirmed": self.unconfirmed,
+            "last_ms": round(self.last_ms, 1) if self.last_ms is not None else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(max(self.latencies_ms), 1) if self.latencies_ms else None,
+        }
+
+
+class DoorOpenConfirmations:
+    """Matches door presses with the door log entries they produce.
+
+    A press is registered before its request is sent, so an entry pushed by
+    the device before the request returns is still matched. Only unlock
+    entries of the pressed relay confirm a press, so a call or an unlock of
+    another relay on the same device does not. Presses with no entry after
+    DOOR_CONFIRM_TIMEOUT count as unconfirmed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the confirmation tracker."""
+        self.hass = hass
+        self.stats: dict[str, ConfirmationStats] = {}
+        self._pending: dict[str, deque[PendingPress]] = {}
+
+    @callback
+    def expect(self, name: str, mac: str, relay_id) -> PendingPress:
+        """Register a press about to be sent."""
+        press = PendingPress(name, mac, relay_id, self.hass.loop.create_future())
+        self._pending.setdefault(mac_key(mac), deque()).append(press)
+        press.timer = self.hass.loop.call_later(DOOR_CONFIRM_TIMEOUT, self._expire, press)
+        return press
+
+    @callback
+    def sent(self, press: PendingPress, path: str, success: bool) -> None:
+        """Record how a press was sent; failed presses are not awaited."""
+        press.path = path
+        if not success:
+            self._remove(press)
+            if not press.future.done():
+                press.future.set_result(None)
+
+    @callback
+    def observe(self, door_log: dict) -> None:
+        """Resolve the press a newly ingested door log entry confirms, if any."""
+        record = DoorLog.from_api(door_log)
+        pending = self._pending.get(mac_key(record.mac))
+        if not pending or DOOR_CONFIRM_CAPTURE_TYPE not in record.capture_type.lower():
+            return
+        capture_time = parse_capture_time(record.capture_time)
+        skew = timedelta(seconds=DOOR_CONFIRM_CLOCK_SKEW)
+        press = next((press for press in pending
+                      if press.relay_id == record.relay
+                      and (capture_time is None or capture_time >= press.pressed_wall - skew)), None)
+        if press is None:
+            return
+        self._remove(press)
+
+        latency_ms = (time.monotonic() - press.pressed_at) * 1000
+        self.stats.setdefault(press.key, ConfirmationStats()).record(latency_ms)
+        result = {
+            "name": press.name,
+            "mac": press.mac,
+            "relay": press.relay_id,
+            "path": press.path,
+            "latency_ms": round(latency_ms, 1),
+            "capture_time": record.capture_time,
+            "capture_type": record.capture_type,
+            "initiator": record.initiator,
+        }
+        if not press.future.done():
+            press.future.set_result(result)
+        LOGGER.debug("✅ Door '%s' opening confirmed by the door log after %.0fms",
+                     press.name, latency_ms)
+        self.hass.bus.async_fire(DOOR_OPEN_CONFIRMED_EVENT, result)
+
+    def as_dict(self) -> dict:
+        """Return the confirmation statistics per door."""
+        return {key: stats.as_dict() for key, stats in self.stats.items()}
+
+    def _remove(self, press: PendingPress) -> None:
+        if press.timer is not None:
+            press.timer.cancel()
+            press.timer = None
+        mac = mac_key(press.mac)
+        pending = self._pending.get(mac)
+        if pending is not None and press in pending:
+            pending.remove(press)
+            if not pending:
+                del self._pending[mac]
+
+    @callback
+    def _expire(self, press: PendingPress) -> None:
+        """Give up on a press whose door log entry never arrived."""
+        press.timer = None
+        self._remove(press)
+        self.stats.setdefault(press.key, ConfirmationStats()).unconfirmed += 1
+        if not press.future.done():
+            press.future.set_result(None)
+        LOGGER.debug("⚠️ No door log entry confirmed the press of '%s' within %ss",
+                     press.name, DOOR_CONFIRM_TIMEOUT)
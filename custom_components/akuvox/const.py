@@ -470,9 +470,13 @@ API_REFRESH_TOKEN = "refresh_token"
 
 API_APP_HOST = "subdomain.akuvox.com/web-server/v3/app/"
 API_GET_PERSONAL_TEMP_KEY_LIST = "tempKey/getPersonalTempKeyList?row=20&page=1"
-API_GET_PERSONAL_DOOR_LOG = "log/getDoorLog?row=1"
+API_ADD_PERSONAL_TEMP_KEY = "tempKey/addPersonalTempKey"
+API_DELETE_PERSONAL_TEMP_KEY = "tempKey/deletePersonalTempKey"
+API_GET_PERSONAL_DOOR_LOG = "log/getDoorLog"
 
 TEMP_KEY_QR_HOST = "subdomain.akuvox.com"
+TEMP_KEY_DATE_FORMAT = "%d-%m-%Y %H:%M:%S"
+TEMP_KEY_REQUEST_CONCURRENCY = 4  # Max simultaneous create/revoke requests
 
 DATA_STORAGE_KEY = "akuvox_data_storage_key"
 
@@ -480,4 +484,125 @@ DATA_STORAGE_KEY = "akuvox_data_storage_key"
 TOKEN_REFRESH_INTERVAL_DAYS = 6  # Refresh every 6 days (1 day before 7-day expiry)
 
 CAPTURE_TIME_KEY = "CaptureTime"
+CAPTURE_TIME_FORMAT = "%d-%m-%Y %H:%M:%S"  # CaptureTime of the cloud door log
 PIC_URL_KEY = "PicUrl"
+
+# Dispatcher signals
+SIGNAL_TOKEN_UPDATED = f"{DOMAIN}_token_updated"
+SIGNAL_TEMP_KEYS_ADDED = f"{DOMAIN}_temp_keys_added"
+SIGNAL_TEMP_KEYS_REMOVED = f"{DOMAIN}_temp_keys_removed"
+
+# Door event history
+EVENT_STORE_FILENAME = "akuvox_door_events.db"
+EVENT_STORE_MAX_EVENTS = 100000  # Oldest events are pruned beyond this count
+EVENT_STORE_MAX_AGE_DAYS = 365  # Events older than this are pruned
+EVENT_STORE_PRUNE_EVERY = 100  # Apply retention limits after this many inserts
+EVENT_STORE_FETCH_SIZE = 1000  # Rows read at a time when streaming events out of the store
+
+# Door event deduplication
+SEEN_EVENTS_STORAGE_KEY = "akuvox_seen_door_events"
+SEEN_EVENTS_MAX = 4096  # Least recently seen identities are evicted beyond this
+SEEN_EVENTS_SAVE_DELAY = 10  # Seconds to batch index writes
+
+# Diagnostics
+METRICS_SENSOR_UPDATE_INTERVAL = 300  # Seconds between request metrics sensor updates
+
+# Event loop watchdog (opt-in)
+WATCHDOG_TICK_INTERVAL = 0.5  # Seconds between event loop heartbeats
+WATCHDOG_STALL_THRESHOLD_MS = 100  # Heartbeats later than this are attributed to a stack sample
+WATCHDOG_LOCK_HOLD_THRESHOLD_MS = 2000  # Holds longer than one poll interval delay door events
+WATCHDOG_LOG_INTERVAL = 600  # Seconds between log summaries (only logged if something new occurred)
+WATCHDOG_LAG_SAMPLES = 1200  # Heartbeats kept for the lag percentile (10 minutes)
+
+# Profiling service
+PROFILE_DIRECTORY = "akuvox_profiles"  # Under the Home Assistant config directory
+PROFILE_SAMPLE_INTERVAL = 0.5  # Seconds between task samples
+PROFILE_DEFAULT_DURATION = 60
+PROFILE_MAX_DURATION = 600
+
+# Local Action URL receiver
+WEBHOOK_URL = "/api/akuvox/action/{mac}"
+WEBHOOK_STORAGE_KEY = "akuvox_webhook_secrets"
+WEBHOOK_DEDUP_WINDOW = 120  # Seconds between a device callback and its cloud door log entry
+WEBHOOK_RECONCILE_INTERVAL = 60  # Seconds between cloud door log polls while devices push events
+
+# Local network (LAN) device access
+LAN_RELAY_TIMEOUT = 2  # Seconds before a local relay trigger is considered failed
+LAN_RELAY_HEDGE_DELAY = 0.5  # Seconds to wait for the LAN before also sending the cloud request
+LAN_RETRY_AFTER = 60  # Seconds to use the cloud only after a local failure
+LAN_RTSP_PORT = 554
+LAN_RTSP_PATH = "livestream/11"  # Main stream of the device's built-in RTSP server
+LAN_RTSP_PROBE_TIMEOUT = 2  # Seconds to wait for an RTSP OPTIONS reply
+LAN_RTSP_RECHECK_INTERVAL = 600  # Seconds between re-probes of each camera's local stream
+
+# Stream pre-warming
+STREAM_PREWARM_READ_TIMEOUT = 5  # Seconds to wait for stream data before re-checking the warm window
+
+# Hot reconfiguration
+HOT_CONFIG_KEYS = (  # Applied in memory; changes to any other key reload the entry
+    "token",
+    "refresh_token",
+    "auth_token",
+    "event_screenshot_options",
+)
+
+# Background task supervision
+SUPERVISOR_BACKOFF_MIN = 5  # Seconds before restarting a crashed background task
+SUPERVISOR_BACKOFF_MAX = 300  # Upper bound of the doubling restart delay
+SUPERVISOR_STABLE_AFTER = 600  # A task that ran this long before crashing restarts at the minimum delay
+
+# Cloud request scheduling
+REQUEST_CLASS_LIMITS = {  # Concurrent cloud requests per priority class
+    "interactive": 4,
+    "events": 2,
+    "background": 2,
+}
+REQUEST_SHARED_LIMIT = 3  # Concurrent event ingestion and background requests combined
+
+# Door-open commands
+DOOR_PRESS_DEBOUNCE_WINDOW = 2.0  # Seconds in which repeated presses of a relay share one request
+
+# Door-open confirmation
+DOOR_OPEN_CONFIRMED_EVENT = "akuvox_door_open_confirmed"
+DOOR_CONFIRM_TIMEOUT = 180  # Seconds to wait for the door log entry of a press
+DOOR_CONFIRM_CLOCK_SKEW = 60  # Seconds a door log CaptureTime may precede the press (device clock drift)
+DOOR_CONFIRM_SAMPLES = 100  # Recent confirmation latencies kept per door
+DOOR_CONFIRM_CAPTURE_TYPE = "unlock"  # Door log CaptureTypes containing this word confirm a press
+
+# Door analytics
+SIGNAL_DOOR_ANALYTICS_UPDATED = f"{DOMAIN}_door_analytics_updated"
+DOOR_ANALYTICS_SEED_LIMIT = 5000  # Stored door events counted at startup (last week, newest first)
+DOOR_ANALYTICS_TOP_INITIATORS = 25  # Initiators listed in the initiator breakdown sensor
+
+# Door log backfill
+DOOR_LOG_BACKFILL_STORAGE_KEY = "akuvox_door_log_backfill"
+DOOR_LOG_BACKFILL_DAYS = 7  # Default horizon: how far back a backfill run may reach (0 = off)
+DOOR_LOG_BACKFILL_PAGE_SIZE = 50  # Door log entries requested per page
+DOOR_LOG_BACKFILL_CONCURRENCY = 2  # Pages fetched at the same time
+DOOR_LOG_BACKFILL_MAX_PAGES = 200  # Upper bound on the pages read by one run
+DOOR_LOG_BACKFILL_OVERLAP = 300  # Seconds re-read before the newest stored event
+
+# Door event export
+EXPORT_DIRECTORY = "akuvox_exports"  # Under the Home Assistant config directory
+EXPORT_FORMATS = ("csv", "jsonl")
+EXPORT_CSV_COLUMNS = ("CaptureTime", "Location", "MAC", "Relay", "Initiator", "CaptureType", "PicUrl")
+
+# Response recording
+CASSETTE_DIRECTORY = "akuvox_cassettes"  # Under the Home Assistant config directory
+CASSETTE_DEFAULT_DURATION = 600
+CASSETTE_MAX_DURATION = 86400
+CASSETTE_FLUSH_LINES = 50  # Recorded responses buffered before they are appended to the cassette file
+CASSETTE_REDACT_KEYS = frozenset({  # Response fields replaced in recorded cassettes
+    "token",
+    "auth_token",
+    "refresh_token",
+    "rtsp_pwd",
+    "sip",
+    "sip_passwd",
+    "phone",
+    "phone_number",
+    "email",
+    "TmpKey",
+    "QrCodeUrl",
+    "PicUrl",
+})
@@ -22,6 +22,8 @@ from .const import(
     LOGGER,
     DATA_STORAGE_KEY
 )
+from .key_scheduler import TempKeyScheduler
+from .watchdog import LoopWatchdog
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
@@ -29,6 +31,8 @@ class AkuvoxDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
     config_entry: ConfigEntry
+    watchdog: LoopWatchdog | None = None
+    applied_config: dict | None = None
 
     def __init__(
         self,
@@ -37,6 +41,7 @@ class AkuvoxDataUpdateCoordinator(DataUpdateCoordinator):
     ) -> None:
         """Initialize."""
         self.client = client
+        self.key_scheduler = TempKeyScheduler(hass)
         super().__init__(
             hass=hass,
             logger=LOGGER,
@@ -5,16 +5,19 @@ import asyncio
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import storage
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .const import (
     LOGGER,
-    TEMP_KEY_QR_HOST,
     PIC_URL_KEY,
     CAPTURE_TIME_KEY,
     DATA_STORAGE_KEY,
     LOCATIONS_DICT,
+    SIGNAL_TOKEN_UPDATED,
 )
+from .dedup import SeenEventIndex
 from .helpers import AkuvoxHelpers
+from .models import Camera, DoorLog, DoorRelay, TempKey, mac_key
 
 helpers = AkuvoxHelpers()
 
@@ -23,20 +26,21 @@ class AkuvoxData:
 
     hass: HomeAssistant = None # type: ignore
     host: str = ""
-    location_dict: dict = {}
+    location_dict: dict
     subdomain: str = ""
     app_type: str = ""
     auth_token: str = ""
-    token: str = ""
+    _token: str = ""
     refresh_token: str = ""
     phone_number: str = ""
     wait_for_image_url: bool = False
     rtsp_ip: str = ""
     project_name: str = ""
-    camera_data = []
-    door_relay_data = []
-    door_keys_data = []
+    camera_data: list[Camera]
+    door_relay_data: list[DoorRelay]
+    door_keys_data: list[TempKey]
     _processing_lock: asyncio.Lock = None  # type: ignore
+    _seen_events: SeenEventIndex | None = None
 
 
     def __init__(self,
@@ -52,6 +56,16 @@ class AkuvoxData:
                  wait_for_image_url: bool = False):
         """Initialize the Akuvox API client."""
 
+        # Per-instance device data and lookup indexes
+        self.location_dict = {}
+        self.camera_data = []
+        self.door_relay_data = []
+        self.door_keys_data = []
+        self._cameras_by_mac: dict[str, Camera] = {}
+        self._relays_by_mac: dict[str, list[DoorRelay]] = {}
+        self._relays: dict[tuple[str, str], DoorRelay] = {}
+        self._keys_by_id: dict[str, TempKey] = {}
+
         self.hass = hass if hass else self.hass
         self.host = host if host else self.get_value_for_key(entry, "host", host) # type: ignore
         self.auth_token = auth_token if auth_token else self.get_value_for_key(entry, "auth_token", self.host) # type: ignore
@@ -80,6 +94,20 @@ class AkuvoxData:
 
         self.hass.add_job(self.async_set_stored_data_for_key, "wait_for_image_url", self.wait_for_image_url)
 
+    @property
+    def token(self) -> str:
+        """Active API token."""
+        return self._token
+
+    @token.setter
+    def token(self, value: str) -> None:
+        """Set the active API token and notify listeners when it changes."""
+        if value == self._token:
+            return
+        self._token = value
+        if self.hass is not None:
+            async_dispatcher_send(self.hass, SIGNAL_TOKEN_UPDATED)
+
     def get_value_for_key(self, entry: ConfigEntry, key: str, default):
         """Get the value for a given key. Options take priority over data for token fields."""
         if entry is not None:
@@ -120,8 +148,8 @@ class AkuvoxData:
 
     def parse_userconf_data(self, json_data: dict):
         """Parse the userconf API response."""
-        self.door_relay_data = []
-        self.camera_data = []
+        camera_data: list[Camera] = []
+        door_relay_data: list[DoorRelay] = []
         if json_data is not None:
             if "app_conf" in json_data:
                 self.project_name = json_data["app_conf"]["project_name"].strip()
@@ -133,71 +161,105 @@ class AkuvoxData:
                     # Camera
                     if "location" in dev_data and "rtsp_pwd" in dev_data and "mac" in dev_data:
                         password = dev_data["rtsp_pwd"]
-                        camera_dict = {
-                            "name": name,
-                            "video_url": f"rtsp://ak:{password}@{self.rtsp_ip}:554/{mac}"
-                        }
-                        self.camera_data.append(camera_dict)
+                        camera_data.append(Camera(
+                            name=name,
+                            mac=mac,
+                            video_url=f"rtsp://ak:{password}@{self.rtsp_ip}:554/{mac}"
+                        ))
 
                     # Door Relay
                     if "relay" in dev_data:
                         for relay in dev_data["relay"]:
-                            relay_id = relay["relay_id"]
-                            door_name = relay["door_name"].strip()
-                            self.door_relay_data.append({
-                                "name": name,
-                                "door_name": door_name,
-                                "relay_id": relay_id,
-                                "mac": mac
-                            })
+                            door_relay_data.append(DoorRelay(
+                                name=name,
+                                door_name=relay["door_name"].strip(),
+                                relay_id=relay["relay_id"],
+                                mac=mac
+                            ))
+        self.set_devices(camera_data, door_relay_data)
 
         # Log parsed entities
         if len(self.camera_data) > 0:
             LOGGER.debug("🎥 Cameras parsed:")
-            for camera_dict in self.camera_data:
-                LOGGER.debug(" - %s", camera_dict.get("name", ""))
+            for camera in self.camera_data:
+                LOGGER.debug(" - %s", camera.name)
         if len(self.door_relay_data) > 0:
             LOGGER.debug("🚪 Door relays parsed:")
-            for relay_dict in self.door_relay_data:
-                LOGGER.debug(" - %s", relay_dict.get("name", ""))
+            for relay in self.door_relay_data:
+                LOGGER.debug(" - %s", relay.name)
+
+    def set_devices(self, camera_data: list[Camera], door_relay_data: list[DoorRelay]) -> None:
+        """Replace the cameras and relays and rebuild their lookup indexes."""
+        self.camera_data = camera_data
+        self.door_relay_data = door_relay_data
+        self._cameras_by_mac = {mac_key(camera.mac): camera for camera in camera_data}
+        self._relays_by_mac = {}
+        self._relays = {}
+        for relay in door_relay_data:
+            mac = mac_key(relay.mac)
+            self._relays_by_mac.setdefault(mac, []).append(relay)
+            self._relays[(mac, str(relay.relay_id))] = relay
+
+    def camera(self, mac: str) -> Camera | None:
+        """Camera of a device."""
+        return self._cameras_by_mac.get(mac_key(mac))
+
+    def relays(self, mac: str) -> list[DoorRelay]:
+        """Relays of a device."""
+        return self._relays_by_mac.get(mac_key(mac), [])
+
+    def relay(self, mac: str, relay_id) -> DoorRelay | None:
+        """Look up a relay by device MAC and relay ID."""
+        return self._relays.get((mac_key(mac), str(relay_id)))
+
+    def temp_key(self, key_id) -> TempKey | None:
+        """Look up a temporary key by ID."""
+        return self._keys_by_id.get(str(key_id))
 
     def parse_temp_keys_data(self, json_data: list):
         """Parse the getPersonalTempKeyList API response."""
-        self.door_keys_data = []
-        for door_keys_json in json_data:
-            door_keys_data = {}
-            door_keys_data["key_id"] = door_keys_json["ID"]
-            door_keys_data["description"] = door_keys_json["Description"]
-            door_keys_data["key_code"] = door_keys_json["TmpKey"]
-            door_keys_data["begin_time"] = door_keys_json["BeginTime"]
-            door_keys_data["end_time"] = door_keys_json["EndTime"]
-            door_keys_data["access_times"] = door_keys_json["AccessTimes"]
-            door_keys_data["allowed_times"] = door_keys_json["AllowedTimes"]
-            door_keys_data["each_allowed_times"] = door_keys_json["EachAllowedTimes"]
-            door_keys_data["qr_code_url"] = f"https://{TEMP_KEY_QR_HOST}{door_keys_json['QrCodeUrl']}"
-            door_keys_data["expired"] = False if door_keys_json["Expired"] else True
-
-            door_keys_data["doors"] = []
-            if "Doors" in door_keys_json:
-                for door_key_json in door_keys_json["Doors"]:
-                    door_keys_data["doors"].append({
-                        "door_id": door_key_json["ID"],
-                        "key_id": door_key_json["KeyID"],  # Reference to key
-                        "relay": door_key_json["Relay"],
-                        "mac": door_key_json["MAC"]
-                    })
-
-            self.door_keys_data.append(door_keys_data)
+        self.set_temp_keys([TempKey.from_api(door_keys_json) for door_keys_json in json_data])
 
         if len(self.door_keys_data) > 0:
             LOGGER.debug("🔑 %s Temp key%s parsed:",
                         str(len(self.door_keys_data)),
                         "s" if len(self.door_keys_data) > 1 else "")
-            for door_relay_dict in self.door_relay_data:
+            for door_key in self.door_keys_data:
                 LOGGER.debug(" - '%s', with access to %s door%s",
-                             door_relay_dict.get("name", ""),
-                             str(len(door_keys_data["doors"])),
-                             "" if len(door_keys_data["doors"]) == 1 else "s")
+                             door_key.description,
+                             str(len(door_key.doors)),
+                             "" if len(door_key.doors) == 1 else "s")
+
+    def parse_temp_key(self, door_keys_json: dict) -> dict:
+        """Parse a single temp key entry from the tempKey API into the storage schema."""
+        return TempKey.from_api(door_keys_json).as_dict()
+
+    def set_temp_keys(self, door_keys_data: list[TempKey]) -> None:
+        """Replace the temporary keys and rebuild their lookup index."""
+        self.door_keys_data = door_keys_data
+        self._keys_by_id = {str(door_key.key_id): door_key for door_key in door_keys_data}
+
+    def add_temp_keys(self, door_keys_data: list[dict]):
+        """Add (or replace) parsed temp keys without re-fetching the full list."""
+        new_keys = [TempKey.from_dict(door_key) for door_key in door_keys_data]
+        new_ids = {str(door_key.key_id) for door_key in new_keys}
+        self.set_temp_keys([
+            door_key for door_key in self.door_keys_data
+            if str(door_key.key_id) not in new_ids
+        ] + new_keys)
+
+    def remove_temp_keys(self, key_ids: list) -> list:
+        """Remove temp keys by ID and return the IDs that were removed."""
+        remove_ids = {str(key_id) for key_id in key_ids}
+        removed = [
+            door_key.key_id for door_key in self.door_keys_data
+            if str(door_key.key_id) in remove_ids
+        ]
+        self.set_temp_keys([
+            door_key for door_key in self.door_keys_data
+            if str(door_key.key_id) not in remove_ids
+        ])
+        return removed
 
     async def async_wait_for_camera_url(self, door_log: dict, max_wait_seconds: int = 5) -> dict:
         """
@@ -281,76 +343,85 @@ class AkuvoxData:
                       location, max_wait_seconds)
         return door_log
 
-    async def async_parse_personal_door_log(self, json_data: list):
-        """Parse the getDoorLog API response with improved camera URL handling."""
+    async def async_parse_personal_door_log(self, json_data: list) -> list[dict]:
+        """Parse the getDoorLog API response and return new events, oldest first."""
         if json_data is None or len(json_data) == 0:
-            return None
-        
+            return []
+
         # Use lock to prevent concurrent processing of the same event
         if self._processing_lock.locked():
             # Don't log - this is expected during normal operation
-            return None
-        
+            return []
+
         async with self._processing_lock:
-            new_door_log = json_data[0]
-            latest_door_log = await self.async_get_stored_data_for_key("latest_door_log")
-            
-            # Check if this is a new event
-            if latest_door_log is None:
-                # No baseline yet (first run after install or storage wipe).
-                # Store current entry as the baseline without firing an event,
-                # so we don't replay old historical entries as new notifications.
-                LOGGER.debug("No baseline door log found — storing current entry as baseline without firing event")
-                await self.async_set_stored_data_for_key("latest_door_log", new_door_log)
-                return None
-            if CAPTURE_TIME_KEY in latest_door_log:
-                if new_door_log is not None and CAPTURE_TIME_KEY in new_door_log:
-                    # Ignore if it's the same event
-                    if str(latest_door_log[CAPTURE_TIME_KEY]) == str(new_door_log[CAPTURE_TIME_KEY]):
-                        return None
-            
-            # New event detected!
-            location = new_door_log.get("Location", "Unknown")
-            initiator = new_door_log.get("Initiator", "Unknown")
-            capture_type = new_door_log.get("CaptureType", "Unknown")
-            
-            LOGGER.info("🚪 New door event: %s at %s (%s)", initiator, location, capture_type)
-            
-            # Check if camera URL is missing
-            pic_url = new_door_log.get(PIC_URL_KEY, "")
-            
-            if not pic_url:
-                LOGGER.warning("📷 Camera URL missing for %s, attempting to retrieve...", location)
-                
-                # ALWAYS wait for camera URL (with timeout)
-                # This ensures we try to get the image before firing the event
-                new_door_log = await self.async_wait_for_camera_url(
-                    new_door_log, 
-                    max_wait_seconds=5  # Configurable timeout
-                )
-                
-                # Log final result
-                final_pic_url = new_door_log.get(PIC_URL_KEY, "")
-                if final_pic_url:
-                    LOGGER.info("✅ Camera URL retrieved successfully for %s", location)
-                else:
-                    LOGGER.warning("❌ Camera URL unavailable for %s - event will fire without image", location)
+            if self._seen_events is None:
+                self._seen_events = SeenEventIndex(self.hass)
+            if not self._seen_events.loaded:
+                await self._seen_events.async_load()
+
+            if len(self._seen_events) == 0:
+                latest_door_log = await self.async_get_stored_data_for_key("latest_door_log")
+                if latest_door_log is None:
+                    # No baseline yet (first run after install or storage wipe).
+                    # Mark the current entries as seen without firing events,
+                    # so we don't replay old historical entries as new notifications.
+                    LOGGER.debug("No baseline door log found — storing current entries as baseline without firing events")
+                    for door_log in json_data:
+                        self._seen_events.add(door_log)
+                    await self.async_set_stored_data_for_key("latest_door_log", json_data[0])
+                    return []
+                # Seed the index from the pre-index baseline
+                self._seen_events.add(latest_door_log)
+
+            # The API returns newest first; emit new events in chronological order
+            new_door_logs = []
+            for door_log in reversed(json_data):
+                if door_log is not None and self._seen_events.add(door_log):
+                    new_door_logs.append(await self._async_prepare_door_log(door_log))
+
+            if new_door_logs:
+                # Store as the latest door log
+                await self.async_set_stored_data_for_key("latest_door_log", new_door_logs[-1])
+
+            return new_door_logs
+
+    async def _async_prepare_door_log(self, new_door_log: dict) -> dict:
+        """Log a new door event and wait for its camera URL if it is missing."""
+        door_log = DoorLog.from_api(new_door_log)
+        location = door_log.location or "Unknown"
+
+        LOGGER.info("🚪 New door event: %s at %s (%s)",
+                    door_log.initiator or "Unknown", location, door_log.capture_type or "Unknown")
+
+        if not door_log.pic_url:
+            LOGGER.warning("📷 Camera URL missing for %s, attempting to retrieve...", location)
+
+            # ALWAYS wait for camera URL (with timeout)
+            # This ensures we try to get the image before firing the event
+            new_door_log = await self.async_wait_for_camera_url(
+                new_door_log,
+                max_wait_seconds=5  # Configurable timeout
+            )
+
+            # Log final result
+            door_log = DoorLog.from_api(new_door_log)
+            if door_log.pic_url:
+                LOGGER.info("✅ Camera URL retrieved successfully for %s", location)
             else:
-                LOGGER.debug("✅ Camera URL present immediately for %s", location)
-            
-            # Log the complete event details
-            LOGGER.debug("ℹ️ Door event details:")
-            LOGGER.debug(" - Initiator: %s", new_door_log.get("Initiator"))
-            LOGGER.debug(" - CaptureType: %s", new_door_log.get("CaptureType"))
-            LOGGER.debug(" - Location: %s", new_door_log.get("Location"))
-            LOGGER.debug(" - Door MAC: %s", new_door_log.get("MAC"))
-            LOGGER.debug(" - Door Relay: %s", new_door_log.get("Relay"))
-            LOGGER.debug(" - Camera URL: %s", "Present" if new_door_log.get(PIC_URL_KEY) else "Missing")
-            
-            # Store as the latest door log
-            await self.async_set_stored_data_for_key("latest_door_log", new_door_log)
-            
-            return new_door_log
+                LOGGER.warning("❌ Camera URL unavailable for %s - event will fire without image", location)
+        else:
+            LOGGER.debug("✅ Camera URL present immediately for %s", location)
+
+        # Log the complete event details
+        LOGGER.debug("ℹ️ Door event details:")
+        LOGGER.debug(" - Initiator: %s", door_log.initiator)
+        LOGGER.debug(" - CaptureType: %s", door_log.capture_type)
+        LOGGER.debug(" - Location: %s", door_log.location)
+        LOGGER.debug(" - Door MAC: %s", door_log.mac)
+        LOGGER.debug(" - Door Relay: %s", door_log.relay)
+        LOGGER.debug(" - Camera URL: %s", "Present" if door_log.pic_url else "Missing")
+
+        return new_door_log
 
     ###################
 
@@ -379,7 +450,11 @@ class AkuvoxData:
             "token": self.token,
             "auth_token": self.auth_token,
             "refresh_token": self.refresh_token,
-            "camera_data": self.camera_data,
-            "door_relay_data": self.door_relay_data,
-            "door_keys_data": self.door_keys_data
+            "camera_data": [camera.as_dict() for camera in self.camera_data],
+            "door_relay_data": [relay.as_dict() for relay in self.door_relay_data],
+            "door_keys_data": self.get_temp_keys_data()
         }
+
+    def get_temp_keys_data(self) -> list[dict]:
+        """Temporary keys in the storage schema."""
+        return [door_key.as_dict() for door_key in self.door_keys_data]
@@ -0,0 +1,73 @@
+"""Door event deduplication for akuvox."""
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import storage
+
+from .const import (
+    LOGGER,
+    CAPTURE_TIME_KEY,
+    SEEN_EVENTS_STORAGE_KEY,
+    SEEN_EVENTS_MAX,
+    SEEN_EVENTS_SAVE_DELAY,
+)
+
+EVENT_IDENTITY_KEYS = (CAPTURE_TIME_KEY, "MAC", "Relay", "Initiator", "CaptureType")
+
+
+def door_log_identity(door_log: dict) -> str:
+    """Composite identity of a door event, stored as a compact 96-bit digest."""
+    identity = "\x1f".join(str(door_log.get(key, "")) for key in EVENT_IDENTITY_KEYS)
+    return hashlib.blake2b(identity.encode(), digest_size=12).hexdigest()
+
+
+class SeenEventIndex:
+    """Bounded LRU set of door event identities that survives restarts.
+
+    Membership checks and inserts are O(1). The least recently seen identity
+    is evicted once the index is full.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_size: int = SEEN_EVENTS_MAX) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self.max_size = max_size
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._store = storage.Store(hass, 1, SEEN_EVENTS_STORAGE_KEY)
+        self.loaded = False
+
+    async def async_load(self) -> None:
+        """Load persisted identities."""
+        stored = await self._store.async_load()
+        if stored and isinstance(stored.get("seen"), list):
+            for identity in stored["seen"][-self.max_size:]:
+                self._seen[identity] = None
+        self.loaded = True
+        LOGGER.debug("🧾 Loaded %d seen door event identities", len(self._seen))
+
+    def __contains__(self, door_log: dict) -> bool:
+        """Whether the door event has already been seen."""
+        return door_log_identity(door_log) in self._seen
+
+    def __len__(self) -> int:
+        """Return the number of remembered identities."""
+        return len(self._seen)
+
+    def add(self, door_log: dict) -> bool:
+        """Mark a door event as seen. Returns True if it was new."""
+        identity = door_log_identity(door_log)
+        if identity in self._seen:
+            self._seen.move_to_end(identity)
+            return False
+        self._seen[identity] = None
+        while len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
+        self._store.async_delay_save(self._data_to_save, SEEN_EVENTS_SAVE_DELAY)
+        return True
+
+    def _data_to_save(self) -> dict:
+        """Oldest-first list of identities."""
+        return {"seen": list(self._seen)}
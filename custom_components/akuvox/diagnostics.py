@@ -0,0 +1,64 @@
+"""Diagnostics support for akuvox."""
+from __future__ import annotations
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import AkuvoxDataUpdateCoordinator
+
+TO_REDACT = {
+    "token",
+    "auth_token",
+    "refresh_token",
+    "phone_number",
+    "full_phone_number",
+    "video_url",
+    "key_code",
+    "qr_code_url",
+    "lan_devices",
+    "lan_username",
+    "lan_password",
+    "secret",
+    "secrets",
+    "urls",
+}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return diagnostics for a config entry."""
+    coordinator: AkuvoxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.client
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "devices": async_redact_data(client.get_devices_json(), TO_REDACT),
+        "metrics": client.metrics.as_dict(),
+        "tasks": client.supervisor.as_dict(),
+        "duplicate_door_presses": dict(client.door_commands.suppressed),
+        "door_open_confirmations": client.confirmations.as_dict(),
+        "door_log_backfill": client.backfill.as_dict() if client.backfill is not None else None,
+        "webhook": {
+            "active": client.webhook.active,
+            "received": client.webhook.received,
+            "suppressed_cloud_duplicates": client.webhook.suppressed,
+            "devices": len(client.webhook.secrets),
+        } if client.webhook is not None else None,
+        "watchdog": coordinator.watchdog.as_dict() if coordinator.watchdog is not None else None,
+        "attribute_sizes": attribute_size_report(client),
+    }
+
+
+def attribute_size_report(client) -> dict:
+    """State and attribute bytes per entity, largest first, and what the recorder keeps of them."""
+    entities = {entity_id: entity.attribute_sizes() for entity_id, entity in client.entities.items()}
+    ranked = dict(sorted(entities.items(), key=lambda item: item[1]["attribute_bytes"], reverse=True))
+    return {
+        "entities": len(ranked),
+        "attribute_bytes": sum(sizes["attribute_bytes"] for sizes in ranked.values()),
+        "recorded_attribute_bytes": sum(sizes["recorded_attribute_bytes"] for sizes in ranked.values()),
+        "per_entity": ranked,
+    }
@@ -0,0 +1,75 @@
+"""Per-relay coordination of door-open commands."""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from .const import LOGGER, DOOR_PRESS_DEBOUNCE_WINDOW
+
+
+class DoorCommandCoordinator:
+    """Collapses repeated presses of the same relay into one door-open request.
+
+    A press joins the request of an earlier press of the same relay while
+    that request is in flight, or while it succeeded less than `window`
+    seconds ago, and returns its result instead of sending another one.
+    A failed request is forgotten as soon as it completes, so the next
+    press retries.
+    """
+
+    def __init__(self, window: float = DOOR_PRESS_DEBOUNCE_WINDOW) -> None:
+        """Initialize the coordinator."""
+        self.window = window
+        self.suppressed: dict[str, int] = {}
+        self._requests: dict[str, tuple[float, asyncio.Future]] = {}
+
+    async def async_run(self, key: str, factory: Callable[[], Awaitable[dict]]) -> dict:
+        """Run `factory()` for a relay, or join the relay's current request."""
+        now = time.monotonic()
+        self._prune(now)
+        current = self._requests.get(key)
+        if current is not None:
+            started, future = current
+            if not future.done() or (now - started < self.window and self._succeeded(future)):
+                self.suppressed[key] = self.suppressed.get(key, 0) + 1
+                LOGGER.debug("🚪 Duplicate press of %s joined the request sent %.0fms ago",
+                             key, (now - started) * 1000)
+                return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(factory())
+        self._requests[key] = (now, future)
+        future.add_done_callback(lambda done: self._request_done(key, done))
+        # Other presses may be waiting on this request, so it is not cancelled with the caller
+        return await asyncio.shield(future)
+
+    @staticmethod
+    def _succeeded(future: asyncio.Future) -> bool:
+        """Whether a completed request returned a successful result."""
+        if future.cancelled() or future.exception() is not None:
+            return False
+        result = future.result()
+        return result is not None and result.get("success", True) is not False
+
+    def _request_done(self, key: str, future: asyncio.Future) -> None:
+        """Forget a failed request, so that the next press sends a new one."""
+        if not self._succeeded(future):
+            self._forget(key, future)
+
+    def _prune(self, now: float) -> None:
+        """Drop completed requests whose window has passed."""
+        expired = [key for key, (started, future) in self._requests.items()
+                   if future.done() and now - started >= self.window]
+        for key in expired:
+            del self._requests[key]
+
+    def _forget(self, key: str, future: asyncio.Future) -> None:
+        """Drop a relay's request unless a newer one replaced it."""
+        current = self._requests.get(key)
+        if current is not None and current[1] is future:
+            del self._requests[key]
+
+    @property
+    def total_suppressed(self) -> int:
+        """Duplicate presses that joined another request."""
+        return sum(self.suppressed.values())
@@ -1,13 +1,24 @@
 """Sensor platform for akuvox."""
 # from homeassistant.components.entity import Entity
+import json
+
+from homeassistant.const import MAJOR_VERSION, MINOR_VERSION
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 from .api import AkuvoxApiClient
 
+# Home Assistant honours _unrecorded_attributes from 2023.9; older versions record every attribute
+UNRECORDED_ATTRIBUTES_SUPPORTED = (MAJOR_VERSION, MINOR_VERSION) >= (2023, 9)
+
+
 class AkuvoxEntity(Entity):
     """Akuvox temporary door key class."""
 
     entry=None
     client: AkuvoxApiClient
+    # State is pushed by coordinator refreshes, token changes and door events.
+    _attr_should_poll = False
+    _last_written_state: tuple | None = None
 
     def __init__(
         self,
@@ -42,3 +53,49 @@ class AkuvoxEntity(Entity):
         if should_override is True:
             return self.entry.options.get(key, default) # type: ignore
         return default
+
+    async def async_added_to_hass(self) -> None:
+        """Register the entity with the client for the attribute size report."""
+        await super().async_added_to_hass()
+        entity_id = self.entity_id
+        self.client.entities[entity_id] = self
+        self.async_on_remove(lambda: self.client.entities.pop(entity_id, None))
+
+    def attribute_sizes(self) -> dict:
+        """JSON size of the state and attributes as last written, and how much the recorder keeps."""
+        state = self.hass.states.get(self.entity_id) if self.hass is not None else None
+        if state is None:
+            return {"state_bytes": 0, "attribute_bytes": 0, "recorded_attribute_bytes": 0}
+        attributes = dict(state.attributes)
+        unrecorded = frozenset()
+        if UNRECORDED_ATTRIBUTES_SUPPORTED:
+            unrecorded = (getattr(self, "_entity_component_unrecorded_attributes", frozenset())
+                          | getattr(self, "_unrecorded_attributes", frozenset()))
+        recorded = {key: value for key, value in attributes.items() if key not in unrecorded}
+        return {
+            "state_bytes": len(state.state.encode()),
+            "attribute_bytes": _json_size(attributes),
+            "recorded_attribute_bytes": _json_size(recorded),
+        }
+
+    @callback
+    def async_write_ha_state_if_changed(self) -> bool:
+        """Write the entity state only if its state or attributes changed."""
+        if self.hass is None or self.entity_id is None:
+            return False
+        attributes = self.extra_state_attributes
+        snapshot = (
+            self.available,
+            self.state,
+            dict(attributes) if attributes else None,
+        )
+        if snapshot == self._last_written_state:
+            return False
+        self._last_written_state = snapshot
+        self.async_write_ha_state()
+        return True
+
+
+def _json_size(value) -> int:
+    """Bytes of a value serialised as compact JSON, as the recorder stores it."""
+    return len(json.dumps(value, separators=(",", ":"), default=str).encode())
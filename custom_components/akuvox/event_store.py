@@ -0,0 +1,263 @@
+"""Local door event history for akuvox."""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    LOGGER,
+    CAPTURE_TIME_FORMAT,
+    EVENT_STORE_MAX_EVENTS,
+    EVENT_STORE_MAX_AGE_DAYS,
+    EVENT_STORE_PRUNE_EVERY,
+    EVENT_STORE_FETCH_SIZE,
+)
+from .models import DoorLog
+
+DOOR_LOG_TIME_FORMATS = (CAPTURE_TIME_FORMAT, "%Y-%m-%d %H:%M:%S")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS door_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        capture_ts INTEGER NOT NULL,
+        capture_time TEXT NOT NULL,
+        mac TEXT NOT NULL DEFAULT '',
+        relay TEXT NOT NULL DEFAULT '',
+        initiator TEXT NOT NULL DEFAULT '',
+        capture_type TEXT NOT NULL DEFAULT '',
+        location TEXT NOT NULL DEFAULT '',
+        pic_url TEXT NOT NULL DEFAULT '',
+        payload TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_door_events_identity
+    ON door_events (capture_time, mac, relay, initiator, capture_type)
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_door_events_ts ON door_events (capture_ts)",
+    "CREATE INDEX IF NOT EXISTS idx_door_events_mac ON door_events (mac, relay, capture_ts)",
+    "CREATE INDEX IF NOT EXISTS idx_door_events_initiator ON door_events (initiator, capture_ts)",
+    "CREATE INDEX IF NOT EXISTS idx_door_events_location ON door_events (location, capture_ts)",
+)
+
+
+def parse_capture_time(raw_time) -> datetime | None:
+    """Parse a door log CaptureTime string."""
+    if not raw_time:
+        return None
+    for fmt in DOOR_LOG_TIME_FORMATS:
+        try:
+            return datetime.strptime(str(raw_time), fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _where(start, end, mac, relay, initiator, capture_type, location) -> tuple[str, list]:
+    """WHERE clause and parameters of a door event filter."""
+    clauses = []
+    params: list = []
+    if start is not None:
+        clauses.append("capture_ts >= ?")
+        params.append(int(start.timestamp()))
+    if end is not None:
+        clauses.append("capture_ts <= ?")
+        params.append(int(end.timestamp()))
+    for column, value in (("mac", mac),
+                          ("relay", relay),
+                          ("initiator", initiator),
+                          ("capture_type", capture_type),
+                          ("location", location)):
+        if value not in (None, ""):
+            clauses.append(f"{column} = ?")
+            params.append(str(value))
+    return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+
+class AkuvoxEventStore:
+    """Append-only SQLite store of door events with retention limits.
+
+    All database work runs in the executor. A single connection is shared
+    and serialised with a lock so executor threads never use it concurrently.
+    """
+
+    def __init__(self,
+                 hass: HomeAssistant,
+                 path: str,
+                 max_events: int = EVENT_STORE_MAX_EVENTS,
+                 max_age_days: int = EVENT_STORE_MAX_AGE_DAYS) -> None:
+        """Initialize the event store."""
+        self.hass = hass
+        self.path = path
+        self.max_events = max_events
+        self.max_age_days = max_age_days
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._inserts_since_prune = 0
+
+    async def async_setup(self) -> None:
+        """Open the database and create the schema."""
+        await self.hass.async_add_executor_job(self._setup)
+
+    async def async_close(self) -> None:
+        """Close the database."""
+        await self.hass.async_add_executor_job(self._close)
+
+    async def async_add_event(self, door_log: dict) -> bool:
+        """Append a door log entry. Returns False if it was already stored."""
+        return await self.hass.async_add_executor_job(self._add_events, [door_log]) > 0
+
+    async def async_add_events(self, door_logs: list[dict]) -> int:
+        """Append several door log entries and return how many were new."""
+        return await self.hass.async_add_executor_job(self._add_events, door_logs)
+
+    async def async_replace_event(self, old_door_log: dict, door_log: dict) -> bool:
+        """Replace a stored door event by another copy of the same event.
+
+        Used when the cloud door log reports an event a device already
+        pushed: the cloud copy has the device's capture time and picture.
+        """
+        return await self.hass.async_add_executor_job(self._add_events, [door_log], old_door_log) > 0
+
+    async def async_query(self,
+                          start: datetime | None = None,
+                          end: datetime | None = None,
+                          mac: str | None = None,
+                          relay: str | None = None,
+                          initiator: str | None = None,
+                          capture_type: str | None = None,
+                          location: str | None = None,
+                          limit: int = 100) -> list[dict]:
+        """Return stored door events, newest first."""
+        return await self.hass.async_add_executor_job(
+            self._query, start, end, mac, relay, initiator, capture_type, location, limit)
+
+    async def async_count(self) -> int:
+        """Return the number of stored door events."""
+        return await self.hass.async_add_executor_job(self._count)
+
+    ###################
+
+    def _setup(self) -> None:
+        with self._lock:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            self._conn.commit()
+        LOGGER.debug("🗄️ Door event history opened at %s", self.path)
+        self._prune()
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _add_events(self, door_logs: list[dict], replaces: dict | None = None) -> int:
+        rows = []
+        for door_log in door_logs:
+            record = DoorLog.from_api(door_log)
+            parsed_time = parse_capture_time(record.capture_time)
+            rows.append((
+                int(parsed_time.timestamp()) if parsed_time else int(time.time()),
+                record.capture_time,
+                record.mac,
+                record.relay,
+                record.initiator,
+                record.capture_type,
+                record.location,
+                record.pic_url,
+                json.dumps(door_log, separators=(",", ":"), default=str),
+            ))
+        with self._lock:
+            if self._conn is None:
+                return 0
+            if replaces is not None:
+                old = DoorLog.from_api(replaces)
+                self._conn.execute(
+                    "DELETE FROM door_events WHERE capture_time = ? AND mac = ? AND relay = ? "
+                    "AND initiator = ? AND capture_type = ?",
+                    (old.capture_time, old.mac, old.relay, old.initiator, old.capture_type))
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO door_events (capture_ts, capture_time, mac, relay, "
+                "initiator, capture_type, location, pic_url, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows)
+            self._conn.commit()
+            added = self._conn.total_changes - before
+
+        self._inserts_since_prune += added
+        if self._inserts_since_prune >= EVENT_STORE_PRUNE_EVERY:
+            self._prune()
+        return added
+
+    def _prune(self) -> None:
+        """Apply the age and size retention limits."""
+        self._inserts_since_prune = 0
+        with self._lock:
+            if self._conn is None:
+                return
+            if self.max_age_days > 0:
+                cutoff = int(time.time()) - self.max_age_days * 24 * 60 * 60
+                self._conn.execute("DELETE FROM door_events WHERE capture_ts < ?", (cutoff,))
+            if self.max_events > 0:
+                # Keep the most recent events by capture time: backfilled rows
+                # are inserted late but are not the newest
+                self._conn.execute(
+                    "DELETE FROM door_events WHERE (capture_ts, id) <= ("
+                    "SELECT capture_ts, id FROM door_events "
+                    "ORDER BY capture_ts DESC, id DESC LIMIT 1 OFFSET ?)",
+                    (self.max_events,))
+            self._conn.commit()
+
+    def _query(self, start, end, mac, relay, initiator, capture_type, location, limit) -> list[dict]:
+        where, params = _where(start, end, mac, relay, initiator, capture_type, location)
+        params.append(int(limit))
+
+        with self._lock:
+            if self._conn is None:
+                return []
+            cursor = self._conn.execute(
+                f"SELECT payload FROM door_events {where} "
+                "ORDER BY capture_ts DESC, id DESC LIMIT ?",
+                params)
+            return [json.loads(row[0]) for row in cursor.fetchall()]
+
+    def iter_payloads(self,
+                      start: datetime | None = None,
+                      end: datetime | None = None,
+                      mac: str | None = None,
+                      relay: str | None = None,
+                      initiator: str | None = None,
+                      capture_type: str | None = None,
+                      location: str | None = None):
+        """Yield stored door events oldest first, EVENT_STORE_FETCH_SIZE rows at a time.
+
+        Blocking: run in the executor. Uses its own read-only connection, so
+        a long export does not hold the lock that door event ingestion needs.
+        """
+        where, params = _where(start, end, mac, relay, initiator, capture_type, location)
+        conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        try:
+            cursor = conn.execute(
+                f"SELECT payload FROM door_events {where} ORDER BY capture_ts, id", params)
+            while rows := cursor.fetchmany(EVENT_STORE_FETCH_SIZE):
+                for row in rows:
+                    yield json.loads(row[0])
+        finally:
+            conn.close()
+
+    def _count(self) -> int:
+        with self._lock:
+            if self._conn is None:
+                return 0
+            return self._conn.execute("SELECT COUNT(*) FROM door_events").fetchone()[0]
@@ -0,0 +1,108 @@
+"""Streaming export of the local door event history."""
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import time
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    LOGGER,
+    EXPORT_DIRECTORY,
+    EXPORT_CSV_COLUMNS,
+)
+from .event_store import AkuvoxEventStore
+
+
+def csv_lines(door_logs: Iterable[dict]) -> Iterator[str]:
+    """Header and one CSV line per door event."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_CSV_COLUMNS)
+    # The header is written even when no event matches
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    for door_log in door_logs:
+        writer.writerow([door_log.get(column, "") for column in EXPORT_CSV_COLUMNS])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def jsonl_lines(door_logs: Iterable[dict]) -> Iterator[str]:
+    """One JSON object per line and door event."""
+    for door_log in door_logs:
+        yield json.dumps(door_log, separators=(",", ":"), default=str) + "\n"
+
+
+FORMATTERS = {
+    "csv": csv_lines,
+    "jsonl": jsonl_lines,
+}
+
+
+class DoorEventExport:
+    """Writes the door events matching a filter to a file, oldest first.
+
+    Events flow from the store's cursor through a formatter generator into
+    the file one row at a time, so memory use does not depend on the number
+    of rows exported.
+    """
+
+    def __init__(self,
+                 hass: HomeAssistant,
+                 event_store: AkuvoxEventStore,
+                 file_format: str,
+                 filters: dict) -> None:
+        """Initialize the export."""
+        self.hass = hass
+        self.event_store = event_store
+        self.file_format = file_format
+        self.filters = filters
+
+    async def async_run(self, filename: str | None = None) -> dict:
+        """Write the export file and report its size and rate."""
+        directory = self.hass.config.path(EXPORT_DIRECTORY)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Only a file name is accepted: exports always land in the export directory
+        name = os.path.basename(filename or "") or f"akuvox_door_events_{stamp}"
+        if not name.endswith(f".{self.file_format}"):
+            name = f"{name}.{self.file_format}"
+        path = os.path.join(directory, name)
+
+        started = time.perf_counter()
+        rows = await self.hass.async_add_executor_job(self._write, directory, path)
+        seconds = time.perf_counter() - started
+        rows_per_second = round(rows / seconds) if seconds > 0 else rows
+        LOGGER.info("📤 Exported %d door events to %s in %.1fs (%d rows/s)",
+                    rows, path, seconds, rows_per_second)
+        return {
+            "file": path,
+            "rows": rows,
+            "seconds": round(seconds, 3),
+            "rows_per_second": rows_per_second,
+        }
+
+    def _write(self, directory: str, path: str) -> int:
+        """Stream the matching events into the file; returns the number of rows."""
+        os.makedirs(directory, exist_ok=True)
+        rows = 0
+
+        def _counted(door_logs: Iterable[dict]) -> Iterator[dict]:
+            nonlocal rows
+            for door_log in door_logs:
+                rows += 1
+                yield door_log
+
+        lines = FORMATTERS[self.file_format](_counted(self.event_store.iter_payloads(**self.filters)))
+        partial = f"{path}.part"
+        with open(partial, "w", encoding="utf-8", newline="") as file:
+            file.writelines(lines)
+        os.replace(partial, path)
+        return rows
@@ -0,0 +1,126 @@
+"""Scheduler for temporary key activation and expiry transitions."""
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import LOGGER
+
+# A key is active while begin_time <= now <= end_time, so it only becomes
+# inactive once end_time has passed.
+EXPIRY_GRACE = timedelta(seconds=1)
+
+
+class TempKeyScheduler:
+    """Single timer driving the enabled/expired transitions of all temporary keys.
+
+    Upcoming begin/end boundaries of every tracked key are kept in one heap.
+    The scheduler sleeps until the earliest boundary, then notifies only the
+    keys whose boundary was reached.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._heap: list[tuple[datetime, int, str]] = []
+        self._counter = itertools.count()
+        self._keys: dict[str, tuple[int, Callable[[], None]]] = {}
+        self._generation = itertools.count()
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._next_wakeup: datetime | None = None
+
+    @callback
+    def async_track_key(self,
+                        key_id: str,
+                        begin_time: datetime,
+                        end_time: datetime,
+                        action: Callable[[], None]) -> CALLBACK_TYPE:
+        """Track a key's boundaries and call action when one is reached.
+
+        Tracking the same key again replaces its previous boundaries.
+        """
+        key_id = str(key_id)
+        generation = next(self._generation)
+        self._keys[key_id] = (generation, action)
+
+        now = datetime.now()
+        for boundary in (begin_time, end_time + EXPIRY_GRACE):
+            if boundary > now:
+                heapq.heappush(self._heap, (boundary, generation, key_id))
+        self._async_schedule_next()
+
+        @callback
+        def _async_untrack() -> None:
+            tracked = self._keys.get(key_id)
+            if tracked is not None and tracked[0] == generation:
+                del self._keys[key_id]
+                self._async_schedule_next()
+
+        return _async_untrack
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the pending timer and forget all keys."""
+        self._keys.clear()
+        self._heap.clear()
+        self._cancel_timer()
+
+    @callback
+    def _async_schedule_next(self) -> None:
+        """Arm the timer for the earliest boundary of a tracked key."""
+        self._discard_stale()
+        if not self._heap:
+            self._cancel_timer()
+            return
+
+        wakeup = self._heap[0][0]
+        if self._unsub_timer is not None and self._next_wakeup == wakeup:
+            return
+        self._cancel_timer()
+        self._next_wakeup = wakeup
+        delay = max((wakeup - datetime.now()).total_seconds(), 0)
+        self._unsub_timer = async_call_later(self.hass, delay, self._async_handle_boundary)
+
+    @callback
+    def _async_handle_boundary(self, _now) -> None:
+        """Notify every key whose boundary has been reached."""
+        self._unsub_timer = None
+        self._next_wakeup = None
+
+        now = datetime.now()
+        due: dict[str, Callable[[], None]] = {}
+        while self._heap and self._heap[0][0] <= now:
+            _boundary, generation, key_id = heapq.heappop(self._heap)
+            tracked = self._keys.get(key_id)
+            if tracked is not None and tracked[0] == generation:
+                due[key_id] = tracked[1]
+
+        for key_id, action in due.items():
+            LOGGER.debug("🔑 Temporary key %s reached an activation boundary", key_id)
+            try:
+                action()
+            except Exception as error:
+                LOGGER.error("❌ Error updating temporary key %s: %s", key_id, error)
+
+        self._async_schedule_next()
+
+    def _discard_stale(self) -> None:
+        """Drop heap entries of keys that were untracked or re-tracked."""
+        while self._heap:
+            _boundary, generation, key_id = self._heap[0]
+            tracked = self._keys.get(key_id)
+            if tracked is not None and tracked[0] == generation:
+                return
+            heapq.heappop(self._heap)
+
+    def _cancel_timer(self) -> None:
+        """Cancel the pending timer, if any."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._next_wakeup = None
@@ -0,0 +1,166 @@
+"""Local network transport for Akuvox devices."""
+from __future__ import annotations
+
+import asyncio
+import time
+from urllib.parse import quote
+
+import aiohttp
+import async_timeout
+
+from .const import (
+    LOGGER,
+    LAN_RELAY_TIMEOUT,
+    LAN_RETRY_AFTER,
+    LAN_RTSP_PORT,
+    LAN_RTSP_PATH,
+    LAN_RTSP_PROBE_TIMEOUT,
+)
+from .metrics import AkuvoxMetrics, ENDPOINT_OPENDOOR_LAN
+from .models import mac_key
+
+LAN_OPENDOOR_PATH = "/fcgi/do"
+
+
+def parse_lan_devices(value) -> dict[str, str]:
+    """Parse a "MAC=IP[:port]" list separated by commas, semicolons or new lines."""
+    devices = {}
+    if isinstance(value, dict):
+        items = [f"{mac}={address}" for mac, address in value.items()]
+    else:
+        items = str(value or "").replace(";", ",").replace("\n", ",").split(",")
+    for item in items:
+        if "=" not in item:
+            continue
+        mac, address = (part.strip() for part in item.split("=", 1))
+        mac = mac_key(mac)
+        if mac and address:
+            devices[mac] = address
+    return devices
+
+
+class DeviceHealth:
+    """Recent outcome of local requests to one device."""
+
+    __slots__ = ("failures", "retry_at", "last_ms")
+
+    def __init__(self) -> None:
+        """Initialize as healthy."""
+        self.failures = 0
+        self.retry_at = 0.0
+        self.last_ms: float | None = None
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the device should be tried locally first."""
+        return self.failures == 0 or time.monotonic() >= self.retry_at
+
+    def record(self, success: bool, latency_ms: float) -> None:
+        """Record a request outcome."""
+        self.last_ms = latency_ms
+        if success:
+            self.failures = 0
+        else:
+            self.failures += 1
+            self.retry_at = time.monotonic() + LAN_RETRY_AFTER
+
+
+class AkuvoxLanClient:
+    """Sends requests straight to devices on the local network, mapped by MAC."""
+
+    def __init__(self,
+                 session: aiohttp.ClientSession,
+                 devices: dict[str, str],
+                 username: str = "",
+                 password: str = "",
+                 metrics: AkuvoxMetrics | None = None) -> None:
+        """Initialize the LAN client."""
+        self._session = session
+        self.devices = devices
+        self._auth = aiohttp.BasicAuth(username, password) if username else None
+        self._credentials = {"UserName": username, "Password": password} if username else {}
+        self.metrics = metrics
+        self.health: dict[str, DeviceHealth] = {}
+        self._username = username
+        self._password = password
+
+    def address(self, mac: str) -> str | None:
+        """LAN address of a device."""
+        return self.devices.get(mac_key(mac))
+
+    def host(self, mac: str) -> str | None:
+        """LAN host (without port) of a device."""
+        address = self.address(mac)
+        return address.rsplit(":", 1)[0] if address and address.count(":") == 1 else address
+
+    def rtsp_url(self, mac: str) -> str | None:
+        """Local RTSP URL of a device's camera."""
+        host = self.host(mac)
+        if host is None:
+            return None
+        credentials = ""
+        if self._username:
+            credentials = f"{quote(self._username, safe='')}:{quote(self._password, safe='')}@"
+        return f"rtsp://{credentials}{host}:{LAN_RTSP_PORT}/{LAN_RTSP_PATH}"
+
+    async def async_probe_rtsp(self, mac: str) -> bool:
+        """Whether the device answers RTSP on the local network."""
+        host = self.host(mac)
+        if host is None:
+            return False
+        writer = None
+        try:
+            async with async_timeout.timeout(LAN_RTSP_PROBE_TIMEOUT):
+                reader, writer = await asyncio.open_connection(host, LAN_RTSP_PORT)
+                writer.write(f"OPTIONS rtsp://{host}:{LAN_RTSP_PORT}/ RTSP/1.0\r\nCSeq: 1\r\n\r\n".encode())
+                await writer.drain()
+                status_line = await reader.readline()
+        except (OSError, asyncio.TimeoutError) as error:
+            LOGGER.debug("🎥 Local RTSP probe of %s (%s) failed: %s", mac, host, error)
+            return False
+        finally:
+            if writer is not None:
+                writer.close()
+        return status_line.startswith(b"RTSP/")
+
+    def is_healthy(self, mac: str) -> bool:
+        """Whether a device's local API is worth trying before the cloud."""
+        health = self.health.get(mac_key(mac))
+        return health is None or health.healthy
+
+    async def async_trigger_relay(self, mac: str, relay_id) -> bool:
+        """Trigger a relay through the device's local HTTP API."""
+        address = self.address(mac)
+        if address is None:
+            return False
+        url = f"http://{address}{LAN_OPENDOOR_PATH}"
+        params = {"action": "OpenDoor", "DoorNum": str(relay_id), **self._credentials}
+
+        start = time.perf_counter()
+        error = None
+        try:
+            async with (async_timeout.timeout(LAN_RELAY_TIMEOUT),
+                        self._session.get(url, params=params, auth=self._auth) as resp):
+                if resp.status != 200:
+                    error = f"HTTP {resp.status}"
+                else:
+                    try:
+                        body = await resp.json(content_type=None)
+                    except ValueError:
+                        body = None
+                    if isinstance(body, dict) and str(body.get("retcode", "0")) != "0":
+                        error = f"retcode {body.get('retcode')}"
+        except asyncio.TimeoutError:
+            error = "TimeoutError"
+        except aiohttp.ClientError as client_error:
+            error = type(client_error).__name__
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.health.setdefault(mac_key(mac), DeviceHealth()).record(error is None, latency_ms)
+        if self.metrics is not None:
+            self.metrics.record(ENDPOINT_OPENDOOR_LAN, latency_ms, error)
+        if error is not None:
+            LOGGER.warning("⚠️ Local relay trigger for %s failed (%s)", mac, error)
+            return False
+        LOGGER.debug("✅ Relay %s of %s triggered locally in %.0fms", relay_id, mac, latency_ms)
+        return True
@@ -0,0 +1,173 @@
+"""Request instrumentation for akuvox."""
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+
+from .const import (
+    API_REST_SERVER_DATA,
+    API_SERVERS_LIST,
+    API_USERCONF,
+    API_OPENDOOR,
+    API_REFRESH_TOKEN,
+    API_SEND_SMS,
+    API_SMS_LOGIN,
+)
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+ENDPOINT_REST_SERVER = "rest_server"
+ENDPOINT_SERVERS_LIST = "servers_list"
+ENDPOINT_USERCONF = "userconf"
+ENDPOINT_TEMP_KEY = "tempKey"
+ENDPOINT_DOOR_LOG = "getDoorLog"
+ENDPOINT_OPENDOOR = "opendoor"
+ENDPOINT_OPENDOOR_LAN = "opendoor_lan"
+ENDPOINT_REFRESH_TOKEN = "refresh_token"
+ENDPOINT_SMS = "sms"
+ENDPOINT_GO2RTC = "go2rtc"
+ENDPOINT_OTHER = "other"
+
+
+def endpoint_for_url(url: str) -> str:
+    """Map a request URL to its logical endpoint name."""
+    path = url.split("?", 1)[0]
+    if "/tempKey/" in path:
+        return ENDPOINT_TEMP_KEY
+    if "/log/getDoorLog" in path:
+        return ENDPOINT_DOOR_LOG
+    for suffix, endpoint in ((API_REST_SERVER_DATA, ENDPOINT_REST_SERVER),
+                             (API_SERVERS_LIST, ENDPOINT_SERVERS_LIST),
+                             (API_USERCONF, ENDPOINT_USERCONF),
+                             (API_OPENDOOR, ENDPOINT_OPENDOOR),
+                             (API_REFRESH_TOKEN, ENDPOINT_REFRESH_TOKEN),
+                             (API_SEND_SMS, ENDPOINT_SMS),
+                             (API_SMS_LOGIN, ENDPOINT_SMS)):
+        if path.endswith(suffix):
+            return endpoint
+    return ENDPOINT_OTHER
+
+
+class EndpointStats:
+    """Counters and a fixed-bucket latency histogram for one endpoint."""
+
+    __slots__ = ("requests", "errors", "retries", "buckets", "total_ms", "max_ms", "last_ms")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.requests = 0
+        self.errors: dict[str, int] = {}
+        self.retries = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+
+    def record(self, latency_ms: float, error: str | None = None) -> None:
+        """Record one request."""
+        self.requests += 1
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+        self.last_ms = latency_ms
+        if error:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Upper bound (ms) of the bucket holding the given percentile."""
+        if self.requests == 0:
+            return None
+        threshold = fraction * self.requests
+        cumulative = 0
+        for index, count in enumerate(self.buckets):
+            cumulative += count
+            if cumulative >= threshold:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(LATENCY_BUCKETS_MS[index])
+                break
+        return round(self.max_ms, 1)
+
+    def as_dict(self) -> dict:
+        """Return a serialisable snapshot."""
+        return {
+            "requests": self.requests,
+            "errors": dict(self.errors),
+            "error_count": sum(self.errors.values()),
+            "retries": self.retries,
+            "avg_ms": round(self.total_ms / self.requests, 1) if self.requests else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 1),
+            "last_ms": round(self.last_ms, 1),
+            "histogram_ms": {
+                **{f"<={bound}": count for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)},
+                f">{LATENCY_BUCKETS_MS[-1]}": self.buckets[-1],
+            },
+        }
+
+
+class AkuvoxMetrics:
+    """Per-endpoint request statistics for an API client."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.started = time.monotonic()
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.queue_wait: dict[str, EndpointStats] = {}
+
+    def _stats(self, endpoint: str) -> EndpointStats:
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        return stats
+
+    def record(self, endpoint: str, latency_ms: float, error: str | None = None) -> None:
+        """Record one request to an endpoint."""
+        self._stats(endpoint).record(latency_ms, error)
+
+    def record_queue_wait(self, request_class: str, wait_ms: float) -> None:
+        """Record how long a request of a priority class waited for a slot."""
+        stats = self.queue_wait.get(request_class)
+        if stats is None:
+            stats = self.queue_wait[request_class] = EndpointStats()
+        stats.record(wait_ms)
+
+    def record_retry(self, endpoint: str) -> None:
+        """Record a retry of a request to an endpoint."""
+        self._stats(endpoint).retries += 1
+
+    @property
+    def total_requests(self) -> int:
+        """Requests made since startup."""
+        return sum(stats.requests for stats in self.endpoints.values())
+
+    @property
+    def requests_per_hour(self) -> float:
+        """Average request rate since startup."""
+        hours = max(time.monotonic() - self.started, 1) / 3600
+        return round(self.total_requests / hours, 1)
+
+    @property
+    def average_latency_ms(self) -> float | None:
+        """Average latency over all endpoints."""
+        total = self.total_requests
+        if total == 0:
+            return None
+        return round(sum(stats.total_ms for stats in self.endpoints.values()) / total, 1)
+
+    def as_dict(self) -> dict:
+        """Return a serialisable snapshot of all endpoints."""
+        return {
+            "uptime_seconds": int(time.monotonic() - self.started),
+            "total_requests": self.total_requests,
+            "requests_per_hour": self.requests_per_hour,
+            "endpoints": {
+                endpoint: stats.as_dict()
+                for endpoint, stats in sorted(self.endpoints.items())
+            },
+            "queue_wait": {
+                request_class: stats.as_dict()
+                for request_class, stats in sorted(self.queue_wait.items())
+            },
+        }
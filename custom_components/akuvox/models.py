@@ -0,0 +1,189 @@
+"""Typed records for akuvox devices, temporary keys and door logs."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .const import (
+    TEMP_KEY_QR_HOST,
+    PIC_URL_KEY,
+    CAPTURE_TIME_KEY,
+)
+
+
+def mac_key(mac) -> str:
+    """Upper-case MAC address without separators, used for lookups."""
+    return str(mac or "").replace(":", "").replace("-", "").upper()
+
+
+@dataclass(slots=True)
+class DoorRelay:
+    """A relay of an Akuvox device."""
+
+    name: str
+    door_name: str
+    relay_id: str
+    mac: str
+
+    @classmethod
+    def from_dict(cls, data: dict) -> DoorRelay:
+        """Create from the storage schema."""
+        return cls(name=data.get("name", ""),
+                   door_name=data.get("door_name", ""),
+                   relay_id=data.get("relay_id", ""),
+                   mac=data.get("mac", ""))
+
+    def as_dict(self) -> dict:
+        """Storage schema."""
+        return {"name": self.name,
+                "door_name": self.door_name,
+                "relay_id": self.relay_id,
+                "mac": self.mac}
+
+
+@dataclass(slots=True)
+class Camera:
+    """The camera of an Akuvox device."""
+
+    name: str
+    mac: str
+    video_url: str
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Camera:
+        """Create from the storage schema."""
+        return cls(name=data.get("name", ""),
+                   mac=data.get("mac", ""),
+                   video_url=data.get("video_url", ""))
+
+    def as_dict(self) -> dict:
+        """Storage schema."""
+        return {"name": self.name, "mac": self.mac, "video_url": self.video_url}
+
+
+@dataclass(slots=True)
+class TempKeyDoor:
+    """A door a temporary key opens."""
+
+    door_id: str
+    key_id: str
+    relay: str
+    mac: str
+
+    def as_dict(self) -> dict:
+        """Storage schema."""
+        return {"door_id": self.door_id,
+                "key_id": self.key_id,
+                "relay": self.relay,
+                "mac": self.mac}
+
+
+@dataclass(slots=True)
+class TempKey:
+    """A temporary door key."""
+
+    key_id: str
+    description: str
+    key_code: str
+    begin_time: str
+    end_time: str
+    access_times: int
+    allowed_times: int
+    each_allowed_times: int
+    qr_code_url: str
+    expired: bool
+    doors: list[TempKeyDoor] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict) -> TempKey:
+        """Create from a getPersonalTempKeyList / tempKey API entry."""
+        return cls(key_id=data["ID"],
+                   description=data["Description"],
+                   key_code=data["TmpKey"],
+                   begin_time=data["BeginTime"],
+                   end_time=data["EndTime"],
+                   access_times=data["AccessTimes"],
+                   allowed_times=data["AllowedTimes"],
+                   each_allowed_times=data["EachAllowedTimes"],
+                   qr_code_url=f"https://{TEMP_KEY_QR_HOST}{data['QrCodeUrl']}",
+                   # The API reports Expired=0 for keys that have expired
+                   expired=not data["Expired"],
+                   doors=[TempKeyDoor(door_id=door["ID"],
+                                      key_id=door["KeyID"],
+                                      relay=door["Relay"],
+                                      mac=door["MAC"])
+                          for door in data.get("Doors", [])])
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TempKey:
+        """Create from the storage schema."""
+        return cls(key_id=data.get("key_id", ""),
+                   description=data.get("description", ""),
+                   key_code=data.get("key_code", ""),
+                   begin_time=data.get("begin_time", ""),
+                   end_time=data.get("end_time", ""),
+                   access_times=data.get("access_times", 0),
+                   allowed_times=data.get("allowed_times", 0),
+                   each_allowed_times=data.get("each_allowed_times", 0),
+                   qr_code_url=data.get("qr_code_url", ""),
+                   expired=bool(data.get("expired", False)),
+                   doors=[TempKeyDoor(door_id=door.get("door_id", ""),
+                                      key_id=door.get("key_id", ""),
+                                      relay=door.get("relay", ""),
+                                      mac=door.get("mac", ""))
+                          for door in data.get("doors", [])])
+
+    def as_dict(self) -> dict:
+        """Storage schema."""
+        return {"key_id": self.key_id,
+                "description": self.description,
+                "key_code": self.key_code,
+                "begin_time": self.begin_time,
+                "end_time": self.end_time,
+                "access_times": self.access_times,
+                "allowed_times": self.allowed_times,
+                "each_allowed_times": self.each_allowed_times,
+                "qr_code_url": self.qr_code_url,
+                "expired": self.expired,
+                "doors": [door.as_dict() for door in self.doors]}
+
+
+@dataclass(slots=True)
+class DoorLog:
+    """A door log entry, as reported by the cloud or pushed by a device.
+
+    Fields the integration does not use are kept in `extra` so the
+    original payload can be rebuilt for events and history.
+    """
+
+    capture_time: str = ""
+    location: str = ""
+    initiator: str = ""
+    capture_type: str = ""
+    pic_url: str = ""
+    mac: str = ""
+    relay: str = ""
+    extra: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_api(cls, data: dict) -> DoorLog:
+        """Create from a getDoorLog API entry."""
+        extra = dict(data)
+        return cls(capture_time=str(extra.pop(CAPTURE_TIME_KEY, "") or ""),
+                   location=str(extra.pop("Location", "") or ""),
+                   initiator=str(extra.pop("Initiator", "") or ""),
+                   capture_type=str(extra.pop("CaptureType", "") or ""),
+                   pic_url=str(extra.pop(PIC_URL_KEY, "") or ""),
+                   mac=str(extra.pop("MAC", "") or ""),
+                   relay=str(extra.pop("Relay", "") or ""),
+                   extra=extra)
+
+    def as_dict(self) -> dict:
+        """Cloud door log schema, used for events and storage."""
+        return {CAPTURE_TIME_KEY: self.capture_time,
+                "Location": self.location,
+                "Initiator": self.initiator,
+                "CaptureType": self.capture_type,
+                PIC_URL_KEY: self.pic_url,
+                "MAC": self.mac,
+                "Relay": self.relay,
+                **self.extra}
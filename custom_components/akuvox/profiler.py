@@ -0,0 +1,151 @@
+"""On-demand profiling of the akuvox task set."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import os
+import pstats
+import time
+from collections import Counter
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    LOGGER,
+    PROFILE_DIRECTORY,
+    PROFILE_SAMPLE_INTERVAL,
+)
+from .watchdog import PACKAGE_DIR
+
+_profile_lock = asyncio.Lock()
+
+
+def coroutine_frames(coroutine) -> list:
+    """Frames of a suspended coroutine and everything it is awaiting, outermost first."""
+    frames = []
+    while coroutine is not None:
+        frame = getattr(coroutine, "cr_frame", None) or getattr(coroutine, "gi_frame", None)
+        if frame is None:
+            break
+        frames.append(frame)
+        coroutine = getattr(coroutine, "cr_await", None) or getattr(coroutine, "gi_yieldfrom", None)
+    return frames
+
+
+def is_akuvox_frame(frame) -> bool:
+    """Whether a frame runs akuvox code."""
+    return frame.f_code.co_filename.startswith(PACKAGE_DIR)
+
+
+def task_location(frames: list) -> str:
+    """Innermost akuvox location a task is suspended at."""
+    for frame in reversed(frames):
+        if is_akuvox_frame(frame):
+            code = frame.f_code
+            return f"{os.path.basename(code.co_filename)}:{frame.f_lineno} ({code.co_name})"
+    return "unknown"
+
+
+def akuvox_tasks() -> list[tuple[asyncio.Task, list]]:
+    """Return the running tasks with akuvox code anywhere in their await chain."""
+    tasks = []
+    for task in asyncio.all_tasks():
+        frames = coroutine_frames(task.get_coro())
+        if any(is_akuvox_frame(frame) for frame in frames):
+            tasks.append((task, frames))
+    return tasks
+
+
+def format_task(task: asyncio.Task, frames: list) -> str:
+    """Task name, coroutine and await chain as a stack trace."""
+    lines = [f"Task {task.get_name()} ({task.get_coro().__qualname__})"]
+    for frame in frames:
+        code = frame.f_code
+        lines.append(f'  File "{code.co_filename}", line {frame.f_lineno}, in {code.co_name}')
+    return "\n".join(lines)
+
+
+class AkuvoxProfiler:
+    """Profiles the event loop and samples akuvox tasks for a fixed duration."""
+
+    def __init__(self, hass: HomeAssistant, duration: float) -> None:
+        """Initialize the profiler."""
+        self.hass = hass
+        self.duration = duration
+        self.samples = 0
+        self.task_samples: Counter = Counter()
+        self.location_samples: Counter = Counter()
+        self.task_dumps: dict[str, str] = {}
+
+    async def async_run(self) -> dict:
+        """Profile for the configured duration and write the results."""
+        if _profile_lock.locked():
+            raise RuntimeError("A profile is already running")
+
+        async with _profile_lock:
+            LOGGER.info("🔬 Profiling akuvox tasks for %ss", self.duration)
+            profiler = cProfile.Profile()
+            started = time.monotonic()
+            profiler.enable()
+            try:
+                while time.monotonic() - started < self.duration:
+                    self._sample()
+                    await asyncio.sleep(PROFILE_SAMPLE_INTERVAL)
+            finally:
+                profiler.disable()
+
+            # Stack traces of the akuvox tasks as they are at the end of the run
+            self._sample(dump=True)
+
+            directory = self.hass.config.path(PROFILE_DIRECTORY)
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            files = await self.hass.async_add_executor_job(
+                self._write_results, profiler, directory, stamp)
+            LOGGER.info("🔬 Profile written to %s", directory)
+            return {
+                "files": files,
+                "samples": self.samples,
+                "tasks": dict(self.task_samples.most_common()),
+            }
+
+    def _sample(self, dump: bool = False) -> None:
+        """Record which akuvox tasks exist and where they are suspended."""
+        self.samples += 1
+        for task, frames in akuvox_tasks():
+            name = task.get_coro().__qualname__
+            self.task_samples[name] += 1
+            self.location_samples[task_location(frames)] += 1
+            if dump:
+                self.task_dumps[f"{task.get_name()} {name}"] = format_task(task, frames)
+
+    def _write_results(self, profiler: cProfile.Profile, directory: str, stamp: str) -> dict:
+        """Write the pstats file, a readable summary and the task dump."""
+        os.makedirs(directory, exist_ok=True)
+        files = {
+            "pstats": os.path.join(directory, f"akuvox_{stamp}.prof"),
+            "summary": os.path.join(directory, f"akuvox_{stamp}_summary.txt"),
+            "tasks": os.path.join(directory, f"akuvox_{stamp}_tasks.txt"),
+        }
+        profiler.dump_stats(files["pstats"])
+
+        summary = io.StringIO()
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PACKAGE_DIR, 50)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(30)
+        with open(files["summary"], "w", encoding="utf-8") as file:
+            file.write(summary.getvalue())
+
+        with open(files["tasks"], "w", encoding="utf-8") as file:
+            file.write(f"Akuvox tasks sampled {self.samples} times over {self.duration}s\n\n")
+            file.write("Samples per task:\n")
+            for name, count in self.task_samples.most_common():
+                file.write(f"  {count:6d}  {name}\n")
+            file.write("\nSamples per suspension point:\n")
+            for location, count in self.location_samples.most_common():
+                file.write(f"  {count:6d}  {location}\n")
+            file.write("\nTask stacks at the end of the profile:\n\n")
+            for dump in self.task_dumps.values():
+                file.write(f"{dump}\n\n")
+        return files
@@ -0,0 +1,124 @@
+"""Prioritised admission of akuvox cloud requests."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+
+from .const import (
+    REQUEST_CLASS_LIMITS,
+    REQUEST_SHARED_LIMIT,
+)
+from .metrics import (
+    AkuvoxMetrics,
+    ENDPOINT_OPENDOOR,
+    ENDPOINT_DOOR_LOG,
+    ENDPOINT_SMS,
+)
+
+CLASS_INTERACTIVE = "interactive"
+CLASS_EVENTS = "events"
+CLASS_BACKGROUND = "background"
+
+# Lower value = served first
+CLASS_PRIORITY = {
+    CLASS_INTERACTIVE: 0,
+    CLASS_EVENTS: 1,
+    CLASS_BACKGROUND: 2,
+}
+
+ENDPOINT_CLASSES = {
+    ENDPOINT_OPENDOOR: CLASS_INTERACTIVE,
+    ENDPOINT_SMS: CLASS_INTERACTIVE,
+    ENDPOINT_DOOR_LOG: CLASS_EVENTS,
+}
+
+
+def request_class_for_endpoint(endpoint: str) -> str:
+    """Return the default priority class of an endpoint."""
+    return ENDPOINT_CLASSES.get(endpoint, CLASS_BACKGROUND)
+
+
+class RequestScheduler:
+    """Admits cloud requests by priority class.
+
+    Each class has its own concurrency limit. Event ingestion and background
+    requests also share REQUEST_SHARED_LIMIT slots; interactive requests
+    (door presses, sign-in) are never held back by the other classes. When a
+    slot frees up, the waiting request of the highest class goes first.
+    """
+
+    def __init__(self,
+                 metrics: AkuvoxMetrics | None = None,
+                 limits: dict[str, int] | None = None,
+                 shared_limit: int = REQUEST_SHARED_LIMIT) -> None:
+        """Initialize the scheduler."""
+        self.metrics = metrics
+        self.limits = dict(limits or REQUEST_CLASS_LIMITS)
+        self.shared_limit = shared_limit
+        self.running: dict[str, int] = dict.fromkeys(CLASS_PRIORITY, 0)
+        self._waiting: list[tuple[int, int, str, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    @asynccontextmanager
+    async def slot(self, request_class: str):
+        """Hold a request slot of the given class for the duration of the block."""
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (CLASS_PRIORITY[request_class],
+                                       next(self._sequence),
+                                       request_class,
+                                       future))
+        self._grant()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the cancellation: hand the slot on
+                self._release(request_class)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_queue_wait(request_class, (time.perf_counter() - start) * 1000)
+        try:
+            yield
+        finally:
+            self._release(request_class)
+
+    @property
+    def queued(self) -> int:
+        """Requests waiting for a slot."""
+        return sum(1 for entry in self._waiting if not entry[3].done())
+
+    def _shared_running(self) -> int:
+        return sum(count for request_class, count in self.running.items()
+                   if request_class != CLASS_INTERACTIVE)
+
+    def _has_capacity(self, request_class: str) -> bool:
+        if self.running[request_class] >= self.limits.get(request_class, 1):
+            return False
+        return request_class == CLASS_INTERACTIVE or self._shared_running() < self.shared_limit
+
+    def _acquire(self, request_class: str) -> None:
+        self.running[request_class] += 1
+
+    def _release(self, request_class: str) -> None:
+        self.running[request_class] -= 1
+        self._grant()
+
+    def _grant(self) -> None:
+        """Hand free slots to waiting requests, highest class first."""
+        held_back = []
+        while self._waiting:
+            entry = heapq.heappop(self._waiting)
+            future = entry[3]
+            if future.done():
+                continue
+            if self._has_capacity(entry[2]):
+                self._acquire(entry[2])
+                future.set_result(None)
+            else:
+                held_back.append(entry)
+        for entry in held_back:
+            heapq.heappush(self._waiting, entry)
@@ -1,11 +1,20 @@
 """Sensor platform for akuvox."""
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers import storage
+from homeassistant.helpers import entity_registry as er, storage
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.const import EntityCategory
 from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 
+from .analytics import (
+    DIMENSION_DOOR,
+    DIMENSION_RELAY,
+    DIMENSION_CAPTURE_TYPE,
+    DIMENSION_INITIATOR,
+)
 from .api import AkuvoxApiClient
 from .coordinator import AkuvoxDataUpdateCoordinator
 from .const import (
@@ -13,9 +22,18 @@ from .const import (
     LOGGER,
     NAME,
     VERSION,
-    DATA_STORAGE_KEY
+    DATA_STORAGE_KEY,
+    SIGNAL_TOKEN_UPDATED,
+    SIGNAL_TEMP_KEYS_ADDED,
+    SIGNAL_TEMP_KEYS_REMOVED,
+    SIGNAL_DOOR_ANALYTICS_UPDATED,
+    TEMP_KEY_DATE_FORMAT,
+    METRICS_SENSOR_UPDATE_INTERVAL,
+    DOOR_ANALYTICS_TOP_INITIATORS,
 )
 from .entity import AkuvoxEntity
+from .models import mac_key
+from .watchdog import LoopWatchdog
 
 async def async_setup_entry(hass, entry, async_add_devices):
     """Set up the temporary door key platform and token sensor."""
@@ -26,42 +44,80 @@ async def async_setup_entry(hass, entry, async_add_devices):
     store = storage.Store(hass, 1, DATA_STORAGE_KEY)
     device_data: dict = await store.async_load() # type: ignore
     door_keys_data = device_data["door_keys_data"]
-    date_format = "%d-%m-%Y %H:%M:%S"
 
     entities = []
     for door_key_data in door_keys_data:
-        key_id = door_key_data["key_id"]
-        description = door_key_data["description"]
-        key_code=door_key_data["key_code"]
-        begin_time = datetime.strptime(str(door_key_data["begin_time"]), date_format)
-        end_time = datetime.strptime(str(door_key_data["end_time"]), date_format)
-        allowed_times=door_key_data["allowed_times"]
-        access_times=door_key_data["access_times"]
-        qr_code_url=door_key_data["qr_code_url"]
-
-        entities.append(
-            AkuvoxTemporaryDoorKey(
-                client=client,
-                entry=entry,
-                key_id=key_id,
-                description=description,
-                key_code=key_code,
-                begin_time=begin_time,
-                end_time=end_time,
-                allowed_times=allowed_times,
-                access_times=access_times,
-                qr_code_url=qr_code_url,
-            )
-        )
+        entities.append(create_temp_key_entity(client, entry, door_key_data))
 
     entities.append(AkuvoxTokenSensor(client=client, entry=entry))
     entities.append(AkuvoxLastDoorEventSensor(hass=hass, client=client, entry=entry))
+    door_names = {}
+    for door_relay in device_data.get("door_relay_data", []):
+        door_names.setdefault(mac_key(door_relay["mac"]), door_relay["name"])
+    for mac, name in door_names.items():
+        entities.append(AkuvoxDoorActivitySensor(client=client, entry=entry, name=name, mac=mac))
+    entities.append(AkuvoxDoorEventsByTypeSensor(client=client, entry=entry))
+    entities.append(AkuvoxDoorEventsByInitiatorSensor(client=client, entry=entry))
+    entities.append(AkuvoxApiRequestsSensor(client=client, entry=entry))
+    entities.append(AkuvoxApiLatencySensor(client=client, entry=entry))
+    if coordinator.watchdog is not None:
+        entities.append(AkuvoxEventLoopLagSensor(client=client,
+                                                 entry=entry,
+                                                 watchdog=coordinator.watchdog))
 
     async_add_devices(entities)
 
+    @callback
+    def _async_add_temp_keys(new_door_keys_data: list) -> None:
+        """Add entities for temporary keys created at runtime."""
+        async_add_devices([
+            create_temp_key_entity(client, entry, door_key_data)
+            for door_key_data in new_door_keys_data
+        ])
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_TEMP_KEYS_ADDED, _async_add_temp_keys)
+    )
+
+def create_temp_key_entity(client: AkuvoxApiClient, entry, door_key_data: dict):
+    """Create a temporary door key entity from parsed key data."""
+    date_format = TEMP_KEY_DATE_FORMAT
+    key_id = door_key_data["key_id"]
+    description = door_key_data["description"]
+    key_code=door_key_data["key_code"]
+    begin_time = datetime.strptime(str(door_key_data["begin_time"]), date_format)
+    end_time = datetime.strptime(str(door_key_data["end_time"]), date_format)
+    allowed_times=door_key_data["allowed_times"]
+    access_times=door_key_data["access_times"]
+    qr_code_url=door_key_data["qr_code_url"]
+
+    return AkuvoxTemporaryDoorKey(
+        client=client,
+        entry=entry,
+        key_id=key_id,
+        description=description,
+        key_code=key_code,
+        begin_time=begin_time,
+        end_time=end_time,
+        allowed_times=allowed_times,
+        access_times=access_times,
+        qr_code_url=qr_code_url,
+    )
+
 class AkuvoxTemporaryDoorKey(SensorEntity, AkuvoxEntity):
     """Akuvox temporary door key class."""
 
+    # Fixed for the life of the key, or secret: kept on the state but not in the recorder (2023.9+)
+    _unrecorded_attributes = frozenset({
+        "key_id",
+        "description",
+        "key_code",
+        "begin_time",
+        "end_time",
+        "allowed_times",
+        "qr_code_url",
+    })
+
     def __init__(
         self,
         client: AkuvoxApiClient,
@@ -91,6 +147,7 @@ class AkuvoxTemporaryDoorKey(SensorEntity, AkuvoxEntity):
         self.access_times = access_times
         self.qr_code_url = qr_code_url
         self.expired = False
+        self._unsub_boundaries = None
 
         name = f"{self.description} {self.key_id}".strip()
         self._attr_unique_id = name
@@ -107,6 +164,88 @@ class AkuvoxTemporaryDoorKey(SensorEntity, AkuvoxEntity):
             manufacturer=NAME,
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to coordinator refreshes and key activation boundaries."""
+        await super().async_added_to_hass()
+        coordinator: AkuvoxDataUpdateCoordinator = self.hass.data[DOMAIN][self.entry.entry_id] # type: ignore
+        self.async_on_remove(
+            coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+        self._track_boundaries()
+        self.async_on_remove(self._untrack_boundaries)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_TEMP_KEYS_REMOVED, self._handle_keys_removed
+            )
+        )
+
+    @callback
+    def _handle_keys_removed(self, key_ids: list) -> None:
+        """Remove this entity when its key has been revoked."""
+        if str(self.key_id) not in {str(key_id) for key_id in key_ids}:
+            return
+        LOGGER.debug("Removing revoked temporary door key '%s'", self._attr_unique_id)
+        registry = er.async_get(self.hass)
+        if self.registry_entry is not None:
+            registry.async_remove(self.entity_id)
+        else:
+            self.hass.async_create_task(self.async_remove(force_remove=True))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Apply refreshed key data and write state only if it changed."""
+        door_key = self.client._data.temp_key(self.key_id)
+        if door_key is not None:
+            old_times = (self.begin_time, self.end_time)
+            self.update_from_key_data(door_key.as_dict())
+            if (self.begin_time, self.end_time) != old_times:
+                self._track_boundaries()
+        self._handle_key_boundary()
+
+    @callback
+    def _handle_key_boundary(self) -> None:
+        """Re-evaluate the enabled/expired attributes."""
+        self._attr_extra_state_attributes = self.to_dict()
+        self.async_write_ha_state_if_changed()
+
+    @callback
+    def _track_boundaries(self) -> None:
+        """Register the key's begin/end times with the shared scheduler."""
+        coordinator: AkuvoxDataUpdateCoordinator = self.hass.data[DOMAIN][self.entry.entry_id] # type: ignore
+        self._unsub_boundaries = coordinator.key_scheduler.async_track_key(
+            key_id=self.key_id,
+            begin_time=self.begin_time,
+            end_time=self.end_time,
+            action=self._handle_key_boundary,
+        )
+
+    @callback
+    def _untrack_boundaries(self) -> None:
+        """Stop tracking the key's boundaries."""
+        if self._unsub_boundaries is not None:
+            self._unsub_boundaries()
+            self._unsub_boundaries = None
+
+    def update_from_key_data(self, door_key_data: dict) -> None:
+        """Update the key's values from a parsed temp key dictionary."""
+        self.description = door_key_data.get("description", self.description)
+        self.key_code = door_key_data.get("key_code", self.key_code)
+        self.allowed_times = door_key_data.get("allowed_times", self.allowed_times)
+        self.access_times = door_key_data.get("access_times", self.access_times)
+        self.qr_code_url = door_key_data.get("qr_code_url", self.qr_code_url)
+        try:
+            self.begin_time = datetime.strptime(str(door_key_data["begin_time"]), TEMP_KEY_DATE_FORMAT)
+            self.end_time = datetime.strptime(str(door_key_data["end_time"]), TEMP_KEY_DATE_FORMAT)
+        except (KeyError, ValueError) as error:
+            LOGGER.debug("Unable to parse times for temporary key '%s': %s", self.key_id, error)
+
+    @property
+    def native_value(self):
+        """Short key status: active, pending or expired."""
+        if self.is_key_active():
+            return "active"
+        return "pending" if datetime.now() < self.begin_time else "expired"
+
     def is_key_active(self):
         """Check if the key is currently active based on the begin_time and end_time."""
         current_time = datetime.now()
@@ -130,6 +269,9 @@ class AkuvoxTemporaryDoorKey(SensorEntity, AkuvoxEntity):
 class AkuvoxLastDoorEventSensor(SensorEntity, AkuvoxEntity):
     """Sensor that tracks the last door event timestamp and metadata."""
 
+    # Signed picture URLs change on every event and the parsed time repeats the state
+    _unrecorded_attributes = frozenset({"pic_url", "parsed_time", "mac"})
+
     def __init__(self, hass, client: AkuvoxApiClient, entry) -> None:
         """Initialize the last door event sensor."""
         super().__init__(client=client, entry=entry)
@@ -166,7 +308,7 @@ class AkuvoxLastDoorEventSensor(SensorEntity, AkuvoxEntity):
         def _handle_door_event(event):
             """Handle incoming akuvox_door_update events."""
             self._apply_door_log(event.data)
-            self.async_write_ha_state()
+            self.async_write_ha_state_if_changed()
 
         self._unsub = self._hass.bus.async_listen(
             "akuvox_door_update", _handle_door_event
@@ -211,6 +353,164 @@ class AkuvoxLastDoorEventSensor(SensorEntity, AkuvoxEntity):
         }
 
 
+class AkuvoxDoorAnalyticsSensor(SensorEntity, AkuvoxEntity):
+    """Base class for sensors reporting rolling door event counts.
+
+    The counts are kept incrementally by the client's DoorAnalytics and the
+    sensors are written when a door event is ingested. While events are
+    still inside a window, a one-shot refresh at the next bucket boundary
+    (every minute while the hourly count is non-zero) lets the counts decay
+    without polling.
+    """
+
+    _attr_native_unit_of_measurement = "events"
+
+    def __init__(self, client: AkuvoxApiClient, entry, mac: str | None = None) -> None:
+        """Initialize the door analytics sensor for one device, or all devices."""
+        super().__init__(client=client, entry=entry)
+        self._mac = mac
+        self._unsub_decay = None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to door analytics updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_DOOR_ANALYTICS_UPDATED, self._handle_update
+            )
+        )
+        self.async_on_remove(self._cancel_decay)
+        self._schedule_decay()
+
+    @callback
+    def _handle_update(self, *_args) -> None:
+        """Write the new counts and arm the decay refresh."""
+        self.async_write_ha_state_if_changed()
+        self._schedule_decay()
+
+    @callback
+    def _schedule_decay(self) -> None:
+        if self._unsub_decay is not None:
+            return
+        next_change = self.client.analytics.next_change(DIMENSION_DOOR, self._mac)
+        if next_change is None:
+            return
+        self._unsub_decay = async_call_later(
+            self.hass, max(0.0, next_change - time.time()), self._handle_decay)
+
+    @callback
+    def _handle_decay(self, _now) -> None:
+        self._unsub_decay = None
+        self._handle_update()
+
+    @callback
+    def _cancel_decay(self) -> None:
+        if self._unsub_decay is not None:
+            self._unsub_decay()
+            self._unsub_decay = None
+
+
+class AkuvoxDoorActivitySensor(AkuvoxDoorAnalyticsSensor):
+    """Door events of one device in the last day, with hourly and weekly counts."""
+
+    _unrecorded_attributes = frozenset({"relays"})
+
+    def __init__(self, client: AkuvoxApiClient, entry, name: str, mac: str) -> None:
+        """Initialize the door activity sensor."""
+        super().__init__(client=client, entry=entry, mac=mac)
+        self._attr_name = f"{name} Door Events"
+        self._attr_unique_id = f"akuvox_door_events_{mac.lower()}_sensor"
+        self._attr_icon = "mdi:door-sliding"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, name)},  # type: ignore
+            name=name,
+            model=VERSION,
+            manufacturer=NAME,
+        )
+
+    @property
+    def native_value(self):
+        """Door events of the device in the last 24 hours."""
+        return self.client.analytics.counts(DIMENSION_DOOR, self._mac)["last_day"]
+
+    @property
+    def extra_state_attributes(self):
+        """Rolling counts of the device and of each of its relays."""
+        attributes = self.client.analytics.counts(DIMENSION_DOOR, self._mac)
+        prefix = f"{self._mac}_"
+        attributes["relays"] = {
+            key[len(prefix):]: counts
+            for key, counts in self.client.analytics.breakdown(DIMENSION_RELAY).items()
+            if key.startswith(prefix)
+        }
+        return attributes
+
+
+class AkuvoxDoorEventsBreakdownSensor(AkuvoxDoorAnalyticsSensor):
+    """Door events of all devices in the last day, broken down by a door log field.
+
+    The breakdown is a large attribute that changes with every door event,
+    so these sensors are disabled by default.
+    """
+
+    _attr_entity_registry_enabled_default = False
+    dimension: str = ""
+    attribute: str = ""
+    limit: int | None = None
+
+    def __init__(self, client: AkuvoxApiClient, entry) -> None:
+        """Initialize the door events breakdown sensor."""
+        super().__init__(client=client, entry=entry)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "Akuvox Last Door Event")},
+            name="Akuvox Last Door Event",
+            model=VERSION,
+            manufacturer=NAME,
+        )
+
+    @property
+    def native_value(self):
+        """Door events of all devices in the last 24 hours."""
+        return sum(counts["last_day"]
+                   for counts in self.client.analytics.breakdown(DIMENSION_DOOR).values())
+
+    @property
+    def extra_state_attributes(self):
+        """Rolling counts per value seen in the last week, busiest first."""
+        return {self.attribute: self.client.analytics.breakdown(self.dimension, self.limit)}
+
+
+class AkuvoxDoorEventsByTypeSensor(AkuvoxDoorEventsBreakdownSensor):
+    """Door events per capture type (face, card, PIN, app...)."""
+
+    dimension = DIMENSION_CAPTURE_TYPE
+    attribute = "capture_types"
+    _unrecorded_attributes = frozenset({"capture_types"})
+
+    def __init__(self, client: AkuvoxApiClient, entry) -> None:
+        """Initialize the door events by type sensor."""
+        super().__init__(client=client, entry=entry)
+        self._attr_name = "Akuvox Door Events By Type"
+        self._attr_unique_id = "akuvox_door_events_by_type_sensor"
+        self._attr_icon = "mdi:chart-bar"
+
+
+class AkuvoxDoorEventsByInitiatorSensor(AkuvoxDoorEventsBreakdownSensor):
+    """Door events per initiator, limited to the busiest initiators."""
+
+    dimension = DIMENSION_INITIATOR
+    attribute = "initiators"
+    limit = DOOR_ANALYTICS_TOP_INITIATORS
+    _unrecorded_attributes = frozenset({"initiators"})
+
+    def __init__(self, client: AkuvoxApiClient, entry) -> None:
+        """Initialize the door events by initiator sensor."""
+        super().__init__(client=client, entry=entry)
+        self._attr_name = "Akuvox Door Events By Initiator"
+        self._attr_unique_id = "akuvox_door_events_by_initiator_sensor"
+        self._attr_icon = "mdi:account-group"
+
+
 class AkuvoxTokenSensor(SensorEntity, AkuvoxEntity):
     """Sensor to display a masked view of the Akuvox API token."""
 
@@ -228,6 +528,15 @@ class AkuvoxTokenSensor(SensorEntity, AkuvoxEntity):
             manufacturer=NAME,
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to token changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_TOKEN_UPDATED, self.async_write_ha_state_if_changed
+            )
+        )
+
     @property
     def native_value(self):
         """Return the masked Akuvox API token."""
@@ -239,3 +548,99 @@ class AkuvoxTokenSensor(SensorEntity, AkuvoxEntity):
             return token
         else:
             return "Unavailable"
+
+
+class AkuvoxApiMetricsSensor(SensorEntity, AkuvoxEntity):
+    """Base class for diagnostic sensors reporting API request metrics."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, client: AkuvoxApiClient, entry) -> None:
+        """Initialize the API metrics sensor."""
+        super().__init__(client=client, entry=entry)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "Akuvox API")},
+            name="Akuvox API",
+            model=VERSION,
+            manufacturer=NAME,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the metrics periodically; request rates change too often to push."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._handle_interval,
+                timedelta(seconds=METRICS_SENSOR_UPDATE_INTERVAL),
+            )
+        )
+
+    @callback
+    def _handle_interval(self, _now) -> None:
+        """Write the latest metrics if they changed."""
+        self.async_write_ha_state_if_changed()
+
+
+class AkuvoxApiRequestsSensor(AkuvoxApiMetricsSensor):
+    """Diagnostic sensor with the API request rate.
+
+    The per-endpoint counters change every refresh and are only in the
+    diagnostics download, so the recorder keeps just the rate.
+    """
+
+    def __init__(self, client: AkuvoxApiClient, entry) -> None:
+        """Initialize the API requests sensor."""
+        super().__init__(client=client, entry=entry)
+        self._attr_name = "Akuvox API Requests"
+        self._attr_unique_id = "akuvox_api_requests_sensor"
+        self._attr_icon = "mdi:cloud-sync"
+        self._attr_native_unit_of_measurement = "requests/h"
+
+    @property
+    def native_value(self):
+        """Average requests per hour since startup."""
+        return self.client.metrics.requests_per_hour
+
+
+
+class AkuvoxApiLatencySensor(AkuvoxApiMetricsSensor):
+    """Diagnostic sensor with the API request latency; per-endpoint percentiles are in the diagnostics."""
+
+    def __init__(self, client: AkuvoxApiClient, entry) -> None:
+        """Initialize the API latency sensor."""
+        super().__init__(client=client, entry=entry)
+        self._attr_name = "Akuvox API Latency"
+        self._attr_unique_id = "akuvox_api_latency_sensor"
+        self._attr_icon = "mdi:timer-outline"
+        self._attr_native_unit_of_measurement = "ms"
+
+    @property
+    def native_value(self):
+        """Average latency over all endpoints."""
+        return self.client.metrics.average_latency_ms
+
+
+
+class AkuvoxEventLoopLagSensor(AkuvoxApiMetricsSensor):
+    """Diagnostic sensor with event loop lag; stalls by code location and lock holds are in the diagnostics."""
+
+    def __init__(self, client: AkuvoxApiClient, entry, watchdog: LoopWatchdog) -> None:
+        """Initialize the event loop lag sensor."""
+        super().__init__(client=client, entry=entry)
+        self.watchdog = watchdog
+        self._attr_name = "Akuvox Event Loop Lag"
+        self._attr_unique_id = "akuvox_event_loop_lag_sensor"
+        self._attr_icon = "mdi:timer-alert-outline"
+        self._attr_native_unit_of_measurement = "ms"
+
+    @property
+    def native_value(self):
+        """95th percentile of the recent event loop lag."""
+        return self.watchdog.lag_p95_ms
+
+    @property
+    def extra_state_attributes(self):
+        """Worst lag and number of stalls."""
+        snapshot = self.watchdog.as_dict()
+        return {"max_lag_ms": snapshot["max_lag_ms"], "stalls": snapshot["stalls"]}
@@ -0,0 +1,122 @@
+"""Supervision of the akuvox background tasks."""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Coroutine
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    LOGGER,
+    SUPERVISOR_BACKOFF_MIN,
+    SUPERVISOR_BACKOFF_MAX,
+    SUPERVISOR_STABLE_AFTER,
+)
+
+
+class SupervisedTask:
+    """A background loop and its crash history."""
+
+    __slots__ = ("name", "factory", "task", "started_at", "restarts", "last_error")
+
+    def __init__(self, name: str, factory: Callable[[], Coroutine]) -> None:
+        """Initialize the supervised task."""
+        self.name = name
+        self.factory = factory
+        self.task: asyncio.Task | None = None
+        self.started_at = 0.0
+        self.restarts = 0
+        self.last_error: str | None = None
+
+    @property
+    def alive(self) -> bool:
+        """Whether the task is running."""
+        return self.task is not None and not self.task.done()
+
+    def as_dict(self) -> dict:
+        """Return a serialisable liveness snapshot."""
+        return {
+            "alive": self.alive,
+            "uptime_s": round(time.monotonic() - self.started_at) if self.alive else None,
+            "restarts": self.restarts,
+            "last_error": self.last_error,
+        }
+
+
+class TaskSupervisor:
+    """Owns the background loops of one config entry.
+
+    Loops are started once by name, restarted with exponential backoff when
+    they crash, and all cancelled and awaited on shutdown.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the supervisor."""
+        self.hass = hass
+        self.tasks: dict[str, SupervisedTask] = {}
+        self._shutting_down = False
+
+    @callback
+    def async_start(self, name: str, factory: Callable[[], Coroutine]) -> None:
+        """Run `factory()` as a supervised loop, unless a loop with this name is running."""
+        if self._shutting_down:
+            return
+        supervised = self.tasks.get(name)
+        if supervised is not None and supervised.alive:
+            return
+        if supervised is None:
+            supervised = self.tasks[name] = SupervisedTask(name, factory)
+        supervised.factory = factory
+        supervised.task = self.hass.async_create_background_task(
+            self._async_run(supervised), f"akuvox {name}")
+
+    async def async_stop(self, name: str) -> None:
+        """Cancel a loop and wait for it to finish."""
+        supervised = self.tasks.pop(name, None)
+        if supervised is not None and supervised.task is not None:
+            supervised.task.cancel()
+            await asyncio.gather(supervised.task, return_exceptions=True)
+
+    async def async_shutdown(self) -> None:
+        """Cancel every loop and wait for all of them to finish."""
+        self._shutting_down = True
+        tasks = [supervised.task for supervised in self.tasks.values()
+                 if supervised.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        LOGGER.debug("🛑 Stopped %d background task(s)", len(tasks))
+        self.tasks.clear()
+
+    def is_alive(self, name: str) -> bool:
+        """Whether a loop is running."""
+        supervised = self.tasks.get(name)
+        return supervised is not None and supervised.alive
+
+    def as_dict(self) -> dict:
+        """Liveness of every loop."""
+        return {name: supervised.as_dict() for name, supervised in self.tasks.items()}
+
+    async def _async_run(self, supervised: SupervisedTask) -> None:
+        """Run a loop, restarting it with backoff when it raises."""
+        backoff = SUPERVISOR_BACKOFF_MIN
+        while True:
+            supervised.started_at = time.monotonic()
+            try:
+                await supervised.factory()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                supervised.restarts += 1
+                # Only the exception class: messages can carry request URLs with tokens
+                supervised.last_error = type(error).__name__
+                if time.monotonic() - supervised.started_at >= SUPERVISOR_STABLE_AFTER:
+                    backoff = SUPERVISOR_BACKOFF_MIN
+                LOGGER.error("💥 Background task '%s' crashed (%s); restarting in %ss",
+                             supervised.name, supervised.last_error, backoff, exc_info=error)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, SUPERVISOR_BACKOFF_MAX)
+                continue
+            LOGGER.debug("Background task '%s' finished", supervised.name)
+            return
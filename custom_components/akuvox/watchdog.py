@@ -0,0 +1,230 @@
+"""Event loop lag and blocking call watchdog for akuvox."""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    LOGGER,
+    WATCHDOG_TICK_INTERVAL,
+    WATCHDOG_STALL_THRESHOLD_MS,
+    WATCHDOG_LOCK_HOLD_THRESHOLD_MS,
+    WATCHDOG_LOG_INTERVAL,
+    WATCHDOG_LAG_SAMPLES,
+)
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+OTHER_CODE = "other"
+
+
+def akuvox_location(frame) -> str:
+    """Innermost akuvox frame on a stack (and the call it is blocked in), or OTHER_CODE."""
+    blocked_in = None
+    while frame is not None:
+        code = frame.f_code
+        filename = os.path.basename(code.co_filename)
+        if code.co_filename.startswith(PACKAGE_DIR):
+            location = f"{filename}:{frame.f_lineno} ({code.co_name})"
+            return f"{location} -> {blocked_in}" if blocked_in else location
+        if blocked_in is None:
+            blocked_in = f"{filename}:{frame.f_lineno}"
+        frame = frame.f_back
+    return OTHER_CODE
+
+
+class StallStats:
+    """Occurrences and worst duration of one kind of stall."""
+
+    __slots__ = ("count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, duration_ms: float) -> None:
+        """Record one occurrence."""
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def as_dict(self) -> dict:
+        """Return a serialisable snapshot."""
+        return {"count": self.count, "max_ms": round(self.max_ms, 1)}
+
+
+class InstrumentedLock(asyncio.Lock):
+    """asyncio.Lock that reports how long it was held."""
+
+    def __init__(self, name: str, on_release) -> None:
+        """Initialize the lock."""
+        super().__init__()
+        self.name = name
+        self._on_release = on_release
+        self._acquired_at = 0.0
+
+    async def acquire(self):
+        """Acquire the lock and start timing the hold."""
+        result = await super().acquire()
+        self._acquired_at = time.monotonic()
+        return result
+
+    def release(self):
+        """Release the lock and report the hold duration."""
+        held_ms = (time.monotonic() - self._acquired_at) * 1000
+        super().release()
+        self._on_release(self.name, held_ms)
+
+
+class LoopWatchdog:
+    """Opt-in detector for event loop lag, blocking calls and long lock holds.
+
+    A heartbeat scheduled on the event loop measures scheduling lag. A
+    daemon thread checks the heartbeat and, when the loop is stalled,
+    samples the loop thread's stack to attribute the stall to akuvox code.
+    """
+
+    def __init__(self, hass: HomeAssistant, client) -> None:
+        """Initialize the watchdog."""
+        self.hass = hass
+        self.client = client
+        self.lag_ms: deque[float] = deque(maxlen=WATCHDOG_LAG_SAMPLES)
+        self.max_lag_ms = 0.0
+        self.stalls: dict[str, StallStats] = {}
+        self.lock_holds: dict[str, StallStats] = {}
+        self.long_lock_holds: dict[str, StallStats] = {}
+        self._next_due = 0.0
+        self._pending_stall: str | None = None
+        self._loop_thread_id: int | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._unsub_summary = None
+        self._reported_stalls = 0
+        self._reported_long_holds = 0
+
+    @callback
+    def async_start(self) -> None:
+        """Start the heartbeat, the monitor thread and the log summary."""
+        self._loop_thread_id = threading.get_ident()
+        self._next_due = time.monotonic() + WATCHDOG_TICK_INTERVAL
+        self._handle = self.hass.loop.call_later(WATCHDOG_TICK_INTERVAL, self._tick)
+
+        data = self.client._data
+        if data is not None and not data._processing_lock.locked():
+            data._processing_lock = InstrumentedLock("_processing_lock", self._record_lock_hold)
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._monitor,
+                                        name="akuvox_watchdog",
+                                        daemon=True)
+        self._thread.start()
+        self._unsub_summary = async_track_time_interval(
+            self.hass, self._log_summary, timedelta(seconds=WATCHDOG_LOG_INTERVAL))
+        LOGGER.debug("🐕 Event loop watchdog started (stall threshold %sms)",
+                     WATCHDOG_STALL_THRESHOLD_MS)
+
+    async def async_stop(self) -> None:
+        """Stop the watchdog and restore the plain processing lock."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._unsub_summary is not None:
+            self._unsub_summary()
+            self._unsub_summary = None
+        self._stop_event.set()
+        if self._thread is not None:
+            await self.hass.async_add_executor_job(self._thread.join)
+            self._thread = None
+
+        data = self.client._data
+        if (data is not None
+                and isinstance(data._processing_lock, InstrumentedLock)
+                and not data._processing_lock.locked()):
+            data._processing_lock = asyncio.Lock()
+
+    ###################
+
+    @property
+    def lag_p95_ms(self) -> float | None:
+        """95th percentile of the recent event loop lag."""
+        if not self.lag_ms:
+            return None
+        ordered = sorted(self.lag_ms)
+        return round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 1)
+
+    def as_dict(self) -> dict:
+        """Return a serialisable snapshot, worst offenders first."""
+        def top(stats: dict[str, StallStats]) -> dict:
+            ranked = sorted(stats.items(), key=lambda item: item[1].total_ms, reverse=True)
+            return {location: value.as_dict() for location, value in ranked[:5]}
+
+        return {
+            "lag_p95_ms": self.lag_p95_ms,
+            "max_lag_ms": round(self.max_lag_ms, 1),
+            "stalls": sum(value.count for value in self.stalls.values()),
+            "akuvox_stalls": top({location: value for location, value in self.stalls.items()
+                                  if location != OTHER_CODE}),
+            "other_stalls": self.stalls[OTHER_CODE].as_dict() if OTHER_CODE in self.stalls else None,
+            "lock_holds": {name: value.as_dict() for name, value in self.lock_holds.items()},
+            "long_lock_holds": {name: value.as_dict() for name, value in self.long_lock_holds.items()},
+        }
+
+    @callback
+    def _tick(self) -> None:
+        """Heartbeat: record how late the loop ran this callback."""
+        now = time.monotonic()
+        lag_ms = max(0.0, now - self._next_due) * 1000
+        self.lag_ms.append(lag_ms)
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+        location, self._pending_stall = self._pending_stall, None
+        if location is not None:
+            self.stalls.setdefault(location, StallStats()).record(lag_ms)
+
+        self._next_due = now + WATCHDOG_TICK_INTERVAL
+        self._handle = self.hass.loop.call_later(WATCHDOG_TICK_INTERVAL, self._tick)
+
+    def _monitor(self) -> None:
+        """Sample the loop thread's stack while the heartbeat is overdue (runs in a thread)."""
+        threshold = WATCHDOG_STALL_THRESHOLD_MS / 1000
+        while not self._stop_event.wait(threshold / 2):
+            if self._pending_stall is not None:
+                continue
+            if time.monotonic() - self._next_due < threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            self._pending_stall = akuvox_location(frame)
+
+    def _record_lock_hold(self, name: str, held_ms: float) -> None:
+        self.lock_holds.setdefault(name, StallStats()).record(held_ms)
+        if held_ms >= WATCHDOG_LOCK_HOLD_THRESHOLD_MS:
+            self.long_lock_holds.setdefault(name, StallStats()).record(held_ms)
+
+    @callback
+    def _log_summary(self, _now) -> None:
+        """Log a summary when new stalls or long lock holds occurred since the last one."""
+        stalls = sum(value.count for value in self.stalls.values())
+        long_holds = sum(value.count for value in self.long_lock_holds.values())
+        if stalls == self._reported_stalls and long_holds == self._reported_long_holds:
+            return
+        summary = self.as_dict()
+        LOGGER.warning("🐕 Event loop watchdog: %d new stall(s), %d new long lock hold(s); "
+                       "lag p95 %sms, max %sms; akuvox stalls: %s; lock holds: %s",
+                       stalls - self._reported_stalls,
+                       long_holds - self._reported_long_holds,
+                       summary["lag_p95_ms"],
+                       summary["max_lag_ms"],
+                       summary["akuvox_stalls"] or "none",
+                       summary["long_lock_holds"] or "none")
+        self._reported_stalls = stalls
+        self._reported_long_holds = long_holds
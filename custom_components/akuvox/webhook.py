@@ -0,0 +1,208 @@
+"""Local Action URL receiver for door events pushed by Akuvox devices."""
+from __future__ import annotations
+
+import hmac
+import secrets
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import storage
+from homeassistant.helpers.network import NoURLAvailableError, get_url
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    CAPTURE_TIME_KEY,
+    CAPTURE_TIME_FORMAT,
+    WEBHOOK_URL,
+    WEBHOOK_STORAGE_KEY,
+    WEBHOOK_DEDUP_WINDOW,
+    WEBHOOK_RECONCILE_INTERVAL,
+)
+from .event_store import parse_capture_time
+from .models import DoorLog, mac_key
+
+WEBHOOK_VIEW_REGISTERED = f"{DOMAIN}_webhook_view_registered"
+
+# Action URL "event" parameter -> cloud door log CaptureType
+CAPTURE_TYPES = {
+    "call": "Call",
+    "relay": "Unlock",
+    "unlock": "Unlock",
+    "card": "Card Unlock",
+    "face": "Face Unlock",
+    "pin": "PIN Unlock",
+    "code": "PIN Unlock",
+}
+
+
+class AkuvoxWebhookReceiver:
+    """Turns device Action URL callbacks into door events.
+
+    Each device has its own secret. Events delivered here are remembered
+    for a while so the same event is not fired again when the cloud door
+    log poll picks it up.
+    """
+
+    def __init__(self, hass: HomeAssistant, client) -> None:
+        """Initialize the receiver."""
+        self.hass = hass
+        self.client = client
+        self.secrets: dict[str, str] = {}
+        self.active = False
+        self.received = 0
+        self.suppressed = 0
+        self._store = storage.Store(hass, 1, WEBHOOK_STORAGE_KEY)
+        self._pending: dict[str, deque] = {}
+
+    async def async_setup(self) -> None:
+        """Load the device secrets and register the view once per Home Assistant instance."""
+        self.secrets = dict((await self._store.async_load() or {}).get("secrets", {}))
+        if not self.hass.data.get(WEBHOOK_VIEW_REGISTERED):
+            self.hass.http.register_view(AkuvoxWebhookView(self.hass))
+            self.hass.data[WEBHOOK_VIEW_REGISTERED] = True
+
+    async def async_ensure_secrets(self) -> None:
+        """Create a secret for every known device that does not have one."""
+        added = False
+        for relay in self.client._data.door_relay_data:
+            mac = mac_key(relay.mac)
+            if mac and mac not in self.secrets:
+                self.secrets[mac] = secrets.token_urlsafe(16)
+                added = True
+        if added:
+            await self._store.async_save({"secrets": self.secrets})
+
+    def verify(self, mac: str, secret: str) -> bool:
+        """Whether a callback carries the device's secret."""
+        expected = self.secrets.get(mac_key(mac))
+        return expected is not None and hmac.compare_digest(expected, str(secret or ""))
+
+    def urls(self) -> dict:
+        """Return the Action URL to configure on each device, by door location and relay."""
+        try:
+            base_url = get_url(self.hass, prefer_external=False, allow_cloud=False)
+        except NoURLAvailableError:
+            base_url = "http://<home-assistant>:8123"
+        urls: dict[str, dict[str, str]] = {}
+        for relay in self.client._data.door_relay_data:
+            mac = mac_key(relay.mac)
+            if mac not in self.secrets:
+                continue
+            path = WEBHOOK_URL.format(mac=mac)
+            urls.setdefault(relay.name, {})[relay.door_name or f"Relay {relay.relay_id}"] = (
+                f"{base_url}{path}?secret={self.secrets[mac]}&event=relay"
+                f"&relay={relay.relay_id}&user=$user_name")
+        return urls
+
+    async def async_handle_action(self, mac: str, params: dict) -> None:
+        """Fire a door event for a device callback."""
+        mac = mac_key(mac)
+        now = datetime.now()
+        event = str(params.get("event", "")).strip()
+        door_log = DoorLog(
+            capture_time=now.strftime(CAPTURE_TIME_FORMAT),
+            location=self._location(mac),
+            initiator=str(params.get("user") or params.get("initiator") or ""),
+            capture_type=CAPTURE_TYPES.get(event.lower(), event or "Action URL"),
+            mac=mac,
+            relay=str(params.get("relay", "")),
+        )
+
+        self._expire_pending()
+        pushed = door_log.as_dict()
+        self._pending.setdefault(mac, deque()).append((now, door_log.relay, time.monotonic(), pushed))
+        self.received += 1
+        if not self.active:
+            LOGGER.info("📨 Door events are now pushed by the devices; polling the cloud every %ss",
+                        WEBHOOK_RECONCILE_INTERVAL)
+        self.active = True
+        await self.client.async_handle_new_door_log(pushed)
+
+    def consume_match(self, door_log: dict) -> dict | None:
+        """Return the pushed copy of a polled cloud door log entry, if a device callback delivered it."""
+        pushed = self.pop_match(door_log)
+        if pushed is None and self.active:
+            # The cloud saw an event the devices did not push: poll quickly again
+            LOGGER.debug("📨 Door event at %s was not pushed by the device; resuming fast polling",
+                         door_log.get("Location"))
+            self.active = False
+        return pushed
+
+    def pop_match(self, door_log: dict) -> dict | None:
+        """Forget and return the pushed copy of a cloud door log entry, if there is one."""
+        self._expire_pending()
+        mac = mac_key(door_log.get("MAC", ""))
+        relay = str(door_log.get("Relay", ""))
+        capture_time = parse_capture_time(door_log.get(CAPTURE_TIME_KEY))
+        window = timedelta(seconds=WEBHOOK_DEDUP_WINDOW)
+        pending = self._pending.get(mac)
+        for entry in pending or ():
+            received_at, pending_relay, _, pushed = entry
+            if relay and pending_relay and relay != pending_relay:
+                continue
+            if capture_time is not None and abs(capture_time - received_at) > window:
+                continue
+            pending.remove(entry)
+            self.suppressed += 1
+            return pushed
+        return None
+
+    def _location(self, mac: str) -> str:
+        relays = self.client._data.relays(mac)
+        return relays[0].name if relays else mac
+
+    def _expire_pending(self) -> None:
+        """Forget callbacks the cloud poll can no longer report."""
+        cutoff = time.monotonic() - WEBHOOK_DEDUP_WINDOW - WEBHOOK_RECONCILE_INTERVAL
+        for mac in list(self._pending):
+            pending = self._pending[mac]
+            while pending and pending[0][2] < cutoff:
+                pending.popleft()
+            if not pending:
+                del self._pending[mac]
+
+
+class AkuvoxWebhookView(HomeAssistantView):
+    """Receives Action URL callbacks from Akuvox devices."""
+
+    url = WEBHOOK_URL
+    name = "api:akuvox:action"
+    requires_auth = False  # Devices cannot authenticate; each device has its own secret
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request, mac: str) -> web.Response:
+        """Handle a GET callback (the Action URL default)."""
+        return await self._async_handle(mac, dict(request.query))
+
+    async def post(self, request: web.Request, mac: str) -> web.Response:
+        """Handle a POST callback with query, form or JSON parameters."""
+        params = dict(request.query)
+        if request.content_type == "application/json":
+            try:
+                body = await request.json()
+            except ValueError:
+                return self.json_message("Invalid JSON", HTTPStatus.BAD_REQUEST)
+            if isinstance(body, dict):
+                params.update(body)
+        else:
+            params.update(await request.post())
+        return await self._async_handle(mac, params)
+
+    async def _async_handle(self, mac: str, params: dict) -> web.Response:
+        for coordinator in self.hass.data.get(DOMAIN, {}).values():
+            receiver = getattr(coordinator.client, "webhook", None)
+            if receiver is not None and receiver.verify(mac, params.get("secret")):
+                await receiver.async_handle_action(mac, params)
+                return self.json_message("OK")
+        LOGGER.warning("⚠️ Rejected Action URL callback for unknown device or secret: %s", mac)
+        return self.json_message("Unauthorized", HTTPStatus.UNAUTHORIZED)
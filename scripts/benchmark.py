@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""End-to-end benchmarks of the integration's hot paths against the mock cloud.
+
+Measures startup time, door-event detection latency, cloud requests per
+detected event and the opendoor round trip. Run from the repository root:
+
+    python3 scripts/benchmark.py --events 20 --latency 0.1
+    python3 scripts/benchmark.py --error-rate 0.05 --json results.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "custom_components"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from akuvox.api import AkuvoxApiClient  # noqa: E402
+from mock_cloud import FaultProfile, MockAkuvoxCloud  # noqa: E402
+
+DOOR_UPDATE_EVENT = "akuvox_door_update"
+
+
+def percentile(values: list[float], fraction: float) -> float | None:
+    """Nearest-rank percentile."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def summarize(values: list[float]) -> dict:
+    """Count, mean and percentiles of a list of milliseconds."""
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values), 1),
+        "p50_ms": round(percentile(values, 0.50), 1),
+        "p95_ms": round(percentile(values, 0.95), 1),
+        "max_ms": round(max(values), 1),
+    }
+
+
+async def async_create_hass(config_dir: str) -> HomeAssistant:
+    """Create a minimal Home Assistant instance for the benchmarks."""
+    try:
+        hass = HomeAssistant(config_dir)
+    except TypeError:
+        # Home Assistant before 2023.12 takes the config directory as an attribute
+        hass = HomeAssistant()  # type: ignore[call-arg]
+        hass.config.config_dir = config_dir
+    hass.config.country = "US"
+    return hass
+
+
+async def async_create_client(hass: HomeAssistant, cloud: MockAkuvoxCloud) -> AkuvoxApiClient:
+    """Create an API client wired to the mock cloud."""
+    client = AkuvoxApiClient(session=cloud.session, hass=hass, entry=None)  # type: ignore
+    client.init_api_with_data(
+        hass=hass,
+        subdomain="ecloud",
+        auth_token="mock-auth-token",
+        token=cloud.token,
+        phone_number="5555555",
+        country_code="1",
+    )
+    cloud.attach(client)
+    return client
+
+
+async def async_stop_client(hass: HomeAssistant, client: AkuvoxApiClient) -> None:
+    """Stop the client's background tasks and Home Assistant."""
+    await client.supervisor.async_shutdown()
+    await hass.async_stop(force=True)
+
+
+class DoorEventProbe:
+    """Records when each injected door event is seen on the event bus."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Subscribe to door update events."""
+        self.detected: dict[str, float] = {}
+        self.duplicates = 0
+        self._waiters: dict[str, asyncio.Future] = {}
+        self._unsub = hass.bus.async_listen(DOOR_UPDATE_EVENT, self._handle_event)
+
+    def _handle_event(self, event) -> None:
+        key = self.key(event.data)
+        if key in self.detected:
+            self.duplicates += 1
+            return
+        self.detected[key] = time.monotonic()
+        waiter = self._waiters.pop(key, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(self.detected[key])
+
+    @staticmethod
+    def key(door_log: dict) -> str:
+        """Identity of an injected event."""
+        return f"{door_log.get('CaptureTime')}|{door_log.get('MAC')}|{door_log.get('Relay')}"
+
+    async def async_wait(self, door_log: dict, timeout: float) -> float | None:
+        """Wait until an event is detected; returns its detection time."""
+        key = self.key(door_log)
+        if key in self.detected:
+            return self.detected[key]
+        waiter = self._waiters[key] = asyncio.get_running_loop().create_future()
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            self._waiters.pop(key, None)
+            return None
+
+    def close(self) -> None:
+        """Unsubscribe."""
+        self._unsub()
+
+
+async def async_run_benchmarks(args) -> dict:
+    """Run all benchmarks and return the results."""
+    faults = FaultProfile(latency=args.latency,
+                          jitter=args.jitter,
+                          error_rate=args.error_rate,
+                          timeout_rate=args.timeout_rate)
+    cloud = MockAkuvoxCloud(faults=faults, devices=args.devices, seed=args.seed)
+    rng = random.Random(args.seed)
+    results: dict = {"config": vars(args)}
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir)
+        client = await async_create_client(hass, cloud)
+        probe = DoorEventProbe(hass)
+
+        # Startup: rest_server + servers_list + userconf + tempKey
+        start = time.monotonic()
+        startup_ok = await client.async_retrieve_user_data()
+        results["startup"] = {
+            "ok": bool(startup_ok),
+            "ms": round((time.monotonic() - start) * 1000, 1),
+            "requests": dict(cloud.requests),
+        }
+
+        # Let the poller record its baseline before injecting events
+        await asyncio.sleep(args.settle)
+
+        # Door event detection latency
+        requests_before = sum(cloud.requests.values())
+        door_log_before = cloud.requests["getDoorLog"]
+        latencies: list[float] = []
+        missed = 0
+        for index in range(args.events):
+            await asyncio.sleep(rng.uniform(0, args.event_spacing))
+            event = cloud.add_door_event(device=index % args.devices)
+            injected = time.monotonic()
+            detected = await probe.async_wait(event, args.detect_timeout)
+            if detected is None:
+                missed += 1
+            else:
+                latencies.append((detected - injected) * 1000)
+        detected_count = max(len(latencies), 1)
+        results["detection"] = {
+            **summarize(latencies),
+            "missed": missed,
+            "duplicates": probe.duplicates,
+            "requests_per_event": round(
+                (sum(cloud.requests.values()) - requests_before) / detected_count, 2),
+            "door_log_requests_per_event": round(
+                (cloud.requests["getDoorLog"] - door_log_before) / detected_count, 2),
+        }
+
+        # Opendoor round trip
+        round_trips: list[float] = []
+        failures = 0
+        relay = cloud.devices[0]
+        for _ in range(args.opens):
+            start = time.monotonic()
+            response = await client.async_make_opendoor_request(
+                name=relay["location"],
+                host=client._data.host,
+                data=f"mac={relay['mac']}&relay=1",
+            )
+            if response is None:
+                failures += 1
+            else:
+                round_trips.append((time.monotonic() - start) * 1000)
+        results["opendoor"] = {**summarize(round_trips), "failures": failures}
+
+        results["cloud_requests"] = dict(cloud.requests)
+        results["cloud_failures"] = dict(cloud.failures)
+        results["client_metrics"] = client.metrics.as_dict()
+
+        probe.close()
+        await async_stop_client(hass, client)
+
+    return results
+
+
+def print_report(results: dict) -> None:
+    """Print a human-readable summary."""
+    startup = results["startup"]
+    detection = results["detection"]
+    opendoor = results["opendoor"]
+    rows = [
+        ("startup", f"{startup['ms']} ms", "ok" if startup["ok"] else "FAILED"),
+        ("detection p50", f"{detection.get('p50_ms')} ms", f"{detection['count']} events"),
+        ("detection p95", f"{detection.get('p95_ms')} ms", f"{detection['missed']} missed"),
+        ("detection max", f"{detection.get('max_ms')} ms", f"{detection['duplicates']} duplicates"),
+        ("requests / event", str(detection["requests_per_event"]),
+         f"{detection['door_log_requests_per_event']} getDoorLog"),
+        ("opendoor p50", f"{opendoor.get('p50_ms')} ms", f"{opendoor['failures']} failures"),
+        ("opendoor p95", f"{opendoor.get('p95_ms')} ms", ""),
+    ]
+    width = max(len(row[0]) for row in rows)
+    for name, value, note in rows:
+        print(f"{name:<{width}}  {value:>12}  {note}")  # noqa: T201
+
+
+def parse_args(argv=None):
+    """Command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10, help="door events to inject")
+    parser.add_argument("--opens", type=int, default=20, help="opendoor requests to send")
+    parser.add_argument("--devices", type=int, default=2, help="devices in the mock account")
+    parser.add_argument("--latency", type=float, default=0.05, help="base cloud latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="random extra latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of HTTP 500")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="probability of a timeout")
+    parser.add_argument("--event-spacing", type=float, default=3.0,
+                        help="max random delay between injected events (s)")
+    parser.add_argument("--detect-timeout", type=float, default=30.0,
+                        help="give up on an event after this many seconds")
+    parser.add_argument("--settle", type=float, default=3.0,
+                        help="wait after startup before injecting events (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write the full results to this file")
+    parser.add_argument("--debug", action="store_true", help="show integration debug logs")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Run the benchmarks."""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+    results = asyncio.run(async_run_benchmarks(args))
+    print_report(results)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2, default=str))
+    return 0 if results["startup"]["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Multi-account load generator for scaling tests against the mock cloud.
+
+Starts N simulated accounts, each with its own AkuvoxApiClient and mock
+cloud, injects door events at random into all of them and reports
+event-loop lag, detection latency percentiles, memory per account and
+dropped/duplicated events. Run from the repository root:
+
+    python3 scripts/loadgen.py --accounts 1,10,50 --duration 60
+    python3 scripts/loadgen.py --accounts 100 --latency 0.2 --markdown
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from benchmark import (  # noqa: E402
+    DoorEventProbe,
+    async_create_client,
+    async_create_hass,
+    percentile,
+    summarize,
+)
+from mock_cloud import FaultProfile, MockAkuvoxCloud  # noqa: E402
+
+TABLE_COLUMNS = (
+    ("accounts", "Accounts"),
+    ("events", "Events"),
+    ("detect_p50_ms", "Detect p50 (ms)"),
+    ("detect_p95_ms", "Detect p95 (ms)"),
+    ("detect_p99_ms", "Detect p99 (ms)"),
+    ("lag_p95_ms", "Loop lag p95 (ms)"),
+    ("lag_max_ms", "Loop lag max (ms)"),
+    ("kib_per_account", "KiB / account"),
+    ("dropped", "Dropped"),
+    ("duplicated", "Duplicated"),
+    ("requests_per_second", "Cloud req/s"),
+)
+
+
+class LoopLagMonitor:
+    """Samples event-loop lag as the overshoot of a fixed-interval sleep."""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        """Initialize the monitor."""
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - start - self.interval) * 1000)
+
+
+class SimulatedAccount:
+    """One Home Assistant instance, API client and mock cloud.
+
+    All accounts share the event loop and its default executor, as config
+    entries do in a single Home Assistant process.
+    """
+
+    def __init__(self, index: int, cloud: MockAkuvoxCloud) -> None:
+        """Initialize the account."""
+        self.index = index
+        self.cloud = cloud
+        self.hass = None
+        self.client = None
+        self.probe: DoorEventProbe | None = None
+        self._config_dir = tempfile.TemporaryDirectory()
+
+    async def async_start(self) -> bool:
+        """Create the client and start polling."""
+        # A separate instance per account: the integration's storage key is global
+        self.hass = await async_create_hass(self._config_dir.name)
+        self.client = await async_create_client(self.hass, self.cloud)
+        self.probe = DoorEventProbe(self.hass)
+        return bool(await self.client.async_retrieve_user_data())
+
+    async def async_stop(self) -> None:
+        """Stop polling and Home Assistant."""
+        if self.probe is not None:
+            self.probe.close()
+        if self.client is not None:
+            await self.client.supervisor.async_shutdown()
+        if self.hass is not None:
+            await self.hass.async_stop(force=True)
+        self._config_dir.cleanup()
+
+
+async def async_inject_events(account: SimulatedAccount,
+                              rng: random.Random,
+                              deadline: float,
+                              spacing: float,
+                              detect_timeout: float,
+                              latencies: list[float],
+                              dropped: list[int]) -> None:
+    """Inject door events into one account until the deadline."""
+    pending = []
+    while time.monotonic() < deadline:
+        await asyncio.sleep(rng.uniform(0, spacing))
+        event = account.cloud.add_door_event(device=rng.randrange(len(account.cloud.devices)))
+        pending.append((event, time.monotonic()))
+
+    for event, injected in pending:
+        remaining = max(0.0, injected + detect_timeout - time.monotonic())
+        detected = await account.probe.async_wait(event, remaining)
+        if detected is None:
+            dropped[0] += 1
+        else:
+            latencies.append((detected - injected) * 1000)
+
+
+async def async_run_load(args, accounts_count: int) -> dict:
+    """Run one load level and return its results."""
+    faults = FaultProfile(latency=args.latency,
+                          jitter=args.jitter,
+                          error_rate=args.error_rate,
+                          timeout_rate=args.timeout_rate)
+    rng = random.Random(args.seed)
+
+    gc.collect()
+    tracemalloc.start()
+    memory_before = tracemalloc.get_traced_memory()[0]
+
+    accounts = [
+        SimulatedAccount(index, MockAkuvoxCloud(faults=faults,
+                                                devices=args.devices,
+                                                seed=args.seed + index))
+        for index in range(accounts_count)
+    ]
+    monitor = LoopLagMonitor()
+    monitor.start()
+
+    start = time.monotonic()
+    started = await asyncio.gather(*(account.async_start() for account in accounts))
+    startup_ms = (time.monotonic() - start) * 1000
+
+    await asyncio.sleep(args.settle)
+    gc.collect()
+    memory_per_account = (tracemalloc.get_traced_memory()[0] - memory_before) / accounts_count
+
+    requests_before = sum(sum(account.cloud.requests.values()) for account in accounts)
+    latencies: list[float] = []
+    dropped = [0]
+    load_start = time.monotonic()
+    deadline = load_start + args.duration
+    await asyncio.gather(*(
+        async_inject_events(account,
+                            random.Random(rng.random()),
+                            deadline,
+                            args.event_spacing,
+                            args.detect_timeout,
+                            latencies,
+                            dropped)
+        for account in accounts
+    ))
+    elapsed = time.monotonic() - load_start
+    requests = sum(sum(account.cloud.requests.values()) for account in accounts) - requests_before
+
+    await monitor.stop()
+    tracemalloc.stop()
+    duplicated = sum(account.probe.duplicates for account in accounts)
+    for account in accounts:
+        await account.async_stop()
+
+    detection = summarize(latencies)
+    lag = monitor.samples or [0.0]
+    return {
+        "accounts": accounts_count,
+        "started": sum(started),
+        "startup_ms": round(startup_ms, 1),
+        "events": len(latencies) + dropped[0],
+        "detect_p50_ms": detection.get("p50_ms"),
+        "detect_p95_ms": detection.get("p95_ms"),
+        "detect_p99_ms": round(percentile(latencies, 0.99), 1) if latencies else None,
+        "detect_max_ms": detection.get("max_ms"),
+        "lag_p50_ms": round(percentile(lag, 0.50), 1),
+        "lag_p95_ms": round(percentile(lag, 0.95), 1),
+        "lag_max_ms": round(max(lag), 1),
+        "kib_per_account": round(memory_per_account / 1024, 1),
+        "dropped": dropped[0],
+        "duplicated": duplicated,
+        "requests_per_second": round(requests / elapsed, 1) if elapsed else None,
+    }
+
+
+def format_table(rows: list[dict]) -> str:
+    """Results as a Markdown table."""
+    lines = [
+        "| " + " | ".join(title for _, title in TABLE_COLUMNS) + " |",
+        "|" + "|".join("---:" for _ in TABLE_COLUMNS) + "|",
+    ]
+    for row in rows:
+        lines.append("| " + " | ".join(str(row.get(key, "")) for key, _ in TABLE_COLUMNS) + " |")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    """Command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", default="1,10,50",
+                        help="comma-separated account counts to run in turn")
+    parser.add_argument("--duration", type=float, default=30.0,
+                        help="seconds to inject events at each load level")
+    parser.add_argument("--devices", type=int, default=2, help="devices per account")
+    parser.add_argument("--latency", type=float, default=0.05, help="base cloud latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="random extra latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of HTTP 500")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="probability of a timeout")
+    parser.add_argument("--event-spacing", type=float, default=10.0,
+                        help="max random delay between events of one account (s)")
+    parser.add_argument("--detect-timeout", type=float, default=30.0,
+                        help="count an event as dropped after this many seconds")
+    parser.add_argument("--settle", type=float, default=3.0,
+                        help="wait after startup before injecting events (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--markdown", action="store_true", help="print a Markdown table")
+    parser.add_argument("--json", help="write the full results to this file")
+    parser.add_argument("--debug", action="store_true", help="show integration debug logs")
+    return parser.parse_args(argv)
+
+
+async def async_main(args) -> list[dict]:
+    """Run every requested load level."""
+    results = []
+    for accounts_count in (int(value) for value in args.accounts.split(",") if value.strip()):
+        logging.getLogger(__name__).warning("Running %d account(s) for %ss",
+                                            accounts_count, args.duration)
+        results.append(await async_run_load(args, accounts_count))
+    return results
+
+
+def main(argv=None) -> int:
+    """Run the load generator."""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+    results = asyncio.run(async_main(args))
+    if args.markdown:
+        print(format_table(results))  # noqa: T201
+    else:
+        for row in results:
+            print(json.dumps(row))  # noqa: T201
+    if args.json:
+        Path(args.json).write_text(json.dumps({"config": vars(args), "results": results},
+                                              indent=2, default=str))
+    return 0 if all(row["started"] == row["accounts"] for row in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
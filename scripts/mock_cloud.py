@@ -0,0 +1,340 @@
+"""In-process mock of the Akuvox cloud endpoints used by the integration.
+
+The mock replaces the API client's transport rather than listening on a
+socket: `attach()` swaps the client's synchronous `get_request` /
+`post_request` (used through the executor) and its aiohttp session (used by
+the opendoor request) for handlers that answer from in-memory state.
+
+Latency, HTTP errors and timeouts can be injected per request.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+DATE_FORMAT = "%d-%m-%Y %H:%M:%S"
+
+
+@dataclass
+class FaultProfile:
+    """Latency and failure injection settings."""
+
+    latency: float = 0.05  # Base latency in seconds
+    jitter: float = 0.0  # Uniform random extra latency in seconds
+    error_rate: float = 0.0  # Probability of an HTTP 500 response
+    timeout_rate: float = 0.0  # Probability of a request timeout
+    endpoints: dict[str, FaultProfile] = field(default_factory=dict)
+
+    def for_endpoint(self, endpoint: str) -> FaultProfile:
+        """Profile to apply for an endpoint (per-endpoint override or default)."""
+        return self.endpoints.get(endpoint, self)
+
+    def delay(self, rng: random.Random) -> float:
+        """Latency to apply to one request."""
+        return self.latency + (rng.uniform(0, self.jitter) if self.jitter else 0.0)
+
+
+class MockResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code: int, payload) -> None:
+        """Initialize the response."""
+        self.status_code = status_code
+        self._payload = payload
+
+    def json(self):
+        """Return the decoded JSON payload."""
+        return self._payload
+
+
+class _MockAiohttpResponse:
+    """Minimal stand-in for an aiohttp response context manager."""
+
+    def __init__(self, status: int, payload) -> None:
+        self.status = status
+        self._payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def json(self):
+        return self._payload
+
+    async def text(self):
+        return json.dumps(self._payload)
+
+
+class MockSession:
+    """Stand-in for the aiohttp ClientSession used by the opendoor request."""
+
+    def __init__(self, cloud: MockAkuvoxCloud) -> None:
+        """Initialize the session."""
+        self._cloud = cloud
+
+    def post(self, url, headers=None, data=None, **_kwargs):
+        """Return an async context manager answering the request."""
+        return _MockAsyncRequest(self._cloud, "post", url, headers, data)
+
+    def get(self, url, headers=None, data=None, **_kwargs):
+        """Return an async context manager answering the request."""
+        return _MockAsyncRequest(self._cloud, "get", url, headers, data)
+
+
+class _MockAsyncRequest:
+    """Async context manager that applies fault injection before answering."""
+
+    def __init__(self, cloud: MockAkuvoxCloud, method: str, url: str, headers, data) -> None:
+        self._cloud = cloud
+        self._args = (method, url, headers, data)
+        self._response: _MockAiohttpResponse | None = None
+
+    async def __aenter__(self):
+        method, url, headers, data = self._args
+        endpoint = self._cloud.endpoint_for(url)
+        profile = self._cloud.faults.for_endpoint(endpoint)
+        await asyncio.sleep(profile.delay(self._cloud.rng))
+        if self._cloud.rng.random() < profile.timeout_rate:
+            self._cloud.record(endpoint, "timeout")
+            raise asyncio.TimeoutError
+        status, payload = self._cloud.handle(method, url, headers, data)
+        self._response = _MockAiohttpResponse(status, payload)
+        return self._response
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class MockAkuvoxCloud:
+    """In-memory Akuvox cloud: servers, devices, temp keys and a door log."""
+
+    def __init__(self,
+                 faults: FaultProfile | None = None,
+                 devices: int = 1,
+                 relays_per_device: int = 1,
+                 seed: int = 0) -> None:
+        """Initialize the mock with a number of devices and relays."""
+        self.faults = faults or FaultProfile()
+        self.rng = random.Random(seed)
+        self.requests: Counter = Counter()
+        self.failures: Counter = Counter()
+        self.token = "mock-token-0"
+        self.refresh_token = "mock-refresh-0"
+        self._token_counter = itertools.count(1)
+        self._key_ids = itertools.count(1000)
+        self._lock = threading.Lock()
+        self.session = MockSession(self)
+
+        self.devices = [
+            {
+                "location": f"Door {index + 1}",
+                "mac": f"0C11052B{index:04X}",
+                "rtsp_pwd": "mockpwd",
+                "relay": [
+                    {"relay_id": str(relay + 1), "door_name": f"Relay {relay + 1}"}
+                    for relay in range(relays_per_device)
+                ],
+            }
+            for index in range(devices)
+        ]
+        self.temp_keys: list[dict] = []
+        self.door_log: list[dict] = []
+        self.opened: list[tuple[str, str, float]] = []
+        self._event_time = datetime.now().replace(microsecond=0) - timedelta(days=1)
+        self.add_door_event()  # Baseline entry
+
+    ##########
+    # Events #
+    ##########
+
+    def add_door_event(self,
+                       device: int = 0,
+                       relay: str = "1",
+                       initiator: str = "Mock User",
+                       capture_type: str = "Call",
+                       pic_url: str = "https://mock.akuvox.com/pic.jpg",
+                       capture_time: datetime | None = None) -> dict:
+        """Prepend a door log entry (the API returns newest first)."""
+        if capture_time is None:
+            # Unique, strictly increasing capture times
+            self._event_time = max(self._event_time + timedelta(seconds=1),
+                                   datetime.now().replace(microsecond=0))
+            capture_time = self._event_time
+        dev = self.devices[device % len(self.devices)]
+        event = {
+            "CaptureTime": capture_time.strftime(DATE_FORMAT),
+            "Location": dev["location"],
+            "Initiator": initiator,
+            "CaptureType": capture_type,
+            "PicUrl": pic_url,
+            "MAC": dev["mac"],
+            "Relay": relay,
+        }
+        with self._lock:
+            self.door_log.insert(0, event)
+        return event
+
+    ###########
+    # Routing #
+    ###########
+
+    @staticmethod
+    def endpoint_for(url: str) -> str:
+        """Logical endpoint name of a request URL."""
+        path = urlparse(url).path
+        for marker, endpoint in (("/log/getDoorLog", "getDoorLog"),
+                                 ("/tempKey/getPersonalTempKeyList", "tempKey_list"),
+                                 ("/tempKey/addPersonalTempKey", "tempKey_add"),
+                                 ("/tempKey/deletePersonalTempKey", "tempKey_delete"),
+                                 ("/rest_server", "rest_server"),
+                                 ("/servers_list", "servers_list"),
+                                 ("/userconf", "userconf"),
+                                 ("/refresh_token", "refresh_token"),
+                                 ("/opendoor", "opendoor")):
+            if marker in path:
+                return endpoint
+        return "unknown"
+
+    def record(self, endpoint: str, failure: str | None = None) -> None:
+        """Count a request (and its injected failure)."""
+        with self._lock:
+            self.requests[endpoint] += 1
+            if failure:
+                self.failures[f"{endpoint}:{failure}"] += 1
+
+    def attach(self, client) -> None:
+        """Route an AkuvoxApiClient's transport to this mock."""
+        client.get_request = self.get_request
+        client.post_request = self.post_request
+        client._session = self.session
+
+    def get_request(self, url, headers, data, timeout=10):
+        """Answer a synchronous GET, called from the executor like requests.get."""
+        return self._sync_request("get", url, headers, data)
+
+    def post_request(self, url, headers, data="", timeout=10):
+        """Answer a synchronous POST, called from the executor like requests.post."""
+        return self._sync_request("post", url, headers, data)
+
+    def _sync_request(self, method, url, headers, data) -> MockResponse:
+        endpoint = self.endpoint_for(url)
+        profile = self.faults.for_endpoint(endpoint)
+        time.sleep(profile.delay(self.rng))
+        if self.rng.random() < profile.timeout_rate:
+            self.record(endpoint, "timeout")
+            raise requests.exceptions.Timeout(f"Mock timeout for {url}")
+        status, payload = self.handle(method, url, headers, data)
+        return MockResponse(status, payload)
+
+    def handle(self, method: str, url: str, headers, data) -> tuple[int, dict]:
+        """Answer a request; returns (HTTP status, JSON payload)."""
+        endpoint = self.endpoint_for(url)
+        profile = self.faults.for_endpoint(endpoint)
+        if self.rng.random() < profile.error_rate:
+            self.record(endpoint, "http_500")
+            return 500, {"result": -1, "message": "Injected error"}
+        self.record(endpoint)
+        handler = getattr(self, f"_handle_{endpoint}", None)
+        if handler is None:
+            return 404, {"result": -1, "message": "Not found"}
+        return 200, handler(url, data)
+
+    ############
+    # Handlers #
+    ############
+
+    def _handle_rest_server(self, url, data):
+        return {"result": 0, "datas": {"rest_server_https": "rest.mock.akuvox.com:8600"}}
+
+    def _handle_servers_list(self, url, data):
+        return {"result": 0, "datas": {
+            "token": self.token,
+            "auth_token": "mock-auth-token",
+            "refresh_token": self.refresh_token,
+            "rtmp_server": "rtmp.mock.akuvox.com:1935",
+        }}
+
+    def _handle_refresh_token(self, url, data):
+        number = next(self._token_counter)
+        self.token = f"mock-token-{number}"
+        self.refresh_token = f"mock-refresh-{number}"
+        return {"err_code": "0", "message": "", "datas": {
+            "token": self.token,
+            "refresh_token": self.refresh_token,
+        }}
+
+    def _handle_userconf(self, url, data):
+        return {"result": 0, "datas": {
+            "app_conf": {"project_name": "Mock Community"},
+            "dev_list": self.devices,
+        }}
+
+    def _handle_opendoor(self, url, data):
+        form = parse_qs(data) if isinstance(data, str) else dict(data or {})
+        mac = "".join(form.get("mac", [""]))
+        relay = "".join(form.get("relay", [""]))
+        with self._lock:
+            self.opened.append((mac, relay, time.monotonic()))
+        return {"result": 0, "message": "success"}
+
+    def _handle_getDoorLog(self, url, data):
+        query = parse_qs(urlparse(url).query)
+        row = int(query.get("row", ["1"])[0])
+        page = int(query.get("page", ["1"])[0])
+        with self._lock:
+            rows = self.door_log[(page - 1) * row:page * row]
+        return {"code": 0, "data": [dict(entry) for entry in rows]}
+
+    def _handle_tempKey_list(self, url, data):
+        query = parse_qs(urlparse(url).query)
+        row = int(query.get("row", ["20"])[0])
+        page = int(query.get("page", ["1"])[0])
+        with self._lock:
+            rows = self.temp_keys[(page - 1) * row:page * row]
+        return {"code": 0, "data": [dict(key) for key in rows]}
+
+    def _handle_tempKey_add(self, url, data):
+        payload = json.loads(data) if isinstance(data, str) else dict(data or {})
+        key_id = next(self._key_ids)
+        key = {
+            "ID": key_id,
+            "Description": payload.get("Description", ""),
+            "TmpKey": f"{key_id:08d}",
+            "BeginTime": payload.get("BeginTime", ""),
+            "EndTime": payload.get("EndTime", ""),
+            "AccessTimes": 0,
+            "AllowedTimes": payload.get("AllowedTimes", 1),
+            "EachAllowedTimes": payload.get("EachAllowedTimes", 0),
+            "QrCodeUrl": f"/qr/{key_id}.png",
+            "Expired": 1,
+            "Doors": [
+                {"ID": index, "KeyID": key_id, "Relay": door["Relay"], "MAC": door["MAC"]}
+                for index, door in enumerate(payload.get("Doors", []))
+            ],
+        }
+        with self._lock:
+            self.temp_keys.append(key)
+        return {"code": 0, "data": key}
+
+    def _handle_tempKey_delete(self, url, data):
+        payload = json.loads(data) if isinstance(data, str) else dict(data or {})
+        key_id = str(payload.get("ID"))
+        with self._lock:
+            before = len(self.temp_keys)
+            self.temp_keys = [key for key in self.temp_keys if str(key["ID"]) != key_id]
+            removed = before != len(self.temp_keys)
+        if not removed:
+            return {"code": 1, "msg": "Key not found"}
+        return {"code": 0, "msg": "success"}
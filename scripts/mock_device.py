@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Local HTTP stand-in for an Akuvox device's LAN API.
+
+Answers `GET /fcgi/do?action=OpenDoor&DoorNum=<relay>` like a door phone's
+web server, with optional credentials, latency and failure injection. With
+--rtsp-port it also answers RTSP OPTIONS, which is enough for the camera's
+local stream probe. Point the integration's "Local device addresses"
+option at it:
+
+    python3 scripts/mock_device.py --port 8081 --username admin --password admin
+    # Options: lan_devices = 0C11052B0000=127.0.0.1:8081
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import StreamRequestHandler, ThreadingTCPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class MockDevice:
+    """State of the simulated device."""
+
+    def __init__(self,
+                 username: str = "",
+                 password: str = "",
+                 latency: float = 0.0,
+                 error_rate: float = 0.0,
+                 seed: int = 0) -> None:
+        """Initialize the device."""
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.opened: list[tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    def authorized(self, query: dict, headers) -> bool:
+        """Check query or basic auth credentials."""
+        if not self.username:
+            return True
+        if query.get("UserName") == self.username and query.get("Password") == self.password:
+            return True
+        expected = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
+        return headers.get("Authorization", "") == f"Basic {expected}"
+
+    def open_door(self, relay: str) -> None:
+        """Record a relay trigger."""
+        with self._lock:
+            self.opened.append((relay, time.time()))
+
+
+def make_handler(device: MockDevice):
+    """Request handler bound to a device."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            parsed = urlparse(self.path)
+            query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+            time.sleep(device.latency)
+            if parsed.path != "/fcgi/do" or query.get("action") != "OpenDoor":
+                return self._reply(404, {"retcode": -1, "message": "Not found"})
+            if not device.authorized(query, self.headers):
+                return self._reply(401, {"retcode": -1, "message": "Unauthorized"})
+            if device.rng.random() < device.error_rate:
+                return self._reply(500, {"retcode": -1, "message": "Injected error"})
+            relay = query.get("DoorNum", "1")
+            device.open_door(relay)
+            print(f"Relay {relay} opened")  # noqa: T201
+            return self._reply(200, {"retcode": 0, "message": "OK"})
+
+        def _reply(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):  # noqa: A002
+            pass
+
+    return Handler
+
+
+def serve(device: MockDevice, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Start serving in a background thread; returns the server (see server_address)."""
+    server = ThreadingHTTPServer((host, port), make_handler(device))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class RtspOptionsHandler(StreamRequestHandler):
+    """Answers RTSP OPTIONS requests."""
+
+    def handle(self):
+        """Reply to each request until the client disconnects."""
+        while True:
+            request = []
+            while (line := self.rfile.readline()) not in (b"\r\n", b"\n", b""):
+                request.append(line)
+            if not request:
+                return
+            cseq = next((line.split(b":", 1)[1].strip() for line in request
+                         if line.lower().startswith(b"cseq")), b"1")
+            self.wfile.write(b"RTSP/1.0 200 OK\r\nCSeq: " + cseq
+                             + b"\r\nPublic: OPTIONS, DESCRIBE, SETUP, PLAY, TEARDOWN\r\n\r\n")
+
+
+def serve_rtsp(host: str = "127.0.0.1", port: int = 0) -> ThreadingTCPServer:
+    """Start answering RTSP OPTIONS in a background thread."""
+    ThreadingTCPServer.allow_reuse_address = True
+    server = ThreadingTCPServer((host, port), RtspOptionsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None) -> int:
+    """Run the mock device until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--username", default="")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--latency", type=float, default=0.0, help="response delay (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of HTTP 500")
+    parser.add_argument("--rtsp-port", type=int, default=0,
+                        help="also answer RTSP OPTIONS on this port (554 needs root)")
+    args = parser.parse_args(argv)
+
+    device = MockDevice(args.username, args.password, args.latency, args.error_rate)
+    server = serve(device, args.host, args.port)
+    print(f"Mock Akuvox device listening on {server.server_address[0]}:{server.server_address[1]}")  # noqa: T201
+    if args.rtsp_port:
+        serve_rtsp(args.host, args.rtsp_port)
+        print(f"RTSP OPTIONS answered on {args.host}:{args.rtsp_port}")  # noqa: T201
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Replay a recorded cassette through the integration's ingestion pipeline.
+
+Cassettes are recorded in Home Assistant with the `akuvox.record_responses`
+service. The door log, userconf and temp key list responses are served back
+in their recorded order, paced by their original timing divided by
+`--speed` (0 = as fast as the client asks). Endpoints that are not recorded
+are answered by the mock cloud. Run from the repository root:
+
+    python3 scripts/replay.py akuvox_20250105_143015.jsonl.gz --speed 10
+    python3 scripts/replay.py cassette.jsonl.gz --speed 0 --profile replay.prof
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import json
+import logging
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from benchmark import (  # noqa: E402
+    async_create_client,
+    async_create_hass,
+    async_stop_client,
+)
+from mock_cloud import FaultProfile, MockAkuvoxCloud  # noqa: E402
+
+from akuvox.cassette import read_cassette  # noqa: E402
+
+DOOR_UPDATE_EVENT = "akuvox_door_update"
+MAX_WAIT = 5.0  # Seconds a request waits for its recorded response before the previous one is served
+
+
+class ReplayCloud(MockAkuvoxCloud):
+    """Mock cloud that answers the recorded endpoints from a cassette.
+
+    Each recorded endpoint is a track of responses served once each, in
+    order. A response is not served before its recorded offset (scaled by
+    the speed); a request that comes too early waits up to MAX_WAIT and
+    otherwise gets the previous response again, as a real cloud would answer
+    with unchanged data.
+    """
+
+    def __init__(self, cassette: str, speed: float = 1.0) -> None:
+        """Load the cassette."""
+        super().__init__(faults=FaultProfile(latency=0.0))
+        self.speed = speed
+        self.tracks: dict[str, list[dict]] = {}
+        for record in read_cassette(cassette):
+            self.tracks.setdefault(record["e"], []).append(record)
+        self.positions = dict.fromkeys(self.tracks, 0)
+        self.finished = threading.Event()
+        self._started: float | None = None
+        if self.tracks.get("userconf"):
+            # Serve the recorded devices to the opendoor handler as well
+            body = self.tracks["userconf"][0].get("b") or {}
+            self.devices = (body.get("datas") or {}).get("dev_list") or self.devices
+
+    @property
+    def total(self) -> int:
+        """Recorded responses in the cassette."""
+        return sum(len(track) for track in self.tracks.values())
+
+    def handle(self, method: str, url: str, headers, data) -> tuple[int, dict]:
+        """Answer from the cassette, or from the mock for endpoints not recorded."""
+        endpoint = self.endpoint_for(url)
+        if endpoint not in self.tracks:
+            return super().handle(method, url, headers, data)
+        self.record(endpoint)
+        record = self._next(endpoint)
+        return record.get("s", 200), record.get("b")
+
+    def _next(self, endpoint: str) -> dict:
+        with self._lock:
+            if self._started is None:
+                self._started = time.monotonic()
+        track = self.tracks[endpoint]
+        position = self.positions[endpoint]
+        if position < len(track):
+            if self.speed > 0:
+                due = self._started + track[position]["t"] / self.speed
+                wait = due - time.monotonic()
+                if wait > 0:
+                    time.sleep(min(wait, MAX_WAIT))
+                    if wait > MAX_WAIT:
+                        return track[max(position - 1, 0)]
+            with self._lock:
+                self.positions[endpoint] = position + 1
+                if all(self.positions[name] >= len(self.tracks[name]) for name in self.tracks):
+                    self.finished.set()
+            return track[position]
+        return track[-1]
+
+
+async def async_replay(args) -> dict:
+    """Replay the cassette and return what the integration did with it."""
+    cloud = ReplayCloud(args.cassette, speed=args.speed)
+    events: list[dict] = []
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir)
+        client = await async_create_client(hass, cloud)
+        unsub = hass.bus.async_listen(DOOR_UPDATE_EVENT, lambda event: events.append(event.data))
+
+        profiler = cProfile.Profile() if args.profile else None
+        start = time.monotonic()
+        if profiler is not None:
+            profiler.enable()
+        startup_ok = await client.async_retrieve_user_data()
+        finished = await hass.async_add_executor_job(cloud.finished.wait, args.timeout)
+        await asyncio.sleep(args.settle)
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+        elapsed = time.monotonic() - start
+
+        unsub()
+        results = {
+            "cassette": args.cassette,
+            "speed": args.speed,
+            "startup_ok": bool(startup_ok),
+            "finished": finished,
+            "seconds": round(elapsed, 2),
+            "responses": cloud.total,
+            "served": dict(cloud.positions),
+            "door_events": len(events),
+            "events": events if args.events else None,
+            "cloud_requests": dict(cloud.requests),
+            "client_metrics": client.metrics.as_dict(),
+        }
+        await async_stop_client(hass, client)
+    return results
+
+
+def parse_args(argv=None):
+    """Command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassette", help="cassette file (.jsonl.gz)")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay speed factor (0 = no waiting)")
+    parser.add_argument("--timeout", type=float, default=3600.0,
+                        help="stop after this many seconds even if the cassette is not finished")
+    parser.add_argument("--settle", type=float, default=3.0,
+                        help="wait after the last response before stopping (s)")
+    parser.add_argument("--profile", help="write a cProfile/pstats file of the replay")
+    parser.add_argument("--events", action="store_true", help="include the fired door events")
+    parser.add_argument("--json", help="write the full results to this file")
+    parser.add_argument("--debug", action="store_true", help="show integration debug logs")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Run the replay."""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+    results = asyncio.run(async_replay(args))
+    summary = {key: value for key, value in results.items()
+               if key not in ("events", "client_metrics")}
+    print(json.dumps(summary, indent=2, default=str))  # noqa: T201
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2, default=str))
+    return 0 if results["startup_ok"] and results["finished"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""Fixtures for the akuvox tests."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from mock_cloud import FaultProfile, MockAkuvoxCloud  # noqa: E402
+
+from custom_components.akuvox.api import AkuvoxApiClient  # noqa: E402
+from custom_components.akuvox.const import DOMAIN  # noqa: E402
+
+
+@pytest.fixture
+def mock_cloud() -> MockAkuvoxCloud:
+    """Mock Akuvox cloud answering without latency."""
+    return MockAkuvoxCloud(faults=FaultProfile(latency=0.0))
+
+
+@pytest.fixture
+def config_entry(hass) -> MockConfigEntry:
+    """Config entry of the integration."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"phone_number": "5555555", "country_code": "1"})
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def client(hass, mock_cloud):
+    """Yield an API client wired to the mock cloud, and stop its background tasks."""
+    hass.config.country = "US"
+    api_client = AkuvoxApiClient(session=mock_cloud.session, hass=hass, entry=None)  # type: ignore
+    api_client.init_api_with_data(
+        hass=hass,
+        subdomain="ecloud",
+        auth_token="mock-auth-token",
+        token=mock_cloud.token,
+        phone_number="5555555",
+        country_code="1",
+    )
+    mock_cloud.attach(api_client)
+    yield api_client
+    await api_client.supervisor.async_shutdown()
@@ -0,0 +1,56 @@
+"""Tests for the rolling door event analytics."""
+from datetime import datetime
+
+from custom_components.akuvox.analytics import (
+    DIMENSION_DOOR,
+    DIMENSION_INITIATOR,
+    DoorAnalytics,
+    RollingCounts,
+    RollingWindow,
+)
+
+HOUR = 3600.0
+START = 1_700_000_000 // 3600 * 3600.0  # An hour boundary
+
+
+def test_window_buckets_slide_out():
+    """Events leave the window one bucket at a time, and events older than the window are not counted."""
+    window = RollingWindow(60, 60)
+    window.add(START)
+    window.add(START + 59)
+    window.add(START + 60)
+    assert window.count(START + 60) == 3
+    assert window.count(START + HOUR - 1) == 3
+    assert window.count(START + HOUR) == 1  # The first minute's bucket expired
+    window.add(START)  # Older than the window
+    assert window.count(START + HOUR) == 1
+    assert window.count(START + HOUR + 60) == 0
+    assert window.count(START + 10 * HOUR) == 0
+
+
+def test_next_change_is_the_next_bucket_boundary():
+    """Counts decay every minute while the hourly window is non-zero, then every hour."""
+    counts = RollingCounts()
+    assert counts.next_change(START) is None
+    counts.add(START + 10)
+    assert counts.next_change(START + 10) == START + 60
+    assert counts.next_change(START + 130) == START + 180
+    assert counts.next_change(START + HOUR + 5) == START + 2 * HOUR
+    assert counts.as_dict(START + HOUR + 5) == {"last_hour": 0, "last_day": 1, "last_week": 1}
+    assert counts.next_change(START + 7 * 24 * HOUR) is None
+
+
+async def test_counts_per_dimension(hass):
+    """Events are counted per device and initiator, and unseen values count zero."""
+    analytics = DoorAnalytics(hass)
+    now = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+    for initiator in ("Alice", "Bob", "Alice"):
+        analytics.async_record({"CaptureTime": now, "MAC": "0C:11:05:2B:00:00", "Relay": "1",
+                                "Initiator": initiator, "CaptureType": "Unlock"})
+
+    assert analytics.counts(DIMENSION_DOOR, "0C11052B0000") == {"last_hour": 3, "last_day": 3, "last_week": 3}
+    assert analytics.counts(DIMENSION_DOOR, "0C11052B0001") == {"last_hour": 0, "last_day": 0, "last_week": 0}
+    assert list(analytics.breakdown(DIMENSION_INITIATOR)) == ["Alice", "Bob"]
+    assert analytics.breakdown(DIMENSION_INITIATOR, 1)["Alice"]["last_day"] == 2
+    assert analytics.next_change(DIMENSION_DOOR) == analytics.next_change(DIMENSION_DOOR, "0C11052B0000")
+    assert analytics.next_change(DIMENSION_DOOR, "0C11052B0001") is None
@@ -0,0 +1,62 @@
+"""Tests for the door log backfill."""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from mock_cloud import FaultProfile
+
+from custom_components.akuvox.backfill import DoorLogBackfill
+from custom_components.akuvox.event_store import AkuvoxEventStore
+
+
+@pytest.fixture
+async def backfill(hass, client, tmp_path):
+    """Yield a backfill reading pages of 2 entries into a local history."""
+    client.event_store = AkuvoxEventStore(hass, str(tmp_path / "events.db"))
+    await client.event_store.async_setup()
+    client.backfill = DoorLogBackfill(hass, client, page_size=2, concurrency=1)
+    yield client.backfill
+    await client.event_store.async_close()
+
+
+async def stored_times(client) -> set[str]:
+    """CaptureTimes in the local history."""
+    return {event["CaptureTime"] for event in await client.event_store.async_query()}
+
+
+async def test_events_stored_after_the_request_do_not_hide_the_gap(client, backfill, mock_cloud, hass_storage):
+    """The stop point is recorded before the poll stores the entry that ends the outage."""
+    now = datetime.now().replace(microsecond=0)
+    before = mock_cloud.add_door_event(capture_time=now - timedelta(hours=1))
+    await client.event_store.async_add_event(before)
+    missed = [mock_cloud.add_door_event(capture_time=now - timedelta(minutes=minutes)) for minutes in (50, 40, 30)]
+
+    await backfill.async_request()
+    cursor = hass_storage["akuvox_door_log_backfill"]["data"]
+    assert cursor["offset"] == 0
+    assert datetime.fromisoformat(cursor["stop_at"]) == now - timedelta(hours=1, minutes=5)
+
+    # The poll recovers and stores the newest entry before the run starts
+    await client.async_handle_new_door_log(mock_cloud.add_door_event(capture_time=now))
+    await backfill.async_run()
+
+    assert {event["CaptureTime"] for event in missed} <= await stored_times(client)
+    assert backfill.last_run["complete"] is True
+    assert hass_storage["akuvox_door_log_backfill"]["data"] == {}
+
+
+async def test_request_during_a_run_restarts_it(client, backfill, mock_cloud):
+    """A gap recorded while a run pages back is read from the newest entry again."""
+    now = datetime.now().replace(microsecond=0)
+    older = [mock_cloud.add_door_event(capture_time=now - timedelta(hours=hours)) for hours in (6, 5, 4, 3, 2)]
+    mock_cloud.faults.endpoints["getDoorLog"] = FaultProfile(latency=0.02)
+
+    run = asyncio.create_task(backfill.async_run())
+    while not mock_cloud.requests["getDoorLog"]:
+        await asyncio.sleep(0.005)
+    missed = [mock_cloud.add_door_event(capture_time=now - timedelta(minutes=minutes)) for minutes in (20, 10)]
+    await backfill.async_request()
+    await run
+
+    assert {event["CaptureTime"] for event in older + missed} <= await stored_times(client)
+    assert backfill.last_run["complete"] is True
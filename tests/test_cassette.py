@@ -0,0 +1,29 @@
+"""Tests for the recording of cloud responses."""
+from custom_components.akuvox import cassette
+from custom_components.akuvox.cassette import REDACTED, read_cassette
+from custom_components.akuvox.metrics import ENDPOINT_DOOR_LOG
+
+
+async def test_recording_is_streamed_to_the_cassette(hass, client, mock_cloud, tmp_path, monkeypatch):
+    """Responses are appended to the file while recording, and the saved cassette reads back whole."""
+    monkeypatch.setattr(hass.config, "config_dir", str(tmp_path))
+    monkeypatch.setattr(cassette, "CASSETTE_FLUSH_LINES", 3)
+    assert client.async_start_recording(60) is True
+    assert client.async_start_recording(60) is False  # One recording at a time
+    recorder = client.recorder
+
+    for _ in range(7):
+        await client.async_get_door_log_page(row=10)
+    await hass.async_block_till_done()
+    assert len(recorder._lines) == 2  # The header went out with the first batch
+    assert len(list(read_cassette(recorder.path))) == 5
+
+    result = await client.async_stop_recording()
+    assert result == {"file": recorder.path, "responses": {ENDPOINT_DOOR_LOG: 7}}
+    records = list(read_cassette(result["file"]))
+    assert len(records) == 7
+    assert [record["t"] for record in records] == sorted(record["t"] for record in records)
+    assert all(record["e"] == ENDPOINT_DOOR_LOG for record in records)
+    assert records[0]["b"]["data"][0]["PicUrl"] == REDACTED
+    assert client.recorder is None
+    assert not client.supervisor.is_alive("response_recording")
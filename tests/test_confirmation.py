@@ -0,0 +1,47 @@
+"""Tests for the door press confirmations."""
+from datetime import datetime
+
+from custom_components.akuvox.confirmation import DoorOpenConfirmations
+
+MAC = "0C11052B0000"
+
+
+def door_log(relay: str, capture_type: str, mac: str = "0C:11:05:2B:00:00") -> dict:
+    """Door log entry captured now."""
+    return {"CaptureTime": datetime.now().strftime("%d-%m-%Y %H:%M:%S"), "Location": "Door 1",
+            "Initiator": "Home Assistant", "CaptureType": capture_type, "MAC": mac, "Relay": relay}
+
+
+async def test_only_unlock_of_the_pressed_relay_confirms(hass):
+    """Calls and unlocks of another relay leave the press pending."""
+    confirmations = DoorOpenConfirmations(hass)
+    fired = []
+    hass.bus.async_listen("akuvox_door_open_confirmed", lambda event: fired.append(event.data))
+    press = confirmations.expect("Door 1", MAC, 2)
+    confirmations.sent(press, "cloud", True)
+
+    confirmations.observe(door_log("2", "Call"))
+    confirmations.observe(door_log("1", "SmartPlus Unlock"))
+    confirmations.observe(door_log("2", "Unlock", mac="0C11052B0001"))
+    assert not press.future.done()
+
+    confirmations.observe(door_log("2", "SmartPlus Unlock"))
+    result = await press.future
+    assert result["relay"] == "2"
+    assert result["capture_type"] == "SmartPlus Unlock"
+    await hass.async_block_till_done()
+    assert fired == [result]
+    assert confirmations.as_dict()[f"{MAC}_2"]["confirmed"] == 1
+
+
+async def test_each_press_is_confirmed_by_its_own_relay(hass):
+    """Two pending presses of one device are resolved by their own relays' entries."""
+    confirmations = DoorOpenConfirmations(hass)
+    first = confirmations.expect("Door 1", MAC, 1)
+    second = confirmations.expect("Door 1", MAC, 2)
+
+    confirmations.observe(door_log("2", "Unlock"))
+    assert second.future.done() and not first.future.done()
+    confirmations.observe(door_log("1", "Unlock"))
+    assert (await first.future)["relay"] == "1"
+    assert confirmations._pending == {}
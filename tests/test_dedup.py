@@ -0,0 +1,72 @@
+"""Tests for door event deduplication."""
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.akuvox.const import SEEN_EVENTS_SAVE_DELAY
+from custom_components.akuvox.dedup import SeenEventIndex
+
+
+def door_log(second: int, relay: str = "1") -> dict:
+    """Door log entry in the cloud format."""
+    return {
+        "CaptureTime": f"05-01-2025 14:30:{second:02d}",
+        "MAC": "0C11052B0000",
+        "Relay": relay,
+        "Initiator": "Mock User",
+        "CaptureType": "Call",
+        "PicUrl": f"https://mock.akuvox.com/pic.jpg?signature={second}",
+    }
+
+
+async def test_identity_ignores_volatile_fields(hass):
+    """Only the identity fields decide whether an event was seen."""
+    index = SeenEventIndex(hass)
+    assert index.add(door_log(1)) is True
+    assert door_log(1) | {"PicUrl": "https://mock.akuvox.com/other.jpg"} in index
+    assert door_log(1, relay="2") not in index
+    assert index.add(door_log(1)) is False
+
+
+async def test_least_recently_seen_is_evicted(hass):
+    """A full index evicts the least recently seen identity."""
+    index = SeenEventIndex(hass, max_size=2)
+    index.add(door_log(1))
+    index.add(door_log(2))
+    index.add(door_log(1))  # Seen again: now the most recent
+    index.add(door_log(3))
+    assert len(index) == 2
+    assert door_log(1) in index
+    assert door_log(2) not in index
+
+
+async def test_index_survives_restart(hass, hass_storage, freezer):
+    """Identities are saved after the save delay and loaded by a new index."""
+    index = SeenEventIndex(hass, max_size=2)
+    for second in range(3):
+        index.add(door_log(second))
+
+    freezer.tick(timedelta(seconds=SEEN_EVENTS_SAVE_DELAY + 1))
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert len(hass_storage["akuvox_seen_door_events"]["data"]["seen"]) == 2
+
+    restored = SeenEventIndex(hass, max_size=2)
+    await restored.async_load()
+    assert restored.loaded
+    assert door_log(0) not in restored
+    assert door_log(1) in restored
+    assert door_log(2) in restored
+
+
+async def test_door_log_polls_fire_each_event_once(client, mock_cloud):
+    """Repeated polls of the same door log entries only report new events."""
+    first = await client.async_get_personal_door_log()
+    assert await client._data.async_parse_personal_door_log(first) == []  # Baseline
+
+    event = mock_cloud.add_door_event(initiator="Alice")
+    new = await client._data.async_parse_personal_door_log(await client.async_get_personal_door_log())
+    assert [log["Initiator"] for log in new] == ["Alice"]
+    assert event["CaptureTime"] == new[0]["CaptureTime"]
+    assert await client._data.async_parse_personal_door_log(await client.async_get_personal_door_log()) == []
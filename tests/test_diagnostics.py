@@ -0,0 +1,69 @@
+"""Tests for the akuvox diagnostics."""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from homeassistant.components.diagnostics import REDACTED
+
+from custom_components.akuvox import entity
+from custom_components.akuvox.const import DOMAIN, TEMP_KEY_DATE_FORMAT
+from custom_components.akuvox.coordinator import AkuvoxDataUpdateCoordinator
+from custom_components.akuvox.diagnostics import async_get_config_entry_diagnostics, attribute_size_report
+from custom_components.akuvox.sensor import (
+    AkuvoxApiRequestsSensor,
+    AkuvoxDoorEventsByInitiatorSensor,
+    AkuvoxDoorEventsByTypeSensor,
+    create_temp_key_entity,
+)
+
+
+async def test_credentials_are_redacted(hass, client, config_entry):
+    """Tokens, LAN credentials and device addresses are redacted from the dump."""
+    hass.config_entries.async_update_entry(config_entry, options={
+        "token": "secret-token",
+        "lan_devices": "0C11052B0000=192.168.1.20",
+        "lan_username": "admin",
+        "lan_password": "hunter2",
+        "local_webhook": True,
+    })
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = SimpleNamespace(client=client, watchdog=None)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    options = diagnostics["entry"]["options"]
+    for key in ("token", "lan_devices", "lan_username", "lan_password"):
+        assert options[key] == REDACTED
+    assert options["local_webhook"] is True
+    assert diagnostics["entry"]["data"]["phone_number"] == REDACTED
+
+
+async def test_attribute_size_report_follows_the_recorder(hass, client, config_entry, monkeypatch):
+    """Unrecorded attributes only count as excluded where Home Assistant honours them."""
+    coordinator = AkuvoxDataUpdateCoordinator(hass, client)
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = coordinator
+    now = datetime.now()
+    temp_key = create_temp_key_entity(client, config_entry, {
+        "key_id": "1", "description": "Guest", "key_code": "123456",
+        "begin_time": (now - timedelta(hours=1)).strftime(TEMP_KEY_DATE_FORMAT),
+        "end_time": (now + timedelta(days=1)).strftime(TEMP_KEY_DATE_FORMAT),
+        "allowed_times": 10, "access_times": 0, "qr_code_url": "https://mock.akuvox.com/qr.png",
+    })
+    temp_key.hass = hass
+    temp_key.entity_id = "sensor.guest_1"
+    await temp_key.async_added_to_hass()
+    temp_key.async_write_ha_state()
+
+    monkeypatch.setattr(entity, "UNRECORDED_ATTRIBUTES_SUPPORTED", False)
+    report = attribute_size_report(client)
+    assert report["entities"] == 1
+    assert report["recorded_attribute_bytes"] == report["attribute_bytes"] > 0
+
+    monkeypatch.setattr(entity, "UNRECORDED_ATTRIBUTES_SUPPORTED", True)
+    assert attribute_size_report(client)["recorded_attribute_bytes"] < report["attribute_bytes"]
+    coordinator.key_scheduler.async_stop()
+
+
+def test_bulky_attributes_stay_out_of_the_state(client, config_entry):
+    """Per-endpoint metrics are only in the diagnostics and breakdown sensors start disabled."""
+    client.metrics.record("getDoorLog", 120)
+    assert AkuvoxApiRequestsSensor(client=client, entry=config_entry).extra_state_attributes is None
+    for sensor_class in (AkuvoxDoorEventsByTypeSensor, AkuvoxDoorEventsByInitiatorSensor):
+        assert sensor_class(client=client, entry=config_entry).entity_registry_enabled_default is False
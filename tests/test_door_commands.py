@@ -0,0 +1,59 @@
+"""Tests for the per-relay door-open coordination."""
+import asyncio
+from contextlib import suppress
+
+from custom_components.akuvox.door_commands import DoorCommandCoordinator
+
+
+class _Opener:
+    """Door-open factory returning queued results, one request per call."""
+
+    def __init__(self, *results) -> None:
+        self.results = list(results)
+        self.requests = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self):
+        self.requests += 1
+        await self.release.wait()
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+async def test_presses_join_in_flight_and_recent_success():
+    """Presses during the request and within the window share it; later ones send again."""
+    coordinator = DoorCommandCoordinator(window=0.05)
+    opener = _Opener({"success": True}, {"success": True})
+    opener.release.clear()
+
+    presses = [asyncio.create_task(coordinator.async_run("mac_1", opener)) for _ in range(3)]
+    await asyncio.sleep(0)
+    opener.release.set()
+    assert await asyncio.gather(*presses) == [{"success": True}] * 3
+    assert await coordinator.async_run("mac_1", opener) == {"success": True}
+    assert opener.requests == 1
+    assert coordinator.suppressed == {"mac_1": 3}
+
+    await asyncio.sleep(0.06)
+    await coordinator.async_run("mac_2", _Opener({"success": True}))
+    assert list(coordinator._requests) == ["mac_2"]  # The expired request was dropped
+    await coordinator.async_run("mac_1", opener)
+    assert opener.requests == 2
+
+
+async def test_failed_request_is_retried_by_the_next_press():
+    """A failed or raising request is not joined once it completed."""
+    coordinator = DoorCommandCoordinator(window=10)
+    opener = _Opener(None, {"success": False}, RuntimeError("boom"), {"success": True})
+
+    assert await coordinator.async_run("mac_1", opener) is None
+    assert await coordinator.async_run("mac_1", opener) == {"success": False}
+    with suppress(RuntimeError):
+        await coordinator.async_run("mac_1", opener)
+    assert coordinator._requests == {}
+    assert await coordinator.async_run("mac_1", opener) == {"success": True}
+    assert opener.requests == 4
+    assert coordinator.total_suppressed == 0
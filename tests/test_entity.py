@@ -0,0 +1,75 @@
+"""Tests for the akuvox entity base class."""
+from datetime import datetime, timedelta
+
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.akuvox.const import DOMAIN, SIGNAL_TOKEN_UPDATED, TEMP_KEY_DATE_FORMAT
+from custom_components.akuvox.coordinator import AkuvoxDataUpdateCoordinator
+from custom_components.akuvox.entity import AkuvoxEntity
+from custom_components.akuvox.sensor import (
+    AkuvoxLastDoorEventSensor,
+    AkuvoxTokenSensor,
+    create_temp_key_entity,
+)
+
+
+async def test_state_writes_over_an_hour(hass, client, config_entry, freezer, monkeypatch):
+    """An hour of refreshes, token signals and repeated door events only writes real changes."""
+    writes: dict[str, int] = {}
+    original_write = AkuvoxEntity.async_write_ha_state
+
+    def _counted_write(entity):
+        writes[entity.entity_id] = writes.get(entity.entity_id, 0) + 1
+        original_write(entity)
+
+    monkeypatch.setattr(AkuvoxEntity, "async_write_ha_state", _counted_write)
+    coordinator = AkuvoxDataUpdateCoordinator(hass, client)
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = coordinator
+
+    now = datetime.now()
+    temp_key = create_temp_key_entity(client, config_entry, {
+        "key_id": "1", "description": "Guest", "key_code": "123456",
+        "begin_time": (now - timedelta(hours=1)).strftime(TEMP_KEY_DATE_FORMAT),
+        "end_time": (now + timedelta(minutes=30, seconds=30)).strftime(TEMP_KEY_DATE_FORMAT),
+        "allowed_times": 10, "access_times": 0, "qr_code_url": "https://mock.akuvox.com/qr.png",
+    })
+    entities = {
+        "sensor.guest_1": temp_key,
+        "sensor.akuvox_token": AkuvoxTokenSensor(client=client, entry=config_entry),
+        "sensor.akuvox_last_door_event": AkuvoxLastDoorEventSensor(hass=hass, client=client, entry=config_entry),
+    }
+    for entity_id, entity in entities.items():
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await entity.async_added_to_hass()
+        entity.async_write_ha_state_if_changed()  # Initial state, as written when the platform adds it
+
+    def door_event(minute: int) -> dict:
+        return {"CaptureTime": (now + timedelta(minutes=minute)).strftime("%d-%m-%Y %H:%M:%S"),
+                "Location": "Door 1", "Initiator": "Alice", "CaptureType": "Unlock",
+                "PicUrl": "https://mock.akuvox.com/pic.jpg", "MAC": "0C11052B0000", "Relay": "1"}
+
+    latest_event = None
+    for minute in range(1, 61):
+        freezer.tick(timedelta(minutes=1))
+        async_fire_time_changed(hass, dt_util.utcnow())
+        coordinator.async_update_listeners()  # Refresh with unchanged key data
+        async_dispatcher_send(hass, SIGNAL_TOKEN_UPDATED)  # Repeated signal, same token
+        if minute == 40:
+            client._data.token = "mock-token-refreshed-0001"
+        if minute in (15, 45):
+            latest_event = door_event(minute)
+        if latest_event is not None:
+            # The same latest entry delivered again
+            hass.bus.async_fire("akuvox_door_update", latest_event)
+        await hass.async_block_till_done()
+
+    assert writes == {
+        "sensor.guest_1": 2,  # Initial, and expired at the end time
+        "sensor.akuvox_token": 2,  # Initial, and the token refresh
+        "sensor.akuvox_last_door_event": 3,  # Initial, and the two new door events
+    }
+    assert hass.states.get("sensor.guest_1").attributes["expired"] is True
+    coordinator.key_scheduler.async_stop()
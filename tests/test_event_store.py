@@ -0,0 +1,93 @@
+"""Tests for the local door event history."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from custom_components.akuvox.event_store import AkuvoxEventStore
+
+DATE_FORMAT = "%d-%m-%Y %H:%M:%S"
+
+
+def door_log(capture_time: datetime, mac: str = "0C11052B0000", relay: str = "1",
+             initiator: str = "Mock User", capture_type: str = "Call") -> dict:
+    """Door log entry in the cloud format."""
+    return {
+        "CaptureTime": capture_time.strftime(DATE_FORMAT),
+        "Location": "Door 1",
+        "Initiator": initiator,
+        "CaptureType": capture_type,
+        "PicUrl": "https://mock.akuvox.com/pic.jpg",
+        "MAC": mac,
+        "Relay": relay,
+    }
+
+
+@pytest.fixture
+async def event_store(hass, tmp_path):
+    """Yield an open event store in a temporary directory."""
+    store = AkuvoxEventStore(hass, str(tmp_path / "events.db"), max_events=5, max_age_days=30)
+    await store.async_setup()
+    yield store
+    await store.async_close()
+
+
+async def test_duplicates_are_ignored(event_store):
+    """The same door event is stored once."""
+    now = datetime.now().replace(microsecond=0)
+    assert await event_store.async_add_event(door_log(now)) is True
+    assert await event_store.async_add_event(door_log(now)) is False
+    assert await event_store.async_add_events([door_log(now), door_log(now, relay="2")]) == 1
+    assert await event_store.async_count() == 2
+
+
+async def test_query_filters_newest_first(event_store):
+    """Queries filter by time and fields and return the newest events first."""
+    now = datetime.now().replace(microsecond=0)
+    await event_store.async_add_events([
+        door_log(now - timedelta(hours=3), initiator="Alice"),
+        door_log(now - timedelta(hours=2), initiator="Bob", capture_type="Face"),
+        door_log(now - timedelta(hours=1), initiator="Alice", mac="0C11052B0001"),
+    ])
+
+    events = await event_store.async_query()
+    assert [event["Initiator"] for event in events] == ["Alice", "Bob", "Alice"]
+    assert events[0]["MAC"] == "0C11052B0001"
+
+    events = await event_store.async_query(initiator="Alice", limit=1)
+    assert [event["MAC"] for event in events] == ["0C11052B0001"]
+    events = await event_store.async_query(start=now - timedelta(hours=2, minutes=30),
+                                           end=now - timedelta(minutes=90))
+    assert [event["Initiator"] for event in events] == ["Bob"]
+    assert await event_store.async_query(capture_type="Face", mac="0C11052B0001") == []
+
+
+async def test_prune_keeps_newest_capture_times(event_store):
+    """Size retention keeps the newest events by capture time, not by insertion order."""
+    now = datetime.now().replace(microsecond=0)
+    live = [door_log(now - timedelta(minutes=minutes)) for minutes in range(4)]
+    backfilled = [door_log(now - timedelta(days=2, minutes=minutes)) for minutes in range(4)]
+    await event_store.async_add_events(live)
+    await event_store.async_add_events(backfilled)
+
+    event_store._prune()
+    assert await event_store.async_count() == 5
+    kept = [event["CaptureTime"] for event in await event_store.async_query()]
+    assert kept == [event["CaptureTime"] for event in live + backfilled[:1]]
+
+
+async def test_prune_drops_events_past_max_age(event_store):
+    """Age retention drops events older than max_age_days."""
+    now = datetime.now().replace(microsecond=0)
+    await event_store.async_add_events([door_log(now), door_log(now - timedelta(days=31))])
+    event_store._prune()
+    assert [event["CaptureTime"] for event in await event_store.async_query()] == [
+        now.strftime(DATE_FORMAT)]
+
+
+async def test_iter_payloads_oldest_first(hass, event_store):
+    """The export cursor yields matching events oldest first."""
+    now = datetime.now().replace(microsecond=0)
+    await event_store.async_add_events([door_log(now - timedelta(minutes=minutes)) for minutes in range(3)])
+    events = await hass.async_add_executor_job(lambda: list(event_store.iter_payloads(relay="1")))
+    assert [event["CaptureTime"] for event in events] == [
+        (now - timedelta(minutes=minutes)).strftime(DATE_FORMAT) for minutes in (2, 1, 0)]
@@ -0,0 +1,53 @@
+"""Tests for the door event history export."""
+import csv
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from custom_components.akuvox.const import EXPORT_CSV_COLUMNS
+from custom_components.akuvox.event_store import AkuvoxEventStore
+from custom_components.akuvox.export import DoorEventExport, csv_lines
+
+from .test_event_store import door_log
+
+
+@pytest.fixture
+async def event_store(hass, tmp_path):
+    """Yield an event store with three events of two devices."""
+    hass.config.config_dir = str(tmp_path)
+    store = AkuvoxEventStore(hass, str(tmp_path / "events.db"))
+    await store.async_setup()
+    now = datetime.now().replace(microsecond=0)
+    await store.async_add_events([door_log(now - timedelta(minutes=2)),
+                                  door_log(now - timedelta(minutes=1), mac="0C11052B0001"),
+                                  door_log(now, initiator="Alice, Bob")])
+    yield store
+    await store.async_close()
+
+
+def test_empty_csv_has_the_header():
+    """An export with no matching event is the header line alone."""
+    assert list(csv_lines([])) == [",".join(EXPORT_CSV_COLUMNS) + "\r\n"]
+
+
+async def test_csv_export(hass, event_store):
+    """Matching events are written oldest first, one row each, and quoted where needed."""
+    export = DoorEventExport(hass, event_store, "csv", {"mac": "0C11052B0000"})
+    result = await export.async_run("history")
+
+    assert result["file"] == hass.config.path("akuvox_exports", "history.csv")
+    assert result["rows"] == 2
+    with open(result["file"], encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["Initiator"] for row in rows] == ["Mock User", "Alice, Bob"]
+    assert list(rows[0]) == list(EXPORT_CSV_COLUMNS)
+
+
+async def test_jsonl_export(hass, event_store):
+    """Each event is one JSON object per line."""
+    result = await DoorEventExport(hass, event_store, "jsonl", {}).async_run()
+
+    with open(result["file"], encoding="utf-8") as file:
+        events = [json.loads(line) for line in file]
+    assert [event["MAC"] for event in events] == ["0C11052B0000", "0C11052B0001", "0C11052B0000"]
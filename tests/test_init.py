@@ -0,0 +1,66 @@
+"""Tests for applying configuration changes to a running entry."""
+import pytest
+
+from custom_components.akuvox import async_reload_entry, changed_config_keys, config_snapshot
+from custom_components.akuvox.const import DOMAIN
+from custom_components.akuvox.coordinator import AkuvoxDataUpdateCoordinator
+
+
+@pytest.fixture
+def reloads(hass, monkeypatch) -> list[str]:
+    """Record full reloads of config entries instead of running them."""
+    reloaded: list[str] = []
+
+    async def _reload(entry_id):
+        reloaded.append(entry_id)
+        return True
+
+    monkeypatch.setattr(hass.config_entries, "async_reload", _reload)
+    return reloaded
+
+
+@pytest.fixture
+def coordinator(hass, client, config_entry):
+    """Coordinator of a set up entry listening to its configuration changes."""
+    coordinator = AkuvoxDataUpdateCoordinator(hass, client)
+    coordinator.applied_config = config_snapshot(config_entry)
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = coordinator
+    remove_listener = config_entry.add_update_listener(async_reload_entry)
+    yield coordinator
+    remove_listener()
+    coordinator.key_scheduler.async_stop()
+
+
+def test_unset_and_empty_values_are_equal():
+    """Only values that really changed are reported, in data and options."""
+    old = {"data": {"token": "a", "subdomain": "ecloud"}, "options": {"lan_devices": ""}}
+    new = {"data": {"token": "b", "subdomain": "ecloud"}, "options": {"local_webhook": False}}
+    assert changed_config_keys(old, new) == {"token"}
+
+
+async def test_token_and_screenshot_options_apply_without_reload(hass, client, config_entry, coordinator, reloads):
+    """A new token or screenshot option updates the running client in place."""
+    hass.config_entries.async_update_entry(
+        config_entry, options={"token": "user-token-0002", "event_screenshot_options": "wait"})
+    await hass.async_block_till_done()
+
+    assert reloads == []
+    assert client._data.token == "user-token-0002"
+    assert client._data.wait_for_image_url is True
+    assert await client._data.async_get_stored_data_for_key("token") == "user-token-0002"
+
+    hass.config_entries.async_update_entry(
+        config_entry, options={"token": "user-token-0002", "event_screenshot_options": "asap"})
+    await hass.async_block_till_done()
+    assert reloads == []
+    assert client._data.wait_for_image_url is False
+
+
+async def test_other_option_changes_reload_the_entry(hass, client, config_entry, coordinator, reloads):
+    """A change to any other option, even alongside a token change, reloads the entry."""
+    hass.config_entries.async_update_entry(
+        config_entry, options={"token": "user-token-0002", "lan_devices": "0C11052B0000=192.168.1.20"})
+    await hass.async_block_till_done()
+
+    assert reloads == [config_entry.entry_id]
+    assert coordinator.applied_config == config_snapshot(config_entry)
@@ -0,0 +1,70 @@
+"""Tests for the temporary key boundary scheduler."""
+from datetime import datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.akuvox.key_scheduler import TempKeyScheduler
+
+
+async def _async_advance(hass, freezer, delta: timedelta) -> None:
+    freezer.tick(delta)
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+
+
+async def test_only_due_keys_are_notified(hass, freezer):
+    """One timer serves all keys, and each boundary notifies only its own key."""
+    scheduler = TempKeyScheduler(hass)
+    calls = []
+    now = datetime.now()
+    scheduler.async_track_key("1", now + timedelta(minutes=1), now + timedelta(hours=1),
+                              lambda: calls.append("1"))
+    scheduler.async_track_key("2", now + timedelta(minutes=10), now + timedelta(hours=2),
+                              lambda: calls.append("2"))
+    assert scheduler._next_wakeup == now + timedelta(minutes=1)
+
+    await _async_advance(hass, freezer, timedelta(minutes=2))
+    assert calls == ["1"]
+    assert scheduler._next_wakeup == now + timedelta(minutes=10)
+
+    await _async_advance(hass, freezer, timedelta(minutes=10))
+    assert calls == ["1", "2"]
+
+    await _async_advance(hass, freezer, timedelta(hours=1))
+    assert calls == ["1", "2", "1"]
+    scheduler.async_stop()
+
+
+async def test_retracking_replaces_boundaries(hass, freezer):
+    """Boundaries of a key tracked again are ignored."""
+    scheduler = TempKeyScheduler(hass)
+    calls = []
+    now = datetime.now()
+    scheduler.async_track_key("1", now + timedelta(minutes=1), now + timedelta(hours=1),
+                              lambda: calls.append("old"))
+    scheduler.async_track_key("1", now + timedelta(minutes=5), now + timedelta(hours=1),
+                              lambda: calls.append("new"))
+
+    await _async_advance(hass, freezer, timedelta(minutes=2))
+    assert calls == []
+
+    await _async_advance(hass, freezer, timedelta(minutes=5))
+    assert calls == ["new"]
+    scheduler.async_stop()
+
+
+async def test_untracked_key_cancels_timer(hass, freezer):
+    """Untracking the last key leaves no timer armed."""
+    scheduler = TempKeyScheduler(hass)
+    calls = []
+    now = datetime.now()
+    untrack = scheduler.async_track_key("1", now + timedelta(minutes=1), now + timedelta(hours=1),
+                                        lambda: calls.append("1"))
+    assert scheduler._unsub_timer is not None
+
+    untrack()
+    assert scheduler._unsub_timer is None
+
+    await _async_advance(hass, freezer, timedelta(hours=2))
+    assert calls == []
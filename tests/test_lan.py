@@ -0,0 +1,141 @@
+"""Tests for the local network transport."""
+import asyncio
+
+import pytest
+from mock_cloud import FaultProfile
+
+from custom_components.akuvox import api
+from custom_components.akuvox.lan import AkuvoxLanClient, parse_lan_devices
+
+MAC = "0C11052B0000"
+
+
+class _Response:
+    def __init__(self, status: int, delay: float, session) -> None:
+        self.status = status
+        self._delay = delay
+        self._session = session
+
+    async def __aenter__(self):
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self._session.cancelled += 1
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def json(self, content_type=None):
+        return {"retcode": 0}
+
+
+class _Session:
+    """Device web server answering every request with a status after a delay."""
+
+    def __init__(self, status: int = 500, delay: float = 0.0) -> None:
+        self.urls = []
+        self.status = status
+        self.delay = delay
+        self.cancelled = 0
+
+    def get(self, url, params=None, auth=None):
+        self.urls.append(url)
+        return _Response(self.status, self.delay, self)
+
+
+@pytest.fixture
+def hedge_delay(monkeypatch) -> float:
+    """Shorten the wait for the LAN before the cloud request is sent too."""
+    monkeypatch.setattr(api, "LAN_RELAY_HEDGE_DELAY", 0.05)
+    return 0.05
+
+
+def attach_lan(client, session: _Session) -> AkuvoxLanClient:
+    """Give the client a LAN transport to the first mock device."""
+    client._data.host = "ecloud.akuvox.com"
+    client.lan = AkuvoxLanClient(session, {MAC: "192.168.1.20"})  # type: ignore[arg-type]
+    return client.lan
+
+
+def test_parse_lan_devices_normalizes_macs():
+    """Colon and dash separated MACs map to the same device."""
+    assert parse_lan_devices("0c:11:05:2b:00:00=192.168.1.20; 0C-11-05-2B-00-01=192.168.1.21:8080") == {
+        "0C11052B0000": "192.168.1.20",
+        "0C11052B0001": "192.168.1.21:8080",
+    }
+
+
+async def test_mac_formats_share_address_and_health():
+    """A dashed MAC resolves the device address and its failures mark the same device unhealthy."""
+    session = _Session()
+    lan = AkuvoxLanClient(session, parse_lan_devices("0C:11:05:2B:00:00=192.168.1.20"))  # type: ignore[arg-type]
+    assert lan.address("0c-11-05-2b-00-00") == "192.168.1.20"
+
+    assert await lan.async_trigger_relay("0c-11-05-2b-00-00", 1) is False
+    assert session.urls == ["http://192.168.1.20/fcgi/do"]
+    assert list(lan.health) == ["0C11052B0000"]
+    assert lan.is_healthy("0C:11:05:2B:00:00") is False
+
+
+@pytest.mark.parametrize("expected_lingering_timers", [True])  # Door log confirmation timeouts
+async def test_door_opens_over_lan_within_hedge_delay(client, mock_cloud, hedge_delay):
+    """A device answering before the hedge delay opens the door without a cloud request."""
+    attach_lan(client, _Session(status=200))
+
+    result = await client.async_open_door("Door 1", MAC, 1)
+    assert (result["path"], result["success"]) == ("lan", True)
+    assert mock_cloud.requests["opendoor"] == 0
+
+
+@pytest.mark.parametrize("expected_lingering_timers", [True])  # Door log confirmation timeouts
+async def test_slow_lan_is_hedged_by_the_cloud(client, mock_cloud, hedge_delay):
+    """The cloud request sent after the hedge delay wins over a slow device, which is cancelled."""
+    session = _Session(status=200, delay=1)
+    attach_lan(client, session)
+
+    result = await client.async_open_door("Door 1", MAC, 1)
+    assert (result["path"], result["success"]) == ("cloud_fallback", True)
+    assert mock_cloud.requests["opendoor"] == 1
+    assert session.cancelled == 1
+
+
+@pytest.mark.parametrize("expected_lingering_timers", [True])  # Door log confirmation timeouts
+async def test_failed_lan_falls_back_to_the_cloud(client, mock_cloud, hedge_delay):
+    """A device error sends the cloud request and marks the device unhealthy."""
+    lan = attach_lan(client, _Session(status=500))
+
+    result = await client.async_open_door("Door 1", MAC, 1)
+    assert (result["path"], result["success"]) == ("cloud_fallback", True)
+    assert mock_cloud.requests["opendoor"] == 1
+    assert lan.is_healthy(MAC) is False
+
+
+@pytest.mark.parametrize("expected_lingering_timers", [True])  # Door log confirmation timeouts
+async def test_unhealthy_device_goes_straight_to_the_cloud(client, mock_cloud, hedge_delay):
+    """After a local failure the device is not tried again until its retry time."""
+    session = _Session(status=500)
+    lan = attach_lan(client, session)
+    await lan.async_trigger_relay(MAC, 1)
+
+    result = await client.async_open_door("Door 1", MAC, 1)
+    assert (result["path"], result["success"]) == ("cloud", True)
+    assert len(session.urls) == 1  # Only the failed trigger above
+    assert mock_cloud.requests["opendoor"] == 1
+
+
+async def test_cancelled_press_cancels_both_requests(client, mock_cloud, hedge_delay):
+    """Cancelling a press in the race does not leave the LAN or cloud request running."""
+    session = _Session(status=200, delay=1)
+    attach_lan(client, session)
+    mock_cloud.faults.endpoints["opendoor"] = FaultProfile(latency=0.2)
+
+    press = asyncio.ensure_future(client._async_race_door_open("Door 1", MAC, 1))
+    await asyncio.sleep(hedge_delay + 0.05)
+    press.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await press
+    await asyncio.sleep(0.3)
+    assert session.cancelled == 1
+    assert mock_cloud.opened == []
@@ -0,0 +1,79 @@
+"""Tests for the request metrics."""
+from mock_cloud import FaultProfile
+
+from custom_components.akuvox.metrics import (
+    ENDPOINT_DOOR_LOG,
+    ENDPOINT_TEMP_KEY,
+    AkuvoxMetrics,
+    EndpointStats,
+    endpoint_for_url,
+)
+
+
+def test_latencies_on_a_bound_fall_in_that_bucket():
+    """A latency equal to a bucket bound is counted in it; anything above 10 s is in the overflow bucket."""
+    stats = EndpointStats()
+    for latency_ms in (50, 50.1, 100, 10000, 10001):
+        stats.record(latency_ms)
+
+    histogram = stats.as_dict()["histogram_ms"]
+    assert histogram["<=50"] == 1
+    assert histogram["<=100"] == 2
+    assert histogram["<=10000"] == 1
+    assert histogram[">10000"] == 1
+    assert sum(histogram.values()) == stats.requests == 5
+
+
+def test_percentiles_are_bucket_upper_bounds():
+    """p50 and p95 report the upper bound of their bucket, and the maximum in the overflow bucket."""
+    stats = EndpointStats()
+    assert stats.as_dict()["p50_ms"] is None
+
+    for _ in range(19):
+        stats.record(40)
+    stats.record(300)
+    snapshot = stats.as_dict()
+    assert snapshot["p50_ms"] == 50.0
+    assert snapshot["p95_ms"] == 50.0  # The 19th of 20 requests is still in the first bucket
+
+    stats.record(300)
+    assert stats.as_dict()["p95_ms"] == 500.0
+
+    stats = EndpointStats()
+    for _ in range(9):
+        stats.record(40)
+    stats.record(20000.04)
+    snapshot = stats.as_dict()
+    assert snapshot["p50_ms"] == 50.0
+    assert snapshot["p95_ms"] == snapshot["max_ms"] == 20000.0
+    assert snapshot["avg_ms"] == 2036.0
+
+
+def test_errors_and_retries_are_counted_per_endpoint():
+    """Errors are counted by kind, and retries separately from requests."""
+    metrics = AkuvoxMetrics()
+    metrics.record(ENDPOINT_TEMP_KEY, 80)
+    metrics.record(ENDPOINT_TEMP_KEY, 120, "HTTP 500")
+    metrics.record(ENDPOINT_TEMP_KEY, 90, "HTTP 500")
+    metrics.record(ENDPOINT_TEMP_KEY, 10000, "TimeoutError")
+    metrics.record_retry(ENDPOINT_TEMP_KEY)
+
+    snapshot = metrics.as_dict()["endpoints"][ENDPOINT_TEMP_KEY]
+    assert snapshot["requests"] == 4
+    assert snapshot["errors"] == {"HTTP 500": 2, "TimeoutError": 1}
+    assert snapshot["error_count"] == 3
+    assert snapshot["retries"] == 1
+    assert metrics.total_requests == 4
+    assert endpoint_for_url("https://ecloud.akuvox.com/api/tempKey/addPersonalTempKey?token=x") == ENDPOINT_TEMP_KEY
+
+
+async def test_client_records_failed_requests(client, mock_cloud):
+    """A failing cloud endpoint is recorded as an HTTP error of its endpoint."""
+    mock_cloud.faults.endpoints["getDoorLog"] = FaultProfile(latency=0.0, error_rate=1.0)
+    await client.async_get_door_log_page(row=10)
+    mock_cloud.faults.endpoints.clear()
+    await client.async_get_door_log_page(row=10)
+
+    snapshot = client.metrics.as_dict()["endpoints"][ENDPOINT_DOOR_LOG]
+    assert snapshot["requests"] == 2
+    assert snapshot["errors"] == {"HTTP 500": 1}
@@ -0,0 +1,73 @@
+"""Tests for the prioritised request admission."""
+import asyncio
+from contextlib import AsyncExitStack
+
+from custom_components.akuvox.scheduler import (
+    CLASS_BACKGROUND,
+    CLASS_EVENTS,
+    CLASS_INTERACTIVE,
+    RequestScheduler,
+)
+
+
+async def _hold(scheduler: RequestScheduler, request_class: str, granted: list, release: asyncio.Event):
+    """Take a slot, note the grant and keep the slot until released."""
+    async with scheduler.slot(request_class):
+        granted.append(request_class)
+        await release.wait()
+
+
+async def test_interactive_request_is_not_queued_behind_background_work():
+    """With the shared slots full, a door press goes first and a freed slot serves events before background."""
+    scheduler = RequestScheduler(limits={CLASS_INTERACTIVE: 1, CLASS_EVENTS: 2, CLASS_BACKGROUND: 3},
+                                 shared_limit=3)
+    async with AsyncExitStack() as stack:
+        for _ in range(3):
+            await stack.enter_async_context(scheduler.slot(CLASS_BACKGROUND))
+        assert scheduler.running[CLASS_BACKGROUND] == 3
+
+        granted: list[str] = []
+        release = asyncio.Event()
+        background = asyncio.ensure_future(_hold(scheduler, CLASS_BACKGROUND, granted, release))
+        await asyncio.sleep(0)
+        interactive = asyncio.ensure_future(_hold(scheduler, CLASS_INTERACTIVE, granted, release))
+        await asyncio.sleep(0)
+        assert granted == [CLASS_INTERACTIVE]
+        assert scheduler.queued == 1
+
+        events = asyncio.ensure_future(_hold(scheduler, CLASS_EVENTS, granted, release))
+        await asyncio.sleep(0)
+        assert scheduler.queued == 2
+
+        await stack.aclose()  # Frees all three shared slots, handed out by priority
+        await asyncio.sleep(0)
+        assert granted == [CLASS_INTERACTIVE, CLASS_EVENTS, CLASS_BACKGROUND]
+
+        release.set()
+        await asyncio.gather(background, interactive, events)
+    assert scheduler.running == dict.fromkeys(scheduler.running, 0)
+
+
+async def test_freed_shared_slot_goes_to_the_highest_waiting_class():
+    """A single freed shared slot is taken by the events request, queued after the background one."""
+    scheduler = RequestScheduler(limits={CLASS_INTERACTIVE: 1, CLASS_EVENTS: 2, CLASS_BACKGROUND: 3},
+                                 shared_limit=1)
+    granted: list[str] = []
+    release = asyncio.Event()
+    first_release = asyncio.Event()
+    first = asyncio.ensure_future(_hold(scheduler, CLASS_BACKGROUND, granted, first_release))
+    await asyncio.sleep(0)
+    background = asyncio.ensure_future(_hold(scheduler, CLASS_BACKGROUND, granted, release))
+    await asyncio.sleep(0)
+    events = asyncio.ensure_future(_hold(scheduler, CLASS_EVENTS, granted, release))
+    await asyncio.sleep(0)
+    assert granted == [CLASS_BACKGROUND]
+
+    first_release.set()
+    await first
+    await asyncio.sleep(0)
+    assert granted == [CLASS_BACKGROUND, CLASS_EVENTS]
+
+    release.set()
+    await asyncio.gather(background, events)
+    assert granted == [CLASS_BACKGROUND, CLASS_EVENTS, CLASS_BACKGROUND]
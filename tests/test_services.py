@@ -0,0 +1,28 @@
+"""Tests for the akuvox services."""
+from datetime import datetime
+from types import SimpleNamespace
+
+from custom_components.akuvox import async_setup_services
+from custom_components.akuvox.const import DOMAIN
+from custom_components.akuvox.event_store import AkuvoxEventStore
+
+from .test_event_store import door_log
+
+
+async def test_query_door_events(hass, client, tmp_path):
+    """The query service answers from the targeted entry's local history."""
+    client.event_store = AkuvoxEventStore(hass, str(tmp_path / "events.db"))
+    await client.event_store.async_setup()
+    await client.event_store.async_add_event(door_log(datetime.now().replace(microsecond=0)))
+    hass.data.setdefault(DOMAIN, {})["entry"] = SimpleNamespace(client=client)
+    await async_setup_services(hass)
+
+    response = await hass.services.async_call(DOMAIN, "query_door_events", {"entry_id": "entry", "days": 1},
+                                              blocking=True, return_response=True)
+    assert response["count"] == 1
+    assert response["events"][0]["MAC"] == "0C11052B0000"
+
+    response = await hass.services.async_call(DOMAIN, "query_door_events", {"entry_id": "unknown"},
+                                              blocking=True, return_response=True)
+    assert response == {"events": [], "count": 0}
+    await client.event_store.async_close()
@@ -0,0 +1,66 @@
+"""Tests for the background task supervisor."""
+import asyncio
+import time
+
+from custom_components.akuvox import supervisor
+from custom_components.akuvox.supervisor import TaskSupervisor
+
+
+async def test_crashed_loop_restarts_with_backoff(hass, monkeypatch):
+    """A crashing loop is restarted after a doubling, capped delay; its error keeps no message."""
+    monkeypatch.setattr(supervisor, "SUPERVISOR_BACKOFF_MIN", 0.02)
+    monkeypatch.setattr(supervisor, "SUPERVISOR_BACKOFF_MAX", 0.08)
+    starts: list[float] = []
+    running = asyncio.Event()
+
+    async def _loop():
+        starts.append(time.monotonic())
+        if len(starts) <= 4:
+            raise RuntimeError("GET https://ecloud.akuvox.com/api?token=secret-token failed")
+        running.set()
+        await asyncio.Event().wait()
+
+    tasks = TaskSupervisor(hass)
+    tasks.async_start("poll", _loop)
+    await asyncio.wait_for(running.wait(), 2)
+
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert gaps[0] >= 0.02
+    assert gaps[1] >= 0.04
+    assert 0.08 <= gaps[2] < 0.16
+    assert 0.08 <= gaps[3] < 0.16  # Capped at the maximum
+    snapshot = tasks.as_dict()["poll"]
+    assert snapshot["alive"] is True
+    assert snapshot["restarts"] == 4
+    assert snapshot["last_error"] == "RuntimeError"
+
+    await tasks.async_shutdown()
+
+
+async def test_shutdown_cancels_every_loop(hass):
+    """Shutdown cancels and awaits all loops, and no loop starts afterwards."""
+    cancelled: list[str] = []
+
+    def _factory(name):
+        async def _loop():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+        return _loop
+
+    tasks = TaskSupervisor(hass)
+    tasks.async_start("poll", _factory("poll"))
+    tasks.async_start("refresh", _factory("refresh"))
+    tasks.async_start("poll", _factory("duplicate"))  # Already running: not started twice
+    running = [supervised.task for supervised in tasks.tasks.values()]
+    await asyncio.sleep(0)
+
+    await tasks.async_shutdown()
+    assert sorted(cancelled) == ["poll", "refresh"]
+    assert all(task.done() for task in running)
+    assert tasks.tasks == {}
+
+    tasks.async_start("poll", _factory("late"))
+    assert tasks.tasks == {}
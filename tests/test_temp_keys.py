@@ -0,0 +1,54 @@
+"""Tests for the batched temporary key requests against the mock cloud."""
+from datetime import datetime, timedelta
+
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from mock_cloud import FaultProfile
+
+from custom_components.akuvox.const import SIGNAL_TEMP_KEYS_ADDED, SIGNAL_TEMP_KEYS_REMOVED
+
+
+async def test_create_and_revoke_temp_keys(hass, client, mock_cloud):
+    """Keys are created and revoked in the cloud, the data model and through the signals."""
+    added, removed = [], []
+    async_dispatcher_connect(hass, SIGNAL_TEMP_KEYS_ADDED, added.extend)
+    async_dispatcher_connect(hass, SIGNAL_TEMP_KEYS_REMOVED, removed.extend)
+    client._data.parse_userconf_data(await client.async_user_conf())
+
+    begin = datetime.now().replace(microsecond=0)
+    outcome = await client.async_create_temp_keys([
+        {"description": "Guest", "begin_time": begin, "end_time": begin + timedelta(days=1)},
+        {"description": "Cleaner", "begin_time": "2030-01-01 08:00:00",
+         "end_time": "2030-01-01 12:00:00", "allowed_times": 2},
+    ])
+    assert [result["success"] for result in outcome] == [True, True]
+    assert [key["Description"] for key in mock_cloud.temp_keys] == ["Guest", "Cleaner"]
+    assert mock_cloud.temp_keys[0]["Doors"][0]["MAC"] == mock_cloud.devices[0]["mac"]
+    assert mock_cloud.temp_keys[1]["AllowedTimes"] == 2
+
+    key_ids = [result["key"]["key_id"] for result in outcome]
+    assert all(client._data.temp_key(key_id) is not None for key_id in key_ids)
+    await hass.async_block_till_done()
+    assert [key["key_id"] for key in added] == key_ids
+
+    outcome = await client.async_revoke_temp_keys([key_ids[0], "999999"])
+    assert [result["success"] for result in outcome] == [True, False]
+    assert [key["Description"] for key in mock_cloud.temp_keys] == ["Cleaner"]
+    assert client._data.temp_key(key_ids[0]) is None
+    assert client._data.temp_key(key_ids[1]) is not None
+    await hass.async_block_till_done()
+    assert [str(key_id) for key_id in removed] == [str(key_ids[0])]
+    assert "interactive" not in client.metrics.queue_wait  # Batches never take door press slots
+
+    assert await client.async_retrieve_temp_keys_data() is True
+    assert [str(key.key_id) for key in client._data.door_keys_data] == [str(key_ids[1])]
+
+
+async def test_failed_creation_is_reported(hass, client, mock_cloud):
+    """A rejected create request is reported per key and adds nothing."""
+    mock_cloud.faults.endpoints["tempKey_add"] = FaultProfile(latency=0.0, error_rate=1.0)
+    outcome = await client.async_create_temp_keys([
+        {"description": "Guest", "begin_time": "2030-01-01 08:00:00", "end_time": "2030-01-02 08:00:00"},
+    ])
+    assert outcome[0]["success"] is False
+    assert outcome[0]["description"] == "Guest"
+    assert client._data.door_keys_data == []
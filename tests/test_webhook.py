@@ -0,0 +1,88 @@
+"""Tests for the local Action URL receiver."""
+from datetime import datetime
+from http import HTTPStatus
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.setup import async_setup_component
+from mock_cloud import FaultProfile, MockAkuvoxCloud
+
+from custom_components.akuvox.const import DOMAIN
+from custom_components.akuvox.event_store import AkuvoxEventStore
+from custom_components.akuvox.webhook import AkuvoxWebhookReceiver
+
+
+@pytest.fixture
+def mock_cloud() -> MockAkuvoxCloud:
+    """Mock cloud with one device and two relays."""
+    return MockAkuvoxCloud(faults=FaultProfile(latency=0.0), relays_per_device=2)
+
+
+@pytest.fixture
+async def receiver(hass, client, tmp_path):
+    """Yield a webhook receiver with secrets for the mock devices and a local history."""
+    client._data.parse_userconf_data(await client.async_user_conf())
+    client.event_store = AkuvoxEventStore(hass, str(tmp_path / "events.db"))
+    await client.event_store.async_setup()
+    client.webhook = AkuvoxWebhookReceiver(hass, client)
+    await client.webhook.async_ensure_secrets()
+    yield client.webhook
+    await client.event_store.async_close()
+
+
+async def test_one_url_per_relay(receiver, mock_cloud):
+    """Each relay of a device gets its own Action URL."""
+    mac = mock_cloud.devices[0]["mac"]
+    secret = receiver.secrets[mac]
+    urls = receiver.urls()
+    assert list(urls) == ["Door 1"]
+    assert list(urls["Door 1"]) == ["Relay 1", "Relay 2"]
+    for relay in ("1", "2"):
+        url = urls["Door 1"][f"Relay {relay}"]
+        assert f"/api/akuvox/action/{mac}?secret={secret}&" in url
+        assert f"&relay={relay}&" in url
+
+
+async def test_cloud_copy_replaces_pushed_event(hass, client, receiver, mock_cloud):
+    """The cloud copy of a pushed event is not fired again and replaces it in the history."""
+    fired = []
+    hass.bus.async_listen("akuvox_door_update", lambda event: fired.append(event.data))
+    mac = mock_cloud.devices[0]["mac"]
+
+    await receiver.async_handle_action(mac, {"event": "relay", "relay": "2", "user": "Alice"})
+    await hass.async_block_till_done()
+    assert len(fired) == 1
+    pushed = fired[0]
+    # Same CaptureTime format as the cloud door log
+    assert datetime.strptime(pushed["CaptureTime"], "%d-%m-%Y %H:%M:%S") <= datetime.now()
+    assert [event["CaptureTime"] for event in await client.event_store.async_query()] == [pushed["CaptureTime"]]
+
+    cloud_copy = mock_cloud.add_door_event(relay="2", initiator="Alice", capture_type="Unlock",
+                                           capture_time=datetime.now().replace(microsecond=0))
+    assert receiver.consume_match(cloud_copy) == pushed
+    await client.async_replace_pushed_door_log(pushed, cloud_copy)
+    stored = await client.event_store.async_query()
+    assert len(stored) == 1
+    assert stored[0]["PicUrl"] == cloud_copy["PicUrl"]
+
+    # A cloud event no device pushed is not matched
+    assert receiver.consume_match(mock_cloud.add_door_event(relay="1")) is None
+    assert receiver.active is False
+
+
+async def test_malformed_json_is_rejected(hass, hass_client, client, receiver, mock_cloud):
+    """A JSON body that does not parse is answered with 400, and a valid one is handled."""
+    assert await async_setup_component(hass, "http", {})
+    await receiver.async_setup()
+    hass.data.setdefault(DOMAIN, {})["entry"] = SimpleNamespace(client=client)
+    http = await hass_client()
+    mac = mock_cloud.devices[0]["mac"]
+    url = f"/api/akuvox/action/{mac}?secret={receiver.secrets[mac]}"
+
+    response = await http.post(url, data="{not json", headers={"Content-Type": "application/json"})
+    assert response.status == HTTPStatus.BAD_REQUEST
+    assert receiver.received == 0
+
+    response = await http.post(url, json={"event": "relay", "relay": "1"})
+    assert response.status == HTTPStatus.OK
+    assert receiver.received == 1